@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import itertools
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from testing.generators import (
+    CATEGORY_MERCHANTS,
+    DateRange,
+    generate_amount_with_variance,
+    generate_plaid_transaction_id,
+    generate_transaction_dates,
+    months_ago,
+)
+
+from models.transaction import PlaidTransactionData
+from services.plaid import PlaidRecurringResponse, PlaidRecurringStream, PlaidService
+
+PLAID_PAGE_SIZE = 500
+
+_INFLOW_CATEGORIES = frozenset({"INCOME", "TRANSFER_IN"})
+
+# Every Nth recurring stream gets a new last amount on each fetch after the
+# first; the rest come back identical so repeat syncs hit the unchanged path.
+RECURRING_CHURN_EVERY = 4
+
+_FREQUENCY_DAYS = (("WEEKLY", 10), ("BIWEEKLY", 21), ("MONTHLY", 45), ("ANNUALLY", 400))
+
+
+def generate_transactions(
+    account_ids: list[str],
+    count: int,
+    seed: int,
+    months: int = 12,
+) -> list[PlaidTransactionData]:
+    rng = random.Random(seed)
+    today = date.today()
+    dates = generate_transaction_dates(
+        DateRange(months_ago(months, today), today),
+        count,
+        distribution="clustered",
+        seed=seed,
+    )
+    merchants = [merchant for group in CATEGORY_MERCHANTS.values() for merchant in group]
+
+    transactions: list[PlaidTransactionData] = []
+    for i, txn_date in enumerate(dates):
+        merchant = rng.choice(merchants)
+        target = Decimal(str(rng.uniform(merchant.typical_amount_min, merchant.typical_amount_max)))
+        amount = generate_amount_with_variance(target, seed=seed + i)
+        if merchant.category_primary in _INFLOW_CATEGORIES:
+            amount = -amount
+
+        transactions.append(
+            PlaidTransactionData(
+                transaction_id=generate_plaid_transaction_id(seed * 1_000_003 + i),
+                account_id=account_ids[i % len(account_ids)],
+                amount=amount,
+                date=txn_date,
+                name=merchant.name.upper(),
+                merchant_name=merchant.name,
+                payment_channel="online" if merchant.is_subscription else "in store",
+                personal_finance_category={
+                    "primary": merchant.category_primary,
+                    "detailed": merchant.category_detailed,
+                    "confidence_level": "HIGH",
+                },
+                logo_url=merchant.logo_url,
+                website=merchant.website,
+            )
+        )
+
+    return transactions
+
+
+def generate_recurring_streams(
+    transactions: list[PlaidTransactionData],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    groups: dict[tuple[str, str], list[PlaidTransactionData]] = defaultdict(list)
+    for transaction in transactions:
+        primary = (transaction.personal_finance_category or {}).get("primary")
+        if transaction.payment_channel == "online" or primary in _INFLOW_CATEGORIES:
+            groups[(transaction.account_id, transaction.merchant_name or transaction.name)].append(
+                transaction
+            )
+
+    inflow: list[dict[str, Any]] = []
+    outflow: list[dict[str, Any]] = []
+    for (account_id, merchant_name), group in sorted(groups.items()):
+        if len(group) < 2:
+            continue
+
+        group.sort(key=lambda transaction: transaction.date)
+        gaps = [(b.date - a.date).days for a, b in itertools.pairwise(group)]
+        interval = max(1, round(statistics.median(gaps)))
+        frequency = next((name for name, days in _FREQUENCY_DAYS if interval <= days), "UNKNOWN")
+        amounts = [abs(transaction.amount) for transaction in group]
+        category = group[0].personal_finance_category or {}
+
+        stream = {
+            "stream_id": f"stream-{group[0].transaction_id[:24]}",
+            "account_id": account_id,
+            "description": group[0].name,
+            "merchant_name": merchant_name,
+            "first_date": group[0].date.isoformat(),
+            "last_date": group[-1].date.isoformat(),
+            "predicted_next_date": (group[-1].date + timedelta(days=interval)).isoformat(),
+            "frequency": frequency,
+            "average_amount": {
+                "amount": float(round(sum(amounts, Decimal(0)) / len(amounts), 2)),
+                "iso_currency_code": "USD",
+            },
+            "last_amount": {"amount": float(amounts[-1]), "iso_currency_code": "USD"},
+            "is_active": True,
+            "status": "MATURE" if len(group) >= 3 else "EARLY_DETECTION",
+            "is_user_modified": False,
+            "transaction_ids": [transaction.transaction_id for transaction in group],
+            "personal_finance_category": {
+                "primary": category.get("primary"),
+                "detailed": category.get("detailed"),
+            },
+        }
+        (inflow if group[0].amount < 0 else outflow).append(stream)
+
+    return inflow, outflow
+
+
+def _churn(streams: list[dict[str, Any]], fetch: int) -> list[PlaidRecurringStream]:
+    churned: list[PlaidRecurringStream] = []
+    for i, stream in enumerate(streams):
+        data = stream
+        if fetch > 0 and i % RECURRING_CHURN_EVERY == fetch % RECURRING_CHURN_EVERY:
+            last = stream["last_amount"]
+            data = {
+                **stream,
+                "last_amount": {**last, "amount": round(last["amount"] * (1 + fetch / 100), 2)},
+            }
+        churned.append(PlaidRecurringStream(data))
+    return churned
+
+
+# Serves pre-generated /transactions/sync pages without touching the Plaid API.
+class FakePlaidService(PlaidService):
+    def __init__(
+        self,
+        transactions: list[PlaidTransactionData],
+        page_size: int = PLAID_PAGE_SIZE,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        self._page_size = page_size
+        self._latency_seconds = latency_seconds
+        self._pages: list[list[PlaidTransactionData]] = []
+        self._inflow_streams: list[dict[str, Any]] = []
+        self._outflow_streams: list[dict[str, Any]] = []
+        self._recurring_fetches = 0
+        self.calls = 0
+        self.load(transactions)
+
+    def load(self, transactions: list[PlaidTransactionData]) -> None:
+        self._pages = [
+            transactions[start : start + self._page_size]
+            for start in range(0, len(transactions), self._page_size)
+        ] or [[]]
+        self._inflow_streams, self._outflow_streams = generate_recurring_streams(transactions)
+        self._recurring_fetches = 0
+        self.calls = 0
+
+    def sync_transactions(
+        self,
+        access_token: str,  # noqa: ARG002
+        cursor: str | None = None,
+    ) -> tuple[list[PlaidTransactionData], list[PlaidTransactionData], list[str], str, bool]:
+        self.calls += 1
+        if self._latency_seconds:
+            time.sleep(self._latency_seconds)
+        page = int(cursor) if cursor else 0
+        if page >= len(self._pages):
+            return [], [], [], str(page), False
+
+        has_more = page + 1 < len(self._pages)
+        return self._pages[page], [], [], str(page + 1), has_more
+
+    def get_recurring_transactions(
+        self,
+        access_token: str,  # noqa: ARG002
+        account_ids: list[str] | None = None,  # noqa: ARG002
+    ) -> PlaidRecurringResponse:
+        fetch = self._recurring_fetches
+        self._recurring_fetches += 1
+        return PlaidRecurringResponse(
+            inflow_streams=_churn(self._inflow_streams, fetch),
+            outflow_streams=_churn(self._outflow_streams, fetch),
+            updated_datetime=None,
+        )
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import operator
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from config import Settings
+from services.database import DatabaseService
+
+Row = dict[str, Any]
+
+
+@dataclass
+class QueryResult:
+    data: list[Row]
+    count: int | None = None
+
+
+def _comparable(stored: Any, value: Any) -> tuple[Any, Any]:
+    if isinstance(stored, bool) or isinstance(value, bool):
+        return stored, value
+    if isinstance(stored, int | float) or isinstance(value, int | float):
+        try:
+            return float(stored), float(value)
+        except (TypeError, ValueError):
+            pass
+    return str(stored), str(value)
+
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _compare(op: str) -> Callable[[Any, Any], bool]:
+    def check(stored: Any, value: Any) -> bool:
+        if op == "is":
+            return stored is None if value == "null" else bool(stored == value)
+        if stored is None:
+            return False
+        if op == "in":
+            return str(stored) in {str(v) for v in value}
+        return bool(_OPERATORS[op](*_comparable(stored, value)))
+
+    return check
+
+
+def _sort_key(column: str) -> Callable[[Row], tuple[bool, Any]]:
+    def key(row: Row) -> tuple[bool, Any]:
+        value = row.get(column)
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return False, value
+        return value is None, "" if value is None else str(value)
+
+    return key
+
+
+@dataclass
+class _Filter:
+    column: str
+    check: Callable[[Any, Any], bool]
+    value: Any
+    negate: bool = False
+
+
+class InMemoryTable:
+    def __init__(self, database: InMemoryDatabase, name: str) -> None:
+        self._database = database
+        self.name = name
+        self.rows: dict[str, Row] = {}
+        self._unique_indexes: dict[tuple[str, ...], dict[tuple[str, ...], str]] = {}
+
+    def _unique_index(self, columns: tuple[str, ...]) -> dict[tuple[str, ...], str]:
+        index = self._unique_indexes.get(columns)
+        if index is None:
+            index = {
+                tuple(str(row.get(c)) for c in columns): row_id for row_id, row in self.rows.items()
+            }
+            self._unique_indexes[columns] = index
+        return index
+
+    def _drop_indexes(self) -> None:
+        self._unique_indexes.clear()
+
+    def write(self, records: list[Row], on_conflict: str | None) -> list[Row]:
+        columns = tuple(on_conflict.split(",")) if on_conflict else ("id",)
+        index = self._unique_index(columns)
+        now = datetime.now(UTC).isoformat()
+        written: list[Row] = []
+
+        for record in records:
+            key = tuple(str(record.get(c)) for c in columns)
+            existing_id = index.get(key)
+            if existing_id is not None:
+                row = self.rows[existing_id]
+                row.update(record)
+                row["updated_at"] = now
+            else:
+                row = {"created_at": now, "updated_at": now, **record}
+                row.setdefault("id", str(uuid.uuid4()))
+                self.rows[row["id"]] = row
+                for indexed_columns, other in self._unique_indexes.items():
+                    other[tuple(str(row.get(c)) for c in indexed_columns)] = row["id"]
+            written.append(dict(row))
+
+        return written
+
+    def update(self, rows: list[Row], values: Row) -> list[Row]:
+        self._drop_indexes()
+        for row in rows:
+            row.update(values)
+        return [dict(row) for row in rows]
+
+    def delete(self, rows: list[Row]) -> list[Row]:
+        self._drop_indexes()
+        for row in rows:
+            self.rows.pop(row["id"], None)
+        return [dict(row) for row in rows]
+
+    def query(self) -> InMemoryQuery:
+        return InMemoryQuery(self)
+
+    def related(self, relation: str, row: Row) -> Row | None:
+        # Embedded filters such as accounts.plaid_items.user_id follow the
+        # conventional <singular>_id foreign key of each relation.
+        foreign_key = row.get(f"{relation.removesuffix('s')}_id")
+        if foreign_key is None:
+            return None
+        return self._database.table(relation).rows.get(str(foreign_key))
+
+
+class InMemoryQuery:
+    def __init__(self, table: InMemoryTable) -> None:
+        self._table = table
+        self._action = "select"
+        self._payload: Any = None
+        self._on_conflict: str | None = None
+        self._filters: list[_Filter] = []
+        self._orders: list[tuple[str, bool]] = []
+        self._offset = 0
+        self._limit: int | None = None
+        self._count = False
+        self._head = False
+        self._negate_next = False
+        self._minimal = False
+
+    def select(self, _columns: str = "*", count: str | None = None, head: bool = False) -> Any:
+        self._count = count is not None
+        self._head = head
+        return self
+
+    def insert(self, payload: Row | list[Row]) -> Any:
+        self._action = "insert"
+        self._payload = payload
+        return self
+
+    def upsert(
+        self,
+        payload: Row | list[Row],
+        on_conflict: str | None = None,
+        returning: str = "representation",
+    ) -> Any:
+        self._action = "upsert"
+        self._payload = payload
+        self._on_conflict = on_conflict
+        self._minimal = returning == "minimal"
+        return self
+
+    def update(self, payload: Row) -> Any:
+        self._action = "update"
+        self._payload = payload
+        return self
+
+    def delete(self) -> Any:
+        self._action = "delete"
+        return self
+
+    @property
+    def not_(self) -> Any:
+        self._negate_next = True
+        return self
+
+    def _filter(self, column: str, op: str, value: Any) -> Any:
+        self._filters.append(_Filter(column, _compare(op), value, self._negate_next))
+        self._negate_next = False
+        return self
+
+    def eq(self, column: str, value: Any) -> Any:
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> Any:
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> Any:
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> Any:
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> Any:
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> Any:
+        return self._filter(column, "lte", value)
+
+    def in_(self, column: str, values: list[Any]) -> Any:
+        return self._filter(column, "in", values)
+
+    def is_(self, column: str, value: Any) -> Any:
+        return self._filter(column, "is", value)
+
+    def order(self, column: str, desc: bool = False) -> Any:
+        self._orders.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> Any:
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def limit(self, count: int) -> Any:
+        self._limit = count
+        return self
+
+    def _resolve(self, row: Row, column: str) -> Any:
+        *relations, field_name = column.split(".")
+        current: Row | None = row
+        table = self._table
+        for relation in relations:
+            if current is None:
+                return None
+            current = table.related(relation, current)
+            table = table._database.table(relation)
+        return current.get(field_name) if current is not None else None
+
+    def _matches(self, row: Row) -> bool:
+        for f in self._filters:
+            matched = f.check(self._resolve(row, f.column), f.value)
+            if matched == f.negate:
+                return False
+        return True
+
+    def _selected(self) -> list[Row]:
+        rows = [row for row in self._table.rows.values() if self._matches(row)]
+        for column, desc in reversed(self._orders):
+            rows.sort(key=_sort_key(column), reverse=desc)
+        return rows
+
+    def execute(self) -> QueryResult:
+        if self._action in ("insert", "upsert"):
+            records = self._payload if isinstance(self._payload, list) else [self._payload]
+            written = self._table.write(records, self._on_conflict)
+            return QueryResult(data=[] if self._minimal else written)
+
+        rows = self._selected()
+
+        if self._action == "update":
+            return QueryResult(data=self._table.update(rows, self._payload))
+        if self._action == "delete":
+            return QueryResult(data=self._table.delete(rows))
+
+        total = len(rows) if self._count else None
+        if self._head:
+            return QueryResult(data=[], count=total)
+
+        end = None if self._limit is None else self._offset + self._limit
+        return QueryResult(data=[dict(row) for row in rows[self._offset : end]], count=total)
+
+
+@dataclass
+class InMemoryDatabase:
+    tables: dict[str, InMemoryTable] = field(default_factory=dict)
+
+    def table(self, name: str) -> InMemoryTable:
+        if name not in self.tables:
+            self.tables[name] = InMemoryTable(self, name)
+        return self.tables[name]
+
+
+class _InMemoryClient:
+    def __init__(self, database: InMemoryDatabase) -> None:
+        self._database = database
+
+    def table(self, name: str) -> InMemoryQuery:
+        return self._database.table(name).query()
+
+
+# Stands in for Supabase with the subset of PostgREST the repositories use.
+class InMemoryDatabaseService(DatabaseService):
+    def __init__(self, settings: Settings, database: InMemoryDatabase | None = None) -> None:
+        super().__init__(settings)
+        self.database = database or InMemoryDatabase()
+        self._memory_client = _InMemoryClient(self.database)
+
+    @property
+    def service_client(self) -> Any:
+        return self._memory_client
+
+    def table(self, name: str) -> Any:
+        return self._memory_client.table(name)
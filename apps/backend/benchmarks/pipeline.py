@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+from benchmarks.fake_plaid import FakePlaidService, generate_transactions
+from benchmarks.memory_database import InMemoryDatabaseService
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+ACCOUNTS_PER_USER = 3
+
+STAGE_SYNC = "sync"
+STAGE_RECURRING = "recurring"
+STAGE_RECURRING_RESYNC = "recurring_resync"
+
+# Values the settings model requires; the in-memory database and fake Plaid
+# service mean none of them are used to reach a real backend.
+_BENCHMARK_ENV = {
+    "PLAID_CLIENT_ID": "benchmark",
+    "PLAID_SECRET": "benchmark",
+    "SUPABASE_URL": "http://localhost",
+    "SUPABASE_ANON_KEY": "benchmark",
+    "SUPABASE_SERVICE_ROLE_KEY": "benchmark",
+    "ENCRYPTION_KEY": "benchmark-encryption-key",
+    "CACHE_ENABLED": "false",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+@dataclass
+class SizeReport:
+    transactions: int
+    users: int
+    jobs_per_second: float
+    total_seconds: float
+    peak_rss_mb: float
+    plaid_pages: int
+    stage_seconds: dict[str, list[float]] = field(default_factory=dict)
+
+    def summary(self) -> dict[str, Any]:
+        report = asdict(self)
+        report["stage_seconds"] = {
+            stage: {
+                "mean": round(statistics.fmean(samples), 4),
+                "max": round(max(samples), 4),
+            }
+            for stage, samples in self.stage_seconds.items()
+        }
+        return report
+
+
+def _timed(
+    stage_seconds: dict[str, list[float]],
+    stage: str,
+    call: Callable[..., Any],
+    *args: Any,
+) -> Any:
+    started = time.perf_counter()
+    result = call(*args)
+    stage_seconds.setdefault(stage, []).append(time.perf_counter() - started)
+    return result
+
+
+def _install_services(database: InMemoryDatabaseService, plaid: FakePlaidService) -> None:
+    from services.database import DatabaseServiceContainer
+    from services.plaid import PlaidServiceContainer
+
+    DatabaseServiceContainer._instance = database
+    PlaidServiceContainer._instance = plaid
+
+
+def _seed_user(database: InMemoryDatabaseService, seed: int) -> tuple[UUID, UUID, str, list[str]]:
+    from services.encryption import get_encryption_service
+
+    user_id = uuid.uuid4()
+    plaid_item_id = uuid.uuid4()
+    item_id = f"benchmark-item-{seed}"
+
+    database.table("plaid_items").insert(
+        {
+            "id": str(plaid_item_id),
+            "user_id": str(user_id),
+            "item_id": item_id,
+            "encrypted_access_token": get_encryption_service().encrypt(f"access-{seed}"),
+            "institution_name": "Benchmark Bank",
+            "status": "active",
+        }
+    ).execute()
+
+    account_ids = [f"benchmark-account-{seed}-{i}" for i in range(ACCOUNTS_PER_USER)]
+    database.table("accounts").insert(
+        [
+            {
+                "plaid_item_id": str(plaid_item_id),
+                "account_id": account_id,
+                "name": f"Account {i}",
+                "type": "depository",
+                "subtype": "checking",
+                "is_active": True,
+            }
+            for i, account_id in enumerate(account_ids)
+        ]
+    ).execute()
+
+    return user_id, plaid_item_id, item_id, account_ids
+
+
+def run_size(
+    transactions: int,
+    users: int,
+    seed: int,
+    plaid_latency_ms: int = 0,
+) -> dict[str, Any]:
+    for key, value in _BENCHMARK_ENV.items():
+        os.environ.setdefault(key, value)
+
+    from config import get_settings
+    from observability import configure_logging, get_logger
+    from services.analytics.baseline_calculator import get_baseline_calculator
+    from services.analytics.cash_flow_aggregator import get_cash_flow_aggregator
+    from services.analytics.computation_manager import get_spending_computation_manager
+    from services.analytics.creep_scorer import get_creep_scorer
+    from services.analytics.merchant_stats_aggregator import get_merchant_stats_aggregator
+    from services.cache.invalidation import get_cache_invalidator
+    from services.cache.warming import get_cache_warmer
+    from services.recurring import get_recurring_sync_service
+    from services.task_queue import get_task_queue_service
+    from services.transaction_sync import get_transaction_sync_service
+    from workers.context import WorkerContext
+    from workers.pipeline import ANALYTICS_STAGES
+    from workers.tasks.analytics import get_stage_runner
+
+    settings = get_settings()
+    configure_logging(log_level=settings.log_level, log_format=settings.log_format)
+
+    database = InMemoryDatabaseService(settings)
+    plaid = FakePlaidService([], latency_seconds=plaid_latency_ms / 1000)
+    _install_services(database, plaid)
+
+    worker_context = WorkerContext(
+        spending_manager=get_spending_computation_manager(),
+        merchant_aggregator=get_merchant_stats_aggregator(),
+        cash_flow_aggregator=get_cash_flow_aggregator(),
+        baseline_calculator=get_baseline_calculator(),
+        creep_scorer=get_creep_scorer(),
+        cache_invalidator=get_cache_invalidator(),
+        cache_warmer=get_cache_warmer(),
+        task_queue_service=get_task_queue_service(),
+    )
+    transaction_sync = get_transaction_sync_service()
+    recurring_sync = get_recurring_sync_service()
+
+    log = get_logger("benchmarks.pipeline")
+    stage_seconds: dict[str, list[float]] = {}
+    plaid_pages = 0
+
+    for user in range(users):
+        user_seed = seed + user
+        user_id, plaid_item_id, item_id, account_ids = _seed_user(database, user_seed)
+        plaid.load(generate_transactions(account_ids, transactions, user_seed))
+
+        _timed(stage_seconds, STAGE_SYNC, transaction_sync.sync_item, item_id)
+        _timed(stage_seconds, STAGE_RECURRING, recurring_sync.sync_for_plaid_item, plaid_item_id)
+        # The second fetch returns mostly unchanged streams, like a routine refresh.
+        _timed(
+            stage_seconds,
+            STAGE_RECURRING_RESYNC,
+            recurring_sync.sync_for_plaid_item,
+            plaid_item_id,
+        )
+
+        for stage in ANALYTICS_STAGES:
+            runner = get_stage_runner(stage.name)
+            _timed(stage_seconds, stage.name, runner, worker_context, user_id, log)
+
+        plaid_pages += plaid.calls
+
+    # Data generation and seeding are excluded; only the pipeline stages count.
+    total_seconds = sum(sum(samples) for samples in stage_seconds.values())
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS.
+    rss_divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+    return SizeReport(
+        transactions=transactions,
+        users=users,
+        jobs_per_second=round(users / total_seconds, 4),
+        total_seconds=round(total_seconds, 3),
+        peak_rss_mb=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / rss_divisor, 1),
+        plaid_pages=plaid_pages,
+        stage_seconds=stage_seconds,
+    ).summary()
+
+
+def _print_table(reports: list[dict[str, Any]]) -> None:
+    stages = list(reports[0]["stage_seconds"]) if reports else []
+    header = ["transactions", "jobs/s", "peak_rss_mb", *(f"{s}_s" for s in stages)]
+    print("  ".join(f"{column:>14}" for column in header))
+    for report in reports:
+        row = [
+            report["transactions"],
+            report["jobs_per_second"],
+            report["peak_rss_mb"],
+            *(report["stage_seconds"][stage]["mean"] for stage in stages),
+        ]
+        print("  ".join(f"{value:>14}" for value in row))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark webhook sync and analytics against in-memory stand-ins."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--users", type=int, default=1, help="Users (pipeline jobs) per size")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--plaid-latency-ms", type=int, default=0, help="Simulated latency per Plaid sync page"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the raw JSON report")
+    args = parser.parse_args(argv)
+
+    # Each size runs in a fresh process so peak RSS is measured per size.
+    context = multiprocessing.get_context("spawn")
+    reports: list[dict[str, Any]] = []
+    for size in args.sizes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            reports.append(
+                executor.submit(
+                    run_size, size, args.users, args.seed, args.plaid_latency_ms
+                ).result()
+            )
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        _print_table(reports)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
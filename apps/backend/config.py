@@ -7,6 +7,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 PlaidEnvironment = Literal["sandbox", "development", "production"]
 LogFormat = Literal["json", "console"]
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+TokenVerification = Literal["remote", "secret", "jwks"]
 
 
 def _parse_csv(value: str) -> list[str]:
@@ -66,6 +67,26 @@ class Settings(BaseSettings):
         default=False,
         description="Enable Plaid webhook JWT signature verification. Must be True in production.",
     )
+    plaid_pool_maxsize: int = Field(
+        default=20,
+        description="Maximum keep-alive connections to the Plaid API pooled per process",
+    )
+    plaid_connect_retries: int = Field(
+        default=2,
+        description="Retries for Plaid API requests that fail before a connection is established",
+    )
+    plaid_connect_timeout_seconds: float = Field(
+        default=5.0,
+        description="Connect timeout in seconds for Plaid API requests",
+    )
+    plaid_read_timeout_seconds: float = Field(
+        default=30.0,
+        description="Read timeout in seconds for Plaid API requests",
+    )
+    plaid_sync_read_timeout_seconds: float = Field(
+        default=90.0,
+        description="Read timeout in seconds for transactions/sync and recurring/get requests",
+    )
     webhook_key_cache_ttl_seconds: int = Field(
         default=86400,
         description="TTL in seconds for cached Plaid webhook verification keys (default: 24 hours)",
@@ -78,6 +99,33 @@ class Settings(BaseSettings):
     supabase_url: str = Field(description="Supabase project URL")
     supabase_anon_key: str = Field(description="Supabase anonymous/public key")
     supabase_service_role_key: str = Field(description="Supabase service role key (backend only)")
+    supabase_jwt_verification: TokenVerification = Field(
+        default="remote",
+        description=(
+            "How access tokens are verified: remote (Supabase Auth get_user), secret (HS256 "
+            "with SUPABASE_JWT_SECRET) or jwks (the project's signing keys)"
+        ),
+    )
+    supabase_jwt_secret: str = Field(
+        default="",
+        description="Supabase project JWT secret, used when SUPABASE_JWT_VERIFICATION=secret",
+    )
+    supabase_auth_max_concurrency: int = Field(
+        default=10,
+        description="Concurrent Supabase Auth token validations allowed per process",
+    )
+    supabase_auth_acquire_timeout_seconds: float = Field(
+        default=1.0,
+        description="Seconds to wait for a Supabase Auth validation slot before failing",
+    )
+    supabase_jwks_cache_ttl_seconds: int = Field(
+        default=600,
+        description="Seconds the Supabase JWKS is held in memory before it is refetched",
+    )
+    supabase_jwks_timeout_seconds: float = Field(
+        default=5.0,
+        description="Timeout in seconds for fetching the Supabase JWKS",
+    )
 
     encryption_key: str = Field(
         description="Key for encrypting sensitive data like Plaid access tokens"
@@ -115,6 +163,38 @@ class Settings(BaseSettings):
         default="redis://localhost:6379",
         description="Redis connection URL for task queue",
     )
+    redis_max_connections: int = Field(
+        default=50,
+        description="Maximum connections in each shared Redis pool (sync and async)",
+    )
+    redis_pool_timeout_seconds: float = Field(
+        default=2.0,
+        description="Seconds to wait for a free pooled connection before failing",
+    )
+    redis_socket_timeout_seconds: float = Field(
+        default=5.0,
+        description="Socket read/write timeout for Redis connections",
+    )
+    redis_connect_timeout_seconds: float = Field(
+        default=5.0,
+        description="Socket connect timeout for Redis connections",
+    )
+    redis_health_check_interval_seconds: int = Field(
+        default=30,
+        description="Seconds a pooled connection may sit idle before it is pinged on checkout",
+    )
+    redis_retry_attempts: int = Field(
+        default=3,
+        description="Retries for a Redis command after a connection or timeout error",
+    )
+    redis_retry_backoff_base_seconds: float = Field(
+        default=0.05,
+        description="Base delay for exponential backoff between Redis retries",
+    )
+    redis_retry_backoff_cap_seconds: float = Field(
+        default=1.0,
+        description="Maximum delay between Redis retries",
+    )
     task_queue_enabled: bool = Field(
         default=True,
         description="Enable background task queue (disable for synchronous fallback)",
@@ -124,6 +204,75 @@ class Settings(BaseSettings):
         description="Seconds to wait before processing analytics tasks (debouncing)",
     )
 
+    worker_lanes: str = Field(
+        default="high,normal,bulk",
+        description="Comma-separated queue lanes (high, normal, bulk) this worker process consumes",
+    )
+    worker_high_max_jobs: int = Field(
+        default=10,
+        description="Concurrent jobs for the high lane (interactive webhook syncs)",
+    )
+    worker_normal_max_jobs: int = Field(
+        default=6,
+        description="Concurrent jobs for the normal lane (analytics, recurring updates)",
+    )
+    worker_bulk_max_jobs: int = Field(
+        default=2,
+        description="Concurrent jobs for the bulk lane (initial and historical backfills)",
+    )
+    worker_metrics_host: str = Field(
+        default="0.0.0.0",
+        description="Interface the worker metrics endpoint listens on",
+    )
+    worker_metrics_port: int = Field(
+        default=9191,
+        description="Port for this worker process's Prometheus /metrics endpoint (0 disables)",
+    )
+    transaction_upsert_chunk_size: int = Field(
+        default=500,
+        description="Maximum transactions sent in one PostgREST upsert request",
+    )
+    transaction_sync_checkpoint_pages: int = Field(
+        default=10,
+        description="Plaid sync pages buffered before transactions and the cursor are written",
+    )
+    plaid_item_sync_concurrency: int = Field(
+        default=4,
+        description="Plaid items synced concurrently when refreshing all of a user's items",
+    )
+    plaid_institution_concurrency: int = Field(
+        default=2,
+        description="Concurrent Plaid calls allowed per institution during multi-item fan-out",
+    )
+    webhook_item_sync_lock_ttl_seconds: int = Field(
+        default=300,
+        description="TTL for the per-item lock that serializes webhook-triggered syncs",
+    )
+    webhook_idempotency_ttl_seconds: int = Field(
+        default=604800,
+        description="How long a webhook's idempotency key is held in Redis to reject redeliveries",
+    )
+    webhook_sweep_interval_minutes: int = Field(
+        default=5,
+        description="Minutes between sweeps that re-enqueue stuck or stalled webhook events",
+    )
+    webhook_sweep_batch_size: int = Field(
+        default=100,
+        description="Webhook events read per batch by the sweeper",
+    )
+    webhook_sweep_max_batches: int = Field(
+        default=10,
+        description="Maximum batches the sweeper processes in one run",
+    )
+    webhook_sweep_min_age_seconds: int = Field(
+        default=120,
+        description="Only sweep webhook events received at least this long ago",
+    )
+    webhook_sweep_max_retries: int = Field(
+        default=5,
+        description="Webhook events with this many failed attempts are left for manual review",
+    )
+
     rate_limit_enabled: bool = Field(
         default=True,
         description="Enable API rate limiting",
@@ -132,6 +281,17 @@ class Settings(BaseSettings):
         default="",
         description="Redis URL for rate limit storage (defaults to redis_url if empty)",
     )
+    rate_limit_local_fraction: float = Field(
+        default=0.1,
+        description=(
+            "Share of a bucket's remaining tokens a process may admit locally between Redis "
+            "round-trips (0 disables the local pre-check)"
+        ),
+    )
+    rate_limit_local_sync_seconds: float = Field(
+        default=1.0,
+        description="Maximum seconds a process admits requests locally before re-syncing a bucket",
+    )
     rate_limit_auth: str = Field(
         default="5/minute",
         description="Rate limit for auth endpoints (IP-based)",
@@ -144,6 +304,14 @@ class Settings(BaseSettings):
         default="5/minute",
         description="Rate limit for analytics write endpoints (user-based)",
     )
+    rate_limit_analytics_read: str = Field(
+        default="120/minute",
+        description="Weighted budget shared by analytics read endpoints (user-based)",
+    )
+    rate_limit_analytics_cache_miss_cost: int = Field(
+        default=3,
+        description="Extra budget charged when an analytics read misses the cache",
+    )
     rate_limit_default: str = Field(
         default="60/minute",
         description="Default rate limit for authenticated endpoints (user-based)",
@@ -157,6 +325,10 @@ class Settings(BaseSettings):
         default=300,
         description="TTL for auth token cache (5 min)",
     )
+    cache_auth_rejected_ttl_seconds: int = Field(
+        default=60,
+        description="TTL for remembering tokens Supabase Auth rejected (1 min)",
+    )
     cache_analytics_current_ttl_seconds: int = Field(
         default=120,
         description="TTL for current period analytics (2 min)",
@@ -198,6 +370,9 @@ class Settings(BaseSettings):
         description="TTL for recurring streams (10 min)",
     )
 
+    def get_worker_lanes(self) -> list[str]:
+        return _parse_csv(self.worker_lanes)
+
     def get_rate_limit_storage_url(self) -> str:
         return self.rate_limit_storage_url or self.redis_url
 
@@ -150,6 +150,27 @@ class ExternalServiceError(DomainError):
         )
 
 
+class ServiceUnavailableError(DomainError):
+    __slots__ = ("retry_after_seconds",)
+
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        *,
+        code: str = "FI-503-001",
+        retry_after_seconds: int = 1,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            error="service_unavailable",
+            code=code,
+            message=message,
+            http_status=503,
+            details=details,
+        )
+
+
 class EncryptionError(DomainError):
     __slots__ = ()
 
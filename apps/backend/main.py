@@ -28,9 +28,12 @@ from services.auth import AuthServiceContainer
 from services.cache.base import CacheServiceContainer
 from services.database import DatabaseServiceContainer
 from services.encryption import EncryptionServiceContainer
-from services.plaid import PlaidServiceContainer
+from services.ownership import OwnershipServiceContainer
+from services.plaid import InstitutionLimiterContainer, PlaidServiceContainer
 from services.recurring import AlertDetectionServiceContainer, RecurringSyncServiceContainer
+from services.redis_pool import RedisPoolManagerContainer
 from services.task_queue import TaskQueueServiceContainer
+from services.token_verification import SupabaseTokenVerifierContainer
 from services.transaction_sync import TransactionSyncServiceContainer
 from services.webhook import WebhookServiceContainer
 from services.webhook_key_cache import WebhookKeyCacheContainer
@@ -57,6 +60,7 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
         task_queue_enabled=settings.task_queue_enabled,
     )
 
+    RedisPoolManagerContainer.get()
     CacheServiceContainer.get()
     DatabaseServiceContainer.get()
     AuthServiceContainer.get()
@@ -94,6 +98,7 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     RecurringSyncServiceContainer.reset()
     AlertDetectionServiceContainer.reset()
     TransactionSyncServiceContainer.reset()
+    OwnershipServiceContainer.reset()
     AlertRepositoryContainer.reset()
     RecurringStreamRepositoryContainer.reset()
     WebhookEventRepositoryContainer.reset()
@@ -101,9 +106,12 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     AccountRepositoryContainer.reset()
     PlaidItemRepositoryContainer.reset()
     PlaidServiceContainer.reset()
+    InstitutionLimiterContainer.reset()
     EncryptionServiceContainer.reset()
     AuthServiceContainer.reset()
+    SupabaseTokenVerifierContainer.reset()
     DatabaseServiceContainer.reset()
+    await RedisPoolManagerContainer.close()
 
 
 def create_app() -> FastAPI:
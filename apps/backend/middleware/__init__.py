@@ -3,6 +3,7 @@ from middleware.exceptions import get_request_id
 from middleware.rate_limit import (
     RateLimiterContainer,
     RateLimits,
+    charge,
     get_client_ip,
     get_limiter,
     get_rate_limits,
@@ -16,6 +17,7 @@ from middleware.rate_limit import (
 __all__ = [
     "RateLimiterContainer",
     "RateLimits",
+    "charge",
     "get_client_ip",
     "get_current_user",
     "get_limiter",
@@ -7,7 +7,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
 
-from errors import DomainError
+from errors import DomainError, ServiceUnavailableError
 from models.errors import ApiErrorResponse, ApiFieldError
 from observability import get_logger
 
@@ -70,6 +70,8 @@ def domain_error_handler(request: Request, exc: Exception) -> Response:
     headers: dict[str, str] | None = None
     if exc.http_status == 401:
         headers = {"WWW-Authenticate": "Bearer"}
+    elif isinstance(exc, ServiceUnavailableError):
+        headers = {"Retry-After": str(exc.retry_after_seconds)}
 
     return _json_error(
         status_code=exc.http_status,
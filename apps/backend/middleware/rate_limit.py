@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import math
+import time
 from collections.abc import Callable
+from typing import Any
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+from limits.storage import RedisStorage
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from config import Settings, get_settings
 from middleware.exceptions import get_request_id
+from middleware.token_bucket import TokenBucketRateLimiter
 from models.errors import ApiErrorResponse
 from observability import get_logger
 
@@ -44,6 +49,25 @@ def get_user_id_only(request: Request) -> str:
     return f"ip:{get_client_ip(request)}"
 
 
+class TokenBucketLimiter(Limiter):
+    def __init__(
+        self,
+        *,
+        local_fraction: float,
+        local_sync_seconds: float,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        # Redis storage gets an atomic token bucket; other storages keep the
+        # sliding-window counter passed as the strategy.
+        if isinstance(self._storage, RedisStorage):
+            self._limiter = TokenBucketRateLimiter(
+                self._storage,
+                local_fraction=local_fraction,
+                local_sync_seconds=local_sync_seconds,
+            )
+
+
 def _create_limiter(settings: Settings) -> Limiter:
     if not settings.rate_limit_enabled:
         return Limiter(
@@ -52,11 +76,19 @@ def _create_limiter(settings: Settings) -> Limiter:
         )
 
     storage_uri = settings.get_rate_limit_storage_url()
+    storage_options: dict[str, Any] = {}
+    if storage_uri == settings.redis_url:
+        from services.redis_pool import get_redis_pool_manager
 
-    return Limiter(
+        storage_options["connection_pool"] = get_redis_pool_manager().get_pool()
+
+    return TokenBucketLimiter(
+        local_fraction=settings.rate_limit_local_fraction,
+        local_sync_seconds=settings.rate_limit_local_sync_seconds,
         key_func=get_user_or_ip,
         storage_uri=storage_uri,
-        strategy="fixed-window",
+        storage_options=storage_options,
+        strategy="sliding-window-counter",
         headers_enabled=False,
     )
 
@@ -65,7 +97,7 @@ def rate_limit_exceeded_handler(request: Request, exc: Exception) -> Response:
     if not isinstance(exc, RateLimitExceeded):
         raise TypeError(f"Expected RateLimitExceeded, got {type(exc).__name__}")
 
-    retry_after = _extract_retry_after(exc)
+    retry_after = _retry_after(request, exc)
     request_id = get_request_id(request)
 
     logger.warning(
@@ -92,23 +124,36 @@ def rate_limit_exceeded_handler(request: Request, exc: Exception) -> Response:
     )
 
 
-def _extract_retry_after(exc: RateLimitExceeded) -> int:
+def charge(request: Request, cost: int) -> None:
+    # Adds cost to the limit already checked for this request, for work whose
+    # price is only known once the handler has run (e.g. a cache miss).
+    view_rate_limit = getattr(request.state, "view_rate_limit", None)
+    if view_rate_limit is None or cost <= 0:
+        return
+
+    item, identifiers = view_rate_limit
+    backend = get_limiter().limiter
     try:
-        detail = str(exc.detail)
-        if "per" in detail:
-            parts = detail.split()
-            for i, part in enumerate(parts):
-                if part == "per" and i + 1 < len(parts):
-                    time_part = parts[i + 1]
-                    if "second" in time_part:
-                        return 1
-                    if "minute" in time_part:
-                        return 60
-                    if "hour" in time_part:
-                        return 3600
-    except Exception:
-        pass
-    return 60
+        if isinstance(backend, TokenBucketRateLimiter):
+            backend.charge(item, *identifiers, cost=cost)
+        else:
+            backend.hit(item, *identifiers, cost=cost)
+    except Exception as e:
+        logger.warning("rate_limit.charge_failed", error=str(e))
+
+
+def _retry_after(request: Request, exc: RateLimitExceeded) -> int:
+    # The limiter records the limit that failed and its key on the request, so
+    # the wait comes from that bucket's state rather than the limit's period.
+    view_rate_limit = getattr(request.state, "view_rate_limit", None)
+    if view_rate_limit is not None:
+        item, identifiers = view_rate_limit
+        try:
+            stats = get_limiter().limiter.get_window_stats(item, *identifiers)
+            return max(1, math.ceil(stats.reset_time - time.time()))
+        except Exception as e:
+            logger.warning("rate_limit.window_stats_failed", error=str(e))
+    return int(exc.limit.limit.get_expiry()) if exc.limit is not None else 60
 
 
 class RateLimits:
@@ -127,6 +172,14 @@ class RateLimits:
     def analytics_write(self) -> str:
         return self._settings.rate_limit_analytics_write
 
+    @property
+    def analytics_read(self) -> str:
+        return self._settings.rate_limit_analytics_read
+
+    @property
+    def analytics_cache_miss_cost(self) -> int:
+        return self._settings.rate_limit_analytics_cache_miss_cost
+
     @property
     def default(self) -> str:
         return self._settings.rate_limit_default
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import ClassVar
+
+from limits import RateLimitItem
+from limits.storage import RedisStorage
+from limits.strategies import RateLimiter
+from limits.util import WindowStats
+
+# Refills the bucket from server time, debits cost already admitted locally,
+# then tries to take ARGV[3] tokens. Returns {allowed, tokens left, ms until the
+# next request of that cost (or of one token, once allowed) can succeed}.
+_TOKEN_BUCKET_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now_ms
+tokens = math.min(capacity, tokens + math.max(0, now_ms - ts) * rate) - tonumber(ARGV[4])
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now_ms)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 1000)
+local needed = cost
+if allowed == 1 then
+    needed = 1
+end
+return {allowed, tostring(tokens), math.max(0, math.ceil((needed - tokens) / rate))}
+"""
+
+
+@dataclass(slots=True)
+class _LocalBucket:
+    tokens: float
+    synced_at: float
+    retry_at: float
+    allowance: int
+    pending: int = 0
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    _MAX_LOCAL_BUCKETS: ClassVar[int] = 10_000
+
+    def __init__(
+        self,
+        storage: RedisStorage,
+        *,
+        local_fraction: float = 0.0,
+        local_sync_seconds: float = 1.0,
+    ) -> None:
+        super().__init__(storage)
+        self._redis_storage = storage
+        self._script = storage.get_connection().register_script(_TOKEN_BUCKET_SCRIPT.encode())
+        # Keys with plenty of tokens left are admitted in process for up to
+        # local_fraction of what Redis last reported; the admitted cost is
+        # debited on the next round-trip.
+        self._local_fraction = local_fraction
+        self._local_sync_seconds = local_sync_seconds
+        self._local: dict[str, _LocalBucket] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, item: RateLimitItem, *identifiers: str) -> str:
+        return self._redis_storage.prefixed_key(item.key_for(*identifiers))
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = self._key(item, *identifiers)
+        now = time.monotonic()
+
+        with self._lock:
+            local = self._local.get(key)
+            if (
+                local is not None
+                and now - local.synced_at < self._local_sync_seconds
+                and local.pending + cost <= local.allowance
+            ):
+                local.pending += cost
+                return True
+            debit = 0
+            if local is not None:
+                debit, local.pending = local.pending, 0
+
+        try:
+            return self._consume(key, item, cost, debit)
+        except Exception:
+            with self._lock:
+                local = self._local.get(key)
+                if local is not None:
+                    local.pending += debit
+            raise
+
+    def charge(self, item: RateLimitItem, *identifiers: str, cost: int) -> None:
+        key = self._key(item, *identifiers)
+
+        with self._lock:
+            local = self._local.get(key)
+            if local is not None:
+                local.pending += cost
+                return
+
+        self._consume(key, item, 0, cost)
+
+    def test(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        return self.get_window_stats(item, *identifiers).remaining >= cost
+
+    def get_window_stats(self, item: RateLimitItem, *identifiers: str) -> WindowStats:
+        key = self._key(item, *identifiers)
+
+        with self._lock:
+            local = self._local.get(key)
+            if local is not None and time.monotonic() - local.synced_at < self._local_sync_seconds:
+                return WindowStats(local.retry_at, max(0, int(local.tokens) - local.pending))
+
+        self._consume(key, item, 0, 0)
+        with self._lock:
+            local = self._local[key]
+            return WindowStats(local.retry_at, max(0, int(local.tokens) - local.pending))
+
+    def _consume(self, key: str, item: RateLimitItem, cost: int, debit: int) -> bool:
+        capacity = item.amount
+        rate_per_ms = capacity / (item.get_expiry() * 1000)
+        allowed, tokens, wait_ms = self._script(
+            keys=[key], args=[capacity, rate_per_ms, cost, debit]
+        )
+
+        remaining = float(tokens)
+        bucket = _LocalBucket(
+            tokens=remaining,
+            synced_at=time.monotonic(),
+            retry_at=time.time() + int(wait_ms) / 1000,
+            allowance=math.floor(max(0.0, remaining) * self._local_fraction),
+        )
+
+        with self._lock:
+            previous = self._local.get(key)
+            if previous is not None:
+                bucket.pending = previous.pending
+            elif len(self._local) >= self._MAX_LOCAL_BUCKETS:
+                self._evict(bucket.synced_at)
+            self._local[key] = bucket
+
+        return bool(allowed)
+
+    def _evict(self, now: float) -> None:
+        stale = [
+            key
+            for key, bucket in self._local.items()
+            if bucket.pending == 0 and now - bucket.synced_at >= self._local_sync_seconds
+        ]
+        for key in stale:
+            del self._local[key]
+        if len(self._local) >= self._MAX_LOCAL_BUCKETS:
+            self._local.clear()
@@ -28,6 +28,7 @@ from models.analytics import (
 )
 from models.auth import AuthenticatedUser
 from models.common import HealthResponse
+from models.dashboard import DashboardResponse
 from models.enums import (
     AlertSeverity,
     AlertStatus,
@@ -50,6 +51,7 @@ from models.plaid import (
     ExchangeTokenRequest,
     ExchangeTokenResponse,
     LinkTokenResponse,
+    OwnershipIndex,
     PlaidItemCreate,
     PlaidItemResponse,
     PlaidItemWithAccountsResponse,
@@ -132,6 +134,7 @@ __all__ = [
     "CategorySpendingUpdate",
     "ComputationResultResponse",
     "ComputationStatus",
+    "DashboardResponse",
     "ExchangeTokenRequest",
     "ExchangeTokenResponse",
     "FrequencyType",
@@ -153,6 +156,7 @@ __all__ = [
     "MerchantStatsResponse",
     "MerchantStatsSummary",
     "MerchantStatsUpdate",
+    "OwnershipIndex",
     "PeriodType",
     "PlaidItemCreate",
     "PlaidItemResponse",
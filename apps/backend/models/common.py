@@ -8,10 +8,30 @@ class HealthResponse(BaseModel):
     version: str = Field(description="API version")
 
 
+class CacheLatencyStats(BaseModel):
+    count: int = Field(description="Number of observed operations")
+    avg_ms: float = Field(description="Average latency in milliseconds")
+    buckets: dict[str, int] = Field(
+        description="Cumulative operation counts keyed by upper bound in seconds"
+    )
+
+
 class DomainCacheStats(BaseModel):
     hits: int = Field(description="Number of cache hits")
     misses: int = Field(description="Number of cache misses")
     hit_rate: float = Field(description="Hit rate (0.0 to 1.0)")
+    errors: int = Field(description="Number of Redis errors")
+    error_rate: float = Field(description="Redis errors per operation (0.0 to 1.0)")
+    get_latency: CacheLatencyStats = Field(description="GET latency distribution")
+    set_latency: CacheLatencyStats = Field(description="SET latency distribution")
+
+
+class KeyFamilyCacheStats(BaseModel):
+    bytes_read: int = Field(description="Total payload bytes returned by cache hits")
+    bytes_written: int = Field(description="Total payload bytes written")
+    reads: int = Field(description="Number of cache hits")
+    writes: int = Field(description="Number of successful writes")
+    avg_value_bytes: float = Field(description="Average written payload size in bytes")
 
 
 class CacheStatsResponse(BaseModel):
@@ -20,4 +40,9 @@ class CacheStatsResponse(BaseModel):
     total_hits: int = Field(description="Total cache hits across all domains")
     total_misses: int = Field(description="Total cache misses across all domains")
     hit_rate: float = Field(description="Overall hit rate (0.0 to 1.0)")
+    total_errors: int = Field(description="Total Redis errors across all domains")
+    error_rate: float = Field(description="Overall Redis errors per operation (0.0 to 1.0)")
     domains: dict[str, DomainCacheStats] = Field(description="Per-domain cache statistics")
+    families: dict[str, KeyFamilyCacheStats] = Field(
+        description="Payload size statistics per key family (domain and first key segment)"
+    )
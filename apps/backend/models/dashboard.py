@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+from models.analytics import (
+    CashFlowMetricsResponse,
+    PacingResponse,
+    SpendingSummaryResponse,
+    TargetStatusResponse,
+)
+from models.recurring import UpcomingBillsListResponse
+
+
+class DashboardResponse(BaseModel):
+    spending: SpendingSummaryResponse
+    cash_flow: CashFlowMetricsResponse | None = None
+    pacing: PacingResponse | None = None
+    target_status: TargetStatusResponse
+    upcoming_bills: UpcomingBillsListResponse
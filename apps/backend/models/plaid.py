@@ -95,4 +95,23 @@ class SyncResponse(BaseModel):
     transactions_added: int
     transactions_modified: int
     transactions_removed: int
+    transactions_unchanged: int = 0
     message: str
+
+
+class OwnershipIndex(BaseModel):
+    plaid_item_ids: list[UUID] = Field(default_factory=list)
+    account_plaid_items: dict[UUID, UUID] = Field(
+        default_factory=dict,
+        description="Maps each account ID to the plaid item it belongs to",
+    )
+
+    @property
+    def account_ids(self) -> list[UUID]:
+        return list(self.account_plaid_items)
+
+    def owns_plaid_item(self, plaid_item_id: UUID) -> bool:
+        return plaid_item_id in self.plaid_item_ids
+
+    def owns_account(self, account_id: UUID) -> bool:
+        return account_id in self.account_plaid_items
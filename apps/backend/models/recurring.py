@@ -170,6 +170,7 @@ class RecurringSyncResult(BaseModel):
     streams_updated: int
     streams_deactivated: int
     alerts_created: int
+    streams_unchanged: int = 0
 
 
 class StreamTransactionResponse(BaseModel):
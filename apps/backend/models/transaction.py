@@ -109,9 +109,21 @@ class TransactionSyncResult(BaseModel):
     added: int = 0
     modified: int = 0
     removed: int = 0
+    unchanged: int = Field(
+        default=0,
+        description="Modifications reported by Plaid that left every stored field unchanged",
+    )
+    changed: int = Field(
+        default=0,
+        description="Transactions that were added, changed or removed",
+    )
     cursor: str
     has_more: bool = False
 
+    @property
+    def has_changes(self) -> bool:
+        return self.changed > 0
+
 
 class PlaidTransactionData(BaseModel):
     transaction_id: str
@@ -14,6 +14,17 @@ class AccountRepository(BaseRepository[AccountResponse, AccountCreate]):
         result = self._get_table().select("*").eq("plaid_item_id", str(plaid_item_id)).execute()
         return [dict(item) for item in result.data] if result.data else []
 
+    def get_by_plaid_item_ids(self, plaid_item_ids: list[UUID]) -> list[dict[str, Any]]:
+        if not plaid_item_ids:
+            return []
+        result = (
+            self._get_table()
+            .select("*")
+            .in_("plaid_item_id", [str(plaid_item_id) for plaid_item_id in plaid_item_ids])
+            .execute()
+        )
+        return [dict(item) for item in result.data] if result.data else []
+
     def get_by_account_id(self, account_id: str) -> dict[str, Any] | None:
         result = self._get_table().select("*").eq("account_id", account_id).execute()
         if not result.data:
@@ -74,6 +74,15 @@ class AlertRepository(BaseRepository[AlertResponse, AlertCreate]):
         result = self._get_table().select("id", count="exact").eq("user_id", str(user_id)).execute()
         return result.count if result.count else 0
 
+    def create_many(self, alerts: list[AlertCreate]) -> list[dict[str, Any]]:
+        if not alerts:
+            return []
+
+        result = (
+            self._get_table().insert([alert.model_dump(mode="json") for alert in alerts]).execute()
+        )
+        return [dict(item) for item in result.data] if result.data else []
+
     def update(self, alert_id: UUID, data: AlertUpdate) -> dict[str, Any] | None:
         update_data = data.model_dump(mode="json", exclude_none=True)
         if not update_data:
@@ -134,6 +143,30 @@ class AlertRepository(BaseRepository[AlertResponse, AlertCreate]):
         )
         return bool(result.data)
 
+    def get_recent_types_by_stream(
+        self, recurring_stream_ids: list[UUID], since_hours: int = 24
+    ) -> dict[UUID, set[AlertType]]:
+        if not recurring_stream_ids:
+            return {}
+
+        from datetime import timedelta
+
+        cutoff = datetime.now() - timedelta(hours=since_hours)
+
+        result = (
+            self._get_table()
+            .select("recurring_stream_id, alert_type")
+            .in_("recurring_stream_id", [str(stream_id) for stream_id in recurring_stream_ids])
+            .gte("created_at", cutoff.isoformat())
+            .execute()
+        )
+
+        recent: dict[UUID, set[AlertType]] = {}
+        for item in result.data or []:
+            stream_id = UUID(item["recurring_stream_id"])
+            recent.setdefault(stream_id, set()).add(AlertType(item["alert_type"]))
+        return recent
+
 
 class AlertRepositoryContainer:
     _instance: AlertRepository | None = None
@@ -53,21 +53,18 @@ class PlaidItemRepository(BaseRepository[PlaidItemResponse, PlaidItemCreate]):
             return None
         return dict(result.data[0])
 
-    def update_sync_cursor(self, record_id: UUID, cursor: str) -> dict[str, Any] | None:
-        result = (
-            self._get_table().update({"sync_cursor": cursor}).eq("id", str(record_id)).execute()
-        )
-        if not result.data:
-            return None
-        return dict(result.data[0])
+    def update_sync_state(
+        self,
+        record_id: UUID,
+        cursor: str | None,
+        *,
+        completed: bool,
+    ) -> dict[str, Any] | None:
+        update_data: dict[str, Any] = {"sync_cursor": cursor}
+        if completed:
+            update_data["last_successful_sync"] = datetime.now(UTC).isoformat()
 
-    def update_last_sync(self, record_id: UUID) -> dict[str, Any] | None:
-        result = (
-            self._get_table()
-            .update({"last_successful_sync": datetime.now(UTC).isoformat()})
-            .eq("id", str(record_id))
-            .execute()
-        )
+        result = self._get_table().update(update_data).eq("id", str(record_id)).execute()
         if not result.data:
             return None
         return dict(result.data[0])
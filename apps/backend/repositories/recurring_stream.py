@@ -7,6 +7,8 @@ from models.recurring import RecurringStreamCreate, RecurringStreamResponse, Rec
 from repositories.base import BaseRepository
 from services.database import DatabaseService, get_database_service
 
+_DEACTIVATED = {"is_active": False, "status": StreamStatus.TOMBSTONED.value, "content_hash": None}
+
 
 class RecurringStreamRepository(BaseRepository[RecurringStreamResponse, RecurringStreamCreate]):
     def __init__(self, database_service: DatabaseService) -> None:
@@ -95,6 +97,9 @@ class RecurringStreamRepository(BaseRepository[RecurringStreamResponse, Recurrin
         if not update_data:
             return self.get_by_id(stream_id)
 
+        # Any write outside recurring sync invalidates the stored content hash
+        # so the next sync rewrites the row from Plaid's data.
+        update_data["content_hash"] = None
         result = self._get_table().update(update_data).eq("id", str(stream_id)).execute()
         if not result.data:
             return None
@@ -128,30 +133,60 @@ class RecurringStreamRepository(BaseRepository[RecurringStreamResponse, Recurrin
 
         return self.create(data)
 
-    def deactivate(self, stream_id: UUID) -> dict[str, Any] | None:
+    def upsert_many(self, streams: list[RecurringStreamCreate]) -> list[dict[str, Any]]:
+        return self.upsert_rows([stream.model_dump(mode="json") for stream in streams])
+
+    def upsert_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not rows:
+            return []
+
+        synced_at = datetime.now().isoformat()
         result = (
             self._get_table()
-            .update({"is_active": False, "status": StreamStatus.TOMBSTONED.value})
-            .eq("id", str(stream_id))
+            .upsert(
+                [{**row, "last_synced_at": synced_at} for row in rows],
+                on_conflict="plaid_item_id,stream_id",
+            )
+            .execute()
+        )
+        return [dict(item) for item in result.data] if result.data else []
+
+    def mark_synced(self, stream_ids: list[str]) -> None:
+        if not stream_ids:
+            return
+
+        (
+            self._get_table()
+            .update({"last_synced_at": datetime.now().isoformat()})
+            .in_("id", stream_ids)
             .execute()
         )
+
+    def deactivate(self, stream_id: UUID) -> dict[str, Any] | None:
+        result = self._get_table().update(_DEACTIVATED).eq("id", str(stream_id)).execute()
         if not result.data:
             return None
         return dict(result.data[0])
 
     def deactivate_missing(
-        self, plaid_item_id: UUID, active_stream_ids: set[str]
+        self,
+        plaid_item_id: UUID,
+        active_stream_ids: set[str],
+        existing: list[dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
-        existing = self.get_by_plaid_item_id(plaid_item_id)
-        deactivated = []
-
-        for stream in existing:
-            if stream["stream_id"] not in active_stream_ids and stream["is_active"]:
-                result = self.deactivate(UUID(stream["id"]))
-                if result:
-                    deactivated.append(result)
-
-        return deactivated
+        if existing is None:
+            existing = self.get_by_plaid_item_id(plaid_item_id)
+
+        missing = [
+            stream["id"]
+            for stream in existing
+            if stream["stream_id"] not in active_stream_ids and stream["is_active"]
+        ]
+        if not missing:
+            return []
+
+        result = self._get_table().update(_DEACTIVATED).in_("id", missing).execute()
+        return [dict(item) for item in result.data] if result.data else []
 
     def delete_by_plaid_item_id(self, plaid_item_id: UUID) -> int:
         result = self._get_table().delete().eq("plaid_item_id", str(plaid_item_id)).execute()
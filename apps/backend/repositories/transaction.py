@@ -4,14 +4,21 @@ from datetime import date as date_type
 from typing import Any
 from uuid import UUID
 
+from postgrest.types import ReturnMethod
+
+from config import get_settings
 from models.transaction import TransactionCreate, TransactionResponse, TransactionUpdate
 from repositories.base import BaseRepository
 from services.database import DatabaseService, get_database_service
 
+# Keeps the in.(...) filter of a lookup well inside PostgREST URL limits.
+_LOOKUP_CHUNK_SIZE = 200
+
 
 class TransactionRepository(BaseRepository[TransactionResponse, TransactionCreate]):
-    def __init__(self, database_service: DatabaseService) -> None:
+    def __init__(self, database_service: DatabaseService, upsert_chunk_size: int = 500) -> None:
         super().__init__(database_service, "transactions")
+        self._upsert_chunk_size = upsert_chunk_size
 
     def get_by_transaction_id(self, transaction_id: str) -> dict[str, Any] | None:
         result = self._get_table().select("*").eq("transaction_id", transaction_id).execute()
@@ -98,19 +105,31 @@ class TransactionRepository(BaseRepository[TransactionResponse, TransactionCreat
             raise ValueError("Failed to upsert transaction")
         return dict(result.data[0])
 
-    def upsert_many(self, transactions: list[TransactionCreate]) -> list[dict[str, Any]]:
-        if not transactions:
+    def upsert_rows(
+        self,
+        rows: list[dict[str, Any]],
+        *,
+        chunk_size: int | None = None,
+        returning_minimal: bool = False,
+    ) -> list[dict[str, Any]]:
+        if not rows:
             return []
 
-        data = []
-        for txn in transactions:
-            dump = txn.model_dump(mode="json", by_alias=True, exclude_none=True)
-            if "datetime" in dump:
-                dump["datetime"] = dump.pop("datetime")
-            data.append(dump)
-
-        result = self._get_table().upsert(data, on_conflict="transaction_id").execute()
-        return [dict(item) for item in result.data] if result.data else []
+        size = max(1, chunk_size or self._upsert_chunk_size)
+        returning = ReturnMethod.minimal if returning_minimal else ReturnMethod.representation
+
+        written: list[dict[str, Any]] = []
+        for start in range(0, len(rows), size):
+            result = (
+                self._get_table()
+                .upsert(
+                    rows[start : start + size], on_conflict="transaction_id", returning=returning
+                )
+                .execute()
+            )
+            if not returning_minimal and result.data:
+                written.extend(result.data)
+        return written
 
     def update_by_transaction_id(
         self,
@@ -133,11 +152,16 @@ class TransactionRepository(BaseRepository[TransactionResponse, TransactionCreat
         return bool(result.data)
 
     def delete_many_by_transaction_ids(self, transaction_ids: list[str]) -> int:
-        if not transaction_ids:
-            return 0
-
-        result = self._get_table().delete().in_("transaction_id", transaction_ids).execute()
-        return len(result.data) if result.data else 0
+        deleted = 0
+        for start in range(0, len(transaction_ids), _LOOKUP_CHUNK_SIZE):
+            result = (
+                self._get_table()
+                .delete()
+                .in_("transaction_id", transaction_ids[start : start + _LOOKUP_CHUNK_SIZE])
+                .execute()
+            )
+            deleted += len(result.data) if result.data else 0
+        return deleted
 
     def get_by_transaction_ids(
         self,
@@ -155,6 +179,19 @@ class TransactionRepository(BaseRepository[TransactionResponse, TransactionCreat
         )
         return [dict(item) for item in result.data] if result.data else []
 
+    def get_content_hashes(self, transaction_ids: list[str]) -> dict[str, str | None]:
+        hashes: dict[str, str | None] = {}
+        for start in range(0, len(transaction_ids), _LOOKUP_CHUNK_SIZE):
+            result = (
+                self._get_table()
+                .select("transaction_id, content_hash")
+                .in_("transaction_id", transaction_ids[start : start + _LOOKUP_CHUNK_SIZE])
+                .execute()
+            )
+            for item in result.data or []:
+                hashes[item["transaction_id"]] = item.get("content_hash")
+        return hashes
+
 
 class TransactionRepositoryContainer:
     _instance: TransactionRepository | None = None
@@ -163,7 +200,10 @@ class TransactionRepositoryContainer:
     def get(cls) -> TransactionRepository:
         if cls._instance is None:
             database_service = get_database_service()
-            cls._instance = TransactionRepository(database_service)
+            cls._instance = TransactionRepository(
+                database_service,
+                upsert_chunk_size=get_settings().transaction_upsert_chunk_size,
+            )
         return cls._instance
 
     @classmethod
@@ -17,28 +17,63 @@ class WebhookEventRepository(BaseRepository[WebhookEventResponse, WebhookEventCr
             return None
         return dict(result.data[0])
 
-    def get_by_item_id(self, item_id: str, limit: int = 50) -> list[dict[str, Any]]:
+    def insert_if_absent(self, event_id: UUID, data: WebhookEventCreate) -> bool:
         result = (
             self._get_table()
-            .select("*")
-            .eq("item_id", item_id)
-            .order("received_at", desc=True)
-            .limit(limit)
+            .upsert(
+                {"id": str(event_id), **data.model_dump(mode="json")},
+                on_conflict="idempotency_key",
+                ignore_duplicates=True,
+            )
             .execute()
         )
-        return [dict(item) for item in result.data] if result.data else []
+        return bool(result.data)
 
-    def get_pending_events(self, limit: int = 100) -> list[dict[str, Any]]:
+    def get_by_item_id(self, item_id: str, limit: int = 50) -> list[dict[str, Any]]:
         result = (
             self._get_table()
             .select("*")
-            .eq("status", WebhookEventStatus.PENDING.value)
+            .eq("item_id", item_id)
             .order("received_at", desc=True)
             .limit(limit)
             .execute()
         )
         return [dict(item) for item in result.data] if result.data else []
 
+    def get_pending_events(
+        self,
+        limit: int = 100,
+        *,
+        after: tuple[str, str] | None = None,
+        include_failed: bool = False,
+        include_processing: bool = False,
+        max_retry_count: int | None = None,
+        received_before: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        statuses = [WebhookEventStatus.PENDING.value]
+        if include_failed:
+            statuses.append(WebhookEventStatus.FAILED.value)
+        if include_processing:
+            statuses.append(WebhookEventStatus.PROCESSING.value)
+
+        query = self._get_table().select("*").in_("status", statuses)
+
+        if max_retry_count is not None:
+            query = query.lt("retry_count", max_retry_count)
+        if received_before is not None:
+            query = query.lt("received_at", received_before.isoformat())
+        if after is not None:
+            # Keyset paging: statuses change while a caller works through the
+            # results, so offsets would skip rows.
+            received_at, event_id = after
+            query = query.or_(
+                f'received_at.gt."{received_at}",'
+                f'and(received_at.eq."{received_at}",id.gt.{event_id})'
+            )
+
+        result = query.order("received_at").order("id").limit(limit).execute()
+        return [dict(item) for item in result.data] if result.data else []
+
     def update_status(
         self,
         event_id: UUID,
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -17,6 +17,7 @@ from repositories.account import AccountRepository, get_account_repository
 from repositories.plaid_item import PlaidItemRepository, get_plaid_item_repository
 from services.cache.account_cache import AccountCache, get_account_cache
 from services.cache.invalidation import CacheInvalidator, get_cache_invalidator
+from services.ownership import OwnershipService, get_ownership_service
 from services.transaction_sync import TransactionSyncService, get_transaction_sync_service
 
 router = APIRouter()
@@ -29,6 +30,7 @@ AccountRepoDep = Annotated[AccountRepository, Depends(get_account_repository)]
 TransactionSyncDep = Annotated[TransactionSyncService, Depends(get_transaction_sync_service)]
 AccountCacheDep = Annotated[AccountCache, Depends(get_account_cache)]
 CacheInvalidatorDep = Annotated[CacheInvalidator, Depends(get_cache_invalidator)]
+OwnershipDep = Annotated[OwnershipService, Depends(get_ownership_service)]
 
 LIABILITY_ACCOUNT_TYPES = frozenset({"credit", "loan"})
 
@@ -56,19 +58,26 @@ async def list_accounts(
     plaid_item_repo: PlaidItemRepoDep,
     account_repo: AccountRepoDep,
     account_cache: AccountCacheDep,
+    ownership: OwnershipDep,
 ) -> AccountsListResponse:
     cached = account_cache.get_accounts_list(current_user.id)
     if cached is not None:
         return cached
 
     plaid_items = plaid_item_repo.get_by_user_id(current_user.id)
+    all_accounts = account_repo.get_by_plaid_item_ids([UUID(item["id"]) for item in plaid_items])
+    ownership.remember(current_user.id, plaid_items, all_accounts)
+
+    accounts_by_item: dict[str, list[dict[str, Any]]] = {}
+    for account_row in all_accounts:
+        accounts_by_item.setdefault(account_row["plaid_item_id"], []).append(account_row)
 
     items_with_accounts: list[PlaidItemWithAccountsResponse] = []
     total_balance = Decimal("0")
     account_count = 0
 
     for item in plaid_items:
-        accounts_data = account_repo.get_by_plaid_item_id(UUID(item["id"]))
+        accounts_data = accounts_by_item.get(item["id"], [])
 
         accounts = [
             AccountResponse(
@@ -126,17 +135,16 @@ async def get_account(
     account_id: UUID,
     current_user: CurrentUserDep,
     account_repo: AccountRepoDep,
-    plaid_item_repo: PlaidItemRepoDep,
+    ownership: OwnershipDep,
 ) -> AccountResponse:
-    account = account_repo.get_by_id(account_id)
-    if not account:
+    if not ownership.owns_account(current_user.id, account_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
 
-    plaid_item = plaid_item_repo.get_by_id(UUID(account["plaid_item_id"]))
-    if not plaid_item or plaid_item["user_id"] != str(current_user.id):
+    account = account_repo.get_by_id(account_id)
+    if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
@@ -167,33 +175,26 @@ async def sync_account(
     request: Request,
     account_id: UUID,
     current_user: CurrentUserDep,
-    account_repo: AccountRepoDep,
-    plaid_item_repo: PlaidItemRepoDep,
+    ownership: OwnershipDep,
     sync_service: TransactionSyncDep,
     cache_invalidator: CacheInvalidatorDep,
 ) -> SyncResponse:
-    account = account_repo.get_by_id(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Account not found",
-        )
-
-    plaid_item = plaid_item_repo.get_by_id(UUID(account["plaid_item_id"]))
-    if not plaid_item or plaid_item["user_id"] != str(current_user.id):
+    plaid_item_id = ownership.get_plaid_item_for_account(current_user.id, account_id)
+    if plaid_item_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
 
     try:
-        result = sync_service.sync_plaid_item(UUID(plaid_item["id"]))
+        result = sync_service.sync_plaid_item(plaid_item_id)
         cache_invalidator.on_transaction_sync(current_user.id)
         return SyncResponse(
             success=True,
             transactions_added=result.added,
             transactions_modified=result.modified,
             transactions_removed=result.removed,
+            transactions_unchanged=result.unchanged,
             message="Sync completed successfully",
         )
     except Exception as e:
@@ -215,10 +216,10 @@ async def delete_plaid_item(
     plaid_item_id: UUID,
     current_user: CurrentUserDep,
     plaid_item_repo: PlaidItemRepoDep,
+    ownership: OwnershipDep,
     cache_invalidator: CacheInvalidatorDep,
 ) -> None:
-    plaid_item = plaid_item_repo.get_by_id(plaid_item_id)
-    if not plaid_item or plaid_item["user_id"] != str(current_user.id):
+    if not ownership.owns_plaid_item(current_user.id, plaid_item_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Plaid item not found",
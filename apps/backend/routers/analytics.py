@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Annotated, Any, Literal
@@ -7,7 +8,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from middleware.auth import get_current_user
-from middleware.rate_limit import get_limiter, get_rate_limits
+from middleware.rate_limit import charge, get_limiter, get_rate_limits
 from models.analytics import (
     CashFlowComputationResultResponse,
     CashFlowMetricsListResponse,
@@ -32,12 +33,10 @@ from models.analytics import (
     MerchantStatsListResponse,
     MerchantStatsResponse,
     PacingResponse,
-    SpendingPeriodWithDelta,
     SpendingSummaryListResponse,
     SpendingSummaryResponse,
     SubcategorySpendingSummary,
     TargetStatusResponse,
-    TargetStatusType,
 )
 from models.auth import AuthenticatedUser
 from models.enums import BaselineType, PeriodType
@@ -77,7 +76,12 @@ from services.analytics.merchant_stats_aggregator import (
 from services.analytics.period_calculator import (
     get_current_period_start,
     get_period_bounds,
-    get_previous_period_start,
+)
+from services.analytics.response_builder import (
+    AnalyticsResponseBuilder,
+    build_category_summaries,
+    get_analytics_response_builder,
+    to_cash_flow_response,
 )
 from services.cache.analytics_cache import AnalyticsCache, get_analytics_cache
 from services.cache.invalidation import CacheInvalidator, get_cache_invalidator
@@ -86,6 +90,21 @@ router = APIRouter()
 limiter = get_limiter()
 limits = get_rate_limits()
 
+# Reads share one weighted budget: cached lookups cost 1 (plus the miss charge
+# when they have to compute), history lookups more, transaction scans by range.
+_ANALYTICS_READ_SCOPE = "analytics:read"
+_HISTORY_COST = 2
+_SCAN_COSTS: dict[str, int] = {"week": 2, "month": 3, "year": 6, "all": 10}
+
+
+def _scan_cost(request: Request) -> int:
+    return _SCAN_COSTS.get(request.query_params.get("time_range", "month"), _SCAN_COSTS["all"])
+
+
+def _analytics_read(cost: int | Callable[[Request], int] = 1) -> Callable[..., Any]:
+    return limiter.shared_limit(limits.analytics_read, scope=_ANALYTICS_READ_SCOPE, cost=cost)
+
+
 CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
 AnalyticsCacheDep = Annotated[AnalyticsCache, Depends(get_analytics_cache)]
 CacheInvalidatorDep = Annotated[CacheInvalidator, Depends(get_cache_invalidator)]
@@ -112,6 +131,7 @@ CreepScorerDep = Annotated[CreepScorer, Depends(get_creep_scorer)]
 LifestyleBaselineRepoDep = Annotated[
     LifestyleBaselineRepository, Depends(get_lifestyle_baseline_repository)
 ]
+ResponseBuilderDep = Annotated[AnalyticsResponseBuilder, Depends(get_analytics_response_builder)]
 
 
 @router.get(
@@ -120,11 +140,11 @@ LifestyleBaselineRepoDep = Annotated[
     summary="Get spending summaries",
     description="Returns spending summaries for multiple periods with month-over-month changes",
 )
-@limiter.limit(limits.default)
+@_analytics_read()
 async def get_spending_summaries(
     request: Request,
     current_user: CurrentUserDep,
-    spending_period_repo: SpendingPeriodRepoDep,
+    response_builder: ResponseBuilderDep,
     analytics_cache: AnalyticsCacheDep,
     period_type: PeriodType = Query(default=PeriodType.MONTHLY, description="Period granularity"),
     periods: int = Query(default=6, ge=1, le=24, description="Number of periods to return"),
@@ -133,41 +153,9 @@ async def get_spending_summaries(
     if cached is not None:
         return cached
 
-    periods_data = spending_period_repo.get_periods_for_user(
-        user_id=current_user.id,
-        period_type=period_type,
-        limit=periods + 1,
-    )
-
-    result: list[SpendingPeriodWithDelta] = []
-
-    for i, period in enumerate(periods_data[:periods]):
-        previous_outflow: Decimal | None = None
-        change_amount: Decimal | None = None
-        change_percentage: Decimal | None = None
-
-        if i + 1 < len(periods_data):
-            previous = periods_data[i + 1]
-            previous_outflow = Decimal(str(previous.get("total_outflow_excluding_transfers", 0)))
-            current_outflow = Decimal(str(period.get("total_outflow_excluding_transfers", 0)))
-
-            change_amount = current_outflow - previous_outflow
-            if previous_outflow > 0:
-                change_percentage = (change_amount / previous_outflow) * 100
+    charge(request, limits.analytics_cache_miss_cost)
 
-        result.append(
-            _to_spending_period_with_delta(
-                period,
-                previous_outflow,
-                change_amount,
-                change_percentage,
-            )
-        )
-
-    response = SpendingSummaryListResponse(
-        periods=result,
-        total_periods=len(result),
-    )
+    response = response_builder.build_spending_list(current_user.id, period_type, periods)
     analytics_cache.set_spending_list(current_user.id, period_type.value, periods, response)
     return response
 
@@ -178,10 +166,11 @@ async def get_spending_summaries(
     summary="Get current period spending",
     description="Returns detailed spending summary for the current period",
 )
+@_analytics_read()
 async def get_current_spending(
+    request: Request,
     current_user: CurrentUserDep,
-    spending_period_repo: SpendingPeriodRepoDep,
-    category_spending_repo: CategorySpendingRepoDep,
+    response_builder: ResponseBuilderDep,
     analytics_cache: AnalyticsCacheDep,
     period_type: PeriodType = Query(default=PeriodType.MONTHLY, description="Period granularity"),
 ) -> SpendingSummaryResponse:
@@ -189,64 +178,9 @@ async def get_current_spending(
     if cached is not None:
         return cached
 
-    current_period_start = get_current_period_start(period_type)
-    _, period_end = get_period_bounds(current_period_start, period_type)
+    charge(request, limits.analytics_cache_miss_cost)
 
-    period = spending_period_repo.get_by_user_and_period(
-        user_id=current_user.id,
-        period_type=period_type,
-        period_start=current_period_start,
-    )
-
-    categories = category_spending_repo.get_top_categories(
-        user_id=current_user.id,
-        period_type=period_type,
-        period_start=current_period_start,
-        limit=10,
-    )
-
-    total_spending = (
-        Decimal(str(period.get("total_outflow_excluding_transfers", 0))) if period else Decimal("0")
-    )
-    total_income = (
-        Decimal(str(period.get("total_inflow_excluding_transfers", 0))) if period else Decimal("0")
-    )
-    net_flow = (
-        Decimal(str(period.get("net_flow_excluding_transfers", 0))) if period else Decimal("0")
-    )
-    transaction_count = period.get("transaction_count", 0) if period else 0
-
-    top_categories = _build_category_summaries(categories, total_spending)
-
-    previous_period_start = get_previous_period_start(current_period_start, period_type)
-    previous_period = spending_period_repo.get_by_user_and_period(
-        user_id=current_user.id,
-        period_type=period_type,
-        period_start=previous_period_start,
-    )
-
-    mom_change: Decimal | None = None
-    if previous_period:
-        prev_spending = Decimal(str(previous_period.get("total_outflow_excluding_transfers", 0)))
-        if prev_spending > 0:
-            mom_change = ((total_spending - prev_spending) / prev_spending) * 100
-
-    rolling_3mo = spending_period_repo.get_rolling_average(current_user.id, period_type, 3)
-    rolling_6mo = spending_period_repo.get_rolling_average(current_user.id, period_type, 6)
-
-    response = SpendingSummaryResponse(
-        period_type=period_type,
-        period_start=current_period_start,
-        period_end=period_end,
-        total_spending=total_spending,
-        total_income=total_income,
-        net_flow=net_flow,
-        transaction_count=transaction_count,
-        top_categories=top_categories,
-        month_over_month_change=mom_change,
-        rolling_average_3mo=rolling_3mo,
-        rolling_average_6mo=rolling_6mo,
-    )
+    response = response_builder.build_current_spending(current_user.id, period_type)
     analytics_cache.set_current_spending(current_user.id, period_type.value, response)
     return response
 
@@ -257,7 +191,9 @@ async def get_current_spending(
     summary="Get category breakdown",
     description="Returns spending breakdown by category for a specific period",
 )
+@_analytics_read()
 async def get_category_breakdown(
+    request: Request,
     current_user: CurrentUserDep,
     spending_period_repo: SpendingPeriodRepoDep,
     category_spending_repo: CategorySpendingRepoDep,
@@ -276,6 +212,8 @@ async def get_category_breakdown(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     period_start_bound, period_end = get_period_bounds(period_start, period_type)
 
     period = spending_period_repo.get_by_user_and_period(
@@ -293,7 +231,7 @@ async def get_category_breakdown(
     total_spending = (
         Decimal(str(period.get("total_outflow_excluding_transfers", 0))) if period else Decimal("0")
     )
-    category_summaries = _build_category_summaries(categories, total_spending)
+    category_summaries = build_category_summaries(categories, total_spending)
 
     response = CategoryBreakdownResponse(
         period_type=period_type,
@@ -314,7 +252,9 @@ async def get_category_breakdown(
     summary="Get merchant breakdown",
     description="Returns spending breakdown by merchant for a specific period",
 )
+@_analytics_read()
 async def get_merchant_breakdown(
+    request: Request,
     current_user: CurrentUserDep,
     spending_period_repo: SpendingPeriodRepoDep,
     merchant_spending_repo: MerchantSpendingRepoDep,
@@ -334,6 +274,8 @@ async def get_merchant_breakdown(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     period_start_bound, period_end = get_period_bounds(period_start, period_type)
 
     period = spending_period_repo.get_by_user_and_period(
@@ -373,7 +315,9 @@ async def get_merchant_breakdown(
     summary="Get category history (legacy)",
     description="Returns spending history for a specific category (legacy format)",
 )
+@_analytics_read(cost=_HISTORY_COST)
 async def get_category_history(
+    request: Request,
     category: str,
     current_user: CurrentUserDep,
     category_spending_repo: CategorySpendingRepoDep,
@@ -408,7 +352,9 @@ async def get_category_history(
     summary="Get category spending history",
     description="Returns spending history for a specific category with period information",
 )
+@_analytics_read(cost=_HISTORY_COST)
 async def get_category_spending_history(
+    request: Request,
     category_name: str,
     current_user: CurrentUserDep,
     category_spending_repo: CategorySpendingRepoDep,
@@ -449,7 +395,9 @@ async def get_category_spending_history(
     summary="Get merchant history",
     description="Returns spending history for a specific merchant",
 )
+@_analytics_read(cost=_HISTORY_COST)
 async def get_merchant_history(
+    request: Request,
     merchant_name: str,
     current_user: CurrentUserDep,
     merchant_spending_repo: MerchantSpendingRepoDep,
@@ -491,7 +439,9 @@ async def get_merchant_history(
     summary="Get category breakdown for date range",
     description="Returns spending breakdown by category for a custom date range",
 )
+@_analytics_read(cost=_scan_cost)
 async def get_category_breakdown_by_range(
+    request: Request,
     current_user: CurrentUserDep,
     transaction_repo: TransactionRepoDep,
     time_range: Literal["week", "month", "year", "all"] = Query(
@@ -579,7 +529,9 @@ async def get_category_breakdown_by_range(
     summary="Get category detail",
     description="Returns detailed spending for a category with subcategories and merchants",
 )
+@_analytics_read(cost=_scan_cost)
 async def get_category_detail(
+    request: Request,
     category_name: str,
     current_user: CurrentUserDep,
     transaction_repo: TransactionRepoDep,
@@ -718,7 +670,9 @@ async def get_category_detail(
     summary="Get merchant breakdown for date range",
     description="Returns spending breakdown by merchant for a custom date range",
 )
+@_analytics_read(cost=_scan_cost)
 async def get_merchant_breakdown_by_range(
+    request: Request,
     current_user: CurrentUserDep,
     transaction_repo: TransactionRepoDep,
     time_range: Literal["week", "month", "year", "all"] = Query(
@@ -838,7 +792,9 @@ async def trigger_computation(
     summary="Get merchant lifetime statistics",
     description="Returns lifetime statistics for all merchants",
 )
+@_analytics_read()
 async def get_merchant_stats(
+    request: Request,
     current_user: CurrentUserDep,
     merchant_stats_repo: MerchantStatsRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -853,6 +809,8 @@ async def get_merchant_stats(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     sort_field_map: dict[str, SortField] = {
         "spend": "total_lifetime_spend",
         "frequency": "total_transaction_count",
@@ -884,7 +842,9 @@ async def get_merchant_stats(
     summary="Get top merchants",
     description="Returns top merchants by spend or frequency",
 )
+@_analytics_read()
 async def get_top_merchants(
+    request: Request,
     current_user: CurrentUserDep,
     merchant_stats_repo: MerchantStatsRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -898,6 +858,8 @@ async def get_top_merchants(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     if sort_by == "spend":
         merchants = merchant_stats_repo.get_top_by_spend(current_user.id, limit)
     else:
@@ -917,7 +879,9 @@ async def get_top_merchants(
     summary="Get recurring merchants",
     description="Returns merchants linked to recurring streams (subscriptions)",
 )
+@_analytics_read()
 async def get_recurring_merchants(
+    request: Request,
     current_user: CurrentUserDep,
     merchant_stats_repo: MerchantStatsRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -927,6 +891,8 @@ async def get_recurring_merchants(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     merchants = merchant_stats_repo.get_recurring_merchants(current_user.id, limit)
 
     response = MerchantStatsListResponse(
@@ -943,7 +909,9 @@ async def get_recurring_merchants(
     summary="Get merchant detail",
     description="Returns detailed lifetime statistics for a specific merchant",
 )
+@_analytics_read(cost=_HISTORY_COST)
 async def get_merchant_detail(
+    request: Request,
     merchant_name: str,
     current_user: CurrentUserDep,
     merchant_stats_repo: MerchantStatsRepoDep,
@@ -987,7 +955,9 @@ async def trigger_merchant_stats_computation(
     summary="Get cash flow metrics",
     description="Returns cash flow metrics for multiple periods with savings rate",
 )
+@_analytics_read()
 async def get_cash_flow_metrics(
+    request: Request,
     current_user: CurrentUserDep,
     cash_flow_repo: CashFlowRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -997,6 +967,8 @@ async def get_cash_flow_metrics(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     periods_data = cash_flow_repo.get_periods_for_user(
         user_id=current_user.id,
         limit=periods,
@@ -1005,7 +977,7 @@ async def get_cash_flow_metrics(
     avg_savings_rate = cash_flow_repo.get_average_savings_rate(current_user.id, months=6)
 
     response = CashFlowMetricsListResponse(
-        periods=[_to_cash_flow_response(p) for p in periods_data],
+        periods=[to_cash_flow_response(p) for p in periods_data],
         total_periods=len(periods_data),
         average_savings_rate=Decimal(str(avg_savings_rate))
         if avg_savings_rate is not None
@@ -1021,29 +993,27 @@ async def get_cash_flow_metrics(
     summary="Get current month cash flow",
     description="Returns cash flow metrics for the current month",
 )
+@_analytics_read()
 async def get_current_cash_flow(
+    request: Request,
     current_user: CurrentUserDep,
-    cash_flow_repo: CashFlowRepoDep,
+    response_builder: ResponseBuilderDep,
     analytics_cache: AnalyticsCacheDep,
 ) -> CashFlowMetricsResponse:
     cached = analytics_cache.get_cashflow_current(current_user.id)
     if cached is not None:
         return cached
 
-    current_period_start = get_current_period_start(PeriodType.MONTHLY)
+    charge(request, limits.analytics_cache_miss_cost)
 
-    metrics = cash_flow_repo.get_by_user_and_period(
-        user_id=current_user.id,
-        period_start=current_period_start,
-    )
+    response = response_builder.build_current_cash_flow(current_user.id)
 
-    if not metrics:
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cash flow metrics not found for current period",
         )
 
-    response = _to_cash_flow_response(metrics)
     analytics_cache.set_cashflow_current(current_user.id, response)
     return response
 
@@ -1054,7 +1024,9 @@ async def get_current_cash_flow(
     summary="Get detected income sources",
     description="Returns all detected income sources for the user",
 )
+@_analytics_read()
 async def get_income_sources(
+    request: Request,
     current_user: CurrentUserDep,
     income_source_repo: IncomeSourceRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -1064,6 +1036,8 @@ async def get_income_sources(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     sources = income_source_repo.get_by_user_id(
         user_id=current_user.id,
         active_only=active_only,
@@ -1111,30 +1085,6 @@ async def trigger_cash_flow_computation(
     )
 
 
-def _to_cash_flow_response(metrics: dict[str, Any]) -> CashFlowMetricsResponse:
-    return CashFlowMetricsResponse(
-        id=UUID(metrics["id"]),
-        user_id=UUID(metrics["user_id"]),
-        period_start=_parse_date(metrics["period_start"]),
-        total_income=Decimal(str(metrics["total_income"])),
-        total_expenses=Decimal(str(metrics["total_expenses"])),
-        net_cash_flow=Decimal(str(metrics["net_cash_flow"])),
-        savings_rate=Decimal(str(metrics["savings_rate"])) if metrics.get("savings_rate") else None,
-        recurring_expenses=Decimal(str(metrics["recurring_expenses"])),
-        discretionary_expenses=Decimal(str(metrics["discretionary_expenses"])),
-        income_sources_count=metrics["income_sources_count"],
-        expense_categories_count=metrics["expense_categories_count"],
-        largest_expense_category=metrics.get("largest_expense_category"),
-        largest_expense_amount=(
-            Decimal(str(metrics["largest_expense_amount"]))
-            if metrics.get("largest_expense_amount")
-            else None
-        ),
-        created_at=metrics["created_at"],
-        updated_at=metrics["updated_at"],
-    )
-
-
 def _to_income_source_response(source: dict[str, Any]) -> IncomeSourceResponse:
     return IncomeSourceResponse(
         id=UUID(source["id"]),
@@ -1158,34 +1108,6 @@ def _to_income_source_response(source: dict[str, Any]) -> IncomeSourceResponse:
     )
 
 
-def _to_spending_period_with_delta(
-    period: dict[str, Any],
-    previous_period_outflow: Decimal | None,
-    change_amount: Decimal | None,
-    change_percentage: Decimal | None,
-) -> SpendingPeriodWithDelta:
-    return SpendingPeriodWithDelta(
-        id=UUID(period["id"]),
-        user_id=UUID(period["user_id"]),
-        period_type=PeriodType(period["period_type"]),
-        period_start=_parse_date(period["period_start"]),
-        period_end=_parse_date(period["period_end"]),
-        total_inflow=Decimal(str(period["total_inflow"])),
-        total_outflow=Decimal(str(period["total_outflow"])),
-        net_flow=Decimal(str(period["net_flow"])),
-        total_inflow_excluding_transfers=Decimal(str(period["total_inflow_excluding_transfers"])),
-        total_outflow_excluding_transfers=Decimal(str(period["total_outflow_excluding_transfers"])),
-        net_flow_excluding_transfers=Decimal(str(period["net_flow_excluding_transfers"])),
-        transaction_count=period["transaction_count"],
-        is_finalized=period["is_finalized"],
-        created_at=period["created_at"],
-        updated_at=period["updated_at"],
-        previous_period_outflow=previous_period_outflow,
-        change_amount=change_amount,
-        change_percentage=change_percentage,
-    )
-
-
 def _to_merchant_stats_response(merchant: dict[str, Any]) -> MerchantStatsResponse:
     return MerchantStatsResponse(
         id=UUID(merchant["id"]),
@@ -1225,32 +1147,6 @@ def _to_merchant_stats_response(merchant: dict[str, Any]) -> MerchantStatsRespon
     )
 
 
-def _build_category_summaries(
-    categories: list[dict[str, Any]],
-    total_spending: Decimal,
-) -> list[CategorySpendingSummary]:
-    result: list[CategorySpendingSummary] = []
-
-    for cat in categories:
-        amount = Decimal(str(cat["total_amount"]))
-        percentage = (amount / total_spending * 100) if total_spending > 0 else None
-
-        result.append(
-            CategorySpendingSummary(
-                category_primary=cat["category_primary"],
-                category_detailed=cat.get("category_detailed"),
-                total_amount=amount,
-                transaction_count=cat["transaction_count"],
-                average_transaction=Decimal(str(cat["average_transaction"]))
-                if cat.get("average_transaction")
-                else None,
-                percentage_of_total=percentage,
-            )
-        )
-
-    return result
-
-
 def _build_merchant_summaries(
     merchants: list[dict[str, Any]],
     total_spending: Decimal,
@@ -1283,16 +1179,15 @@ def _parse_date(value: str | date) -> date:
     return date.fromisoformat(value)
 
 
-MONTHS_REQUIRED_FOR_TARGET = 3
-
-
 @router.get(
     "/lifestyle-creep/pacing",
     response_model=PacingResponse,
     summary="Get current spending pacing",
     description="Returns real-time pacing status comparing current discretionary spend to target",
 )
+@_analytics_read()
 async def get_pacing_status(
+    request: Request,
     current_user: CurrentUserDep,
     creep_scorer: CreepScorerDep,
     analytics_cache: AnalyticsCacheDep,
@@ -1301,6 +1196,8 @@ async def get_pacing_status(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     pacing = creep_scorer.get_pacing_status(current_user.id)
 
     if not pacing:
@@ -1319,53 +1216,20 @@ async def get_pacing_status(
     summary="Get spending target status",
     description="Returns the status of the user's spending target (building or established)",
 )
+@_analytics_read()
 async def get_target_status(
+    request: Request,
     current_user: CurrentUserDep,
-    baseline_calculator: BaselineCalculatorDep,
-    spending_period_repo: SpendingPeriodRepoDep,
+    response_builder: ResponseBuilderDep,
     analytics_cache: AnalyticsCacheDep,
 ) -> TargetStatusResponse:
     cached = analytics_cache.get_target_status(current_user.id)
     if cached is not None:
         return cached
 
-    baseline_status = baseline_calculator.get_baseline_status(current_user.id)
-
-    if baseline_status.has_baselines:
-        next_review = None
-        if baseline_status.baseline_period_end:
-            next_review = baseline_status.baseline_period_end + timedelta(days=365)
-
-        response = TargetStatusResponse(
-            status=TargetStatusType.ESTABLISHED,
-            months_available=baseline_status.months_count,
-            months_required=MONTHS_REQUIRED_FOR_TARGET,
-            established_at=baseline_status.baseline_period_end,
-            target_period_start=baseline_status.baseline_period_start,
-            target_period_end=baseline_status.baseline_period_end,
-            categories_count=baseline_status.categories_count,
-            next_review_at=next_review,
-        )
-        analytics_cache.set_target_status(current_user.id, response)
-        return response
+    charge(request, limits.analytics_cache_miss_cost)
 
-    periods = spending_period_repo.get_periods_for_user(
-        user_id=current_user.id,
-        period_type=PeriodType.MONTHLY,
-        limit=MONTHS_REQUIRED_FOR_TARGET,
-    )
-    months_available = len(periods)
-
-    response = TargetStatusResponse(
-        status=TargetStatusType.BUILDING,
-        months_available=months_available,
-        months_required=MONTHS_REQUIRED_FOR_TARGET,
-        established_at=None,
-        target_period_start=None,
-        target_period_end=None,
-        categories_count=0,
-        next_review_at=None,
-    )
+    response = response_builder.build_target_status(current_user.id)
     analytics_cache.set_target_status(current_user.id, response)
     return response
 
@@ -1376,7 +1240,9 @@ async def get_target_status(
     summary="Get lifestyle baselines",
     description="Returns the user's lifestyle spending baselines by category",
 )
+@_analytics_read()
 async def get_lifestyle_baselines(
+    request: Request,
     current_user: CurrentUserDep,
     baseline_repo: LifestyleBaselineRepoDep,
     analytics_cache: AnalyticsCacheDep,
@@ -1385,6 +1251,8 @@ async def get_lifestyle_baselines(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     baselines = baseline_repo.get_by_user_id(current_user.id)
 
     if not baselines:
@@ -1509,7 +1377,9 @@ async def reset_lifestyle_baselines(
     summary="Get lifestyle creep summary",
     description="Returns lifestyle creep summary for a specific period",
 )
+@_analytics_read()
 async def get_lifestyle_creep_summary(
+    request: Request,
     current_user: CurrentUserDep,
     creep_scorer: CreepScorerDep,
     analytics_cache: AnalyticsCacheDep,
@@ -1524,6 +1394,8 @@ async def get_lifestyle_creep_summary(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     summary = creep_scorer.get_creep_summary(current_user.id, period_start)
 
     if not summary:
@@ -1542,7 +1414,9 @@ async def get_lifestyle_creep_summary(
     summary="Get lifestyle creep history",
     description="Returns lifestyle creep summaries for multiple periods",
 )
+@_analytics_read()
 async def get_lifestyle_creep_history(
+    request: Request,
     current_user: CurrentUserDep,
     creep_scorer: CreepScorerDep,
     analytics_cache: AnalyticsCacheDep,
@@ -1552,6 +1426,8 @@ async def get_lifestyle_creep_history(
     if cached is not None:
         return cached
 
+    charge(request, limits.analytics_cache_miss_cost)
+
     summaries = creep_scorer.get_creep_history(current_user.id, periods)
 
     response = LifestyleCreepListResponse(
@@ -1568,7 +1444,9 @@ async def get_lifestyle_creep_history(
     summary="Get category creep history",
     description="Returns lifestyle creep history for a specific category",
 )
+@_analytics_read(cost=_HISTORY_COST)
 async def get_category_creep_history(
+    request: Request,
     category_name: str,
     current_user: CurrentUserDep,
     creep_scorer: CreepScorerDep,
@@ -0,0 +1,149 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import BaseModel, ValidationError
+
+from middleware.auth import get_current_user
+from middleware.rate_limit import get_limiter, get_rate_limits
+from models.analytics import (
+    CashFlowMetricsResponse,
+    PacingResponse,
+    SpendingSummaryResponse,
+    TargetStatusResponse,
+)
+from models.auth import AuthenticatedUser
+from models.dashboard import DashboardResponse
+from models.enums import PeriodType
+from models.recurring import UpcomingBillsListResponse
+from observability import get_logger
+from repositories.recurring_stream import RecurringStreamRepository, get_recurring_stream_repository
+from routers.recurring import build_upcoming_bills_response
+from services.analytics.response_builder import (
+    AnalyticsResponseBuilder,
+    get_analytics_response_builder,
+)
+from services.cache.analytics_cache import AnalyticsCache, get_analytics_cache
+from services.cache.base import CacheService, get_cache_service
+from services.cache.recurring_cache import RecurringCache, get_recurring_cache
+
+router = APIRouter()
+limiter = get_limiter()
+limits = get_rate_limits()
+logger = get_logger("routers.dashboard")
+
+CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
+CacheServiceDep = Annotated[CacheService, Depends(get_cache_service)]
+AnalyticsCacheDep = Annotated[AnalyticsCache, Depends(get_analytics_cache)]
+RecurringCacheDep = Annotated[RecurringCache, Depends(get_recurring_cache)]
+ResponseBuilderDep = Annotated[AnalyticsResponseBuilder, Depends(get_analytics_response_builder)]
+RecurringStreamRepoDep = Annotated[
+    RecurringStreamRepository, Depends(get_recurring_stream_repository)
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _DashboardSection:
+    key: str
+    model: type[BaseModel]
+    compute: Callable[[], BaseModel | None]
+    store: Callable[[Any], bool]
+
+
+@router.get(
+    "",
+    response_model=DashboardResponse,
+    summary="Get home screen bundle",
+    description=(
+        "Returns current spending, cash flow, pacing, target status and upcoming bills "
+        "in one response, computing only the sections that are not cached"
+    ),
+)
+@limiter.limit(limits.default)
+async def get_dashboard(
+    request: Request,
+    current_user: CurrentUserDep,
+    cache_service: CacheServiceDep,
+    analytics_cache: AnalyticsCacheDep,
+    recurring_cache: RecurringCacheDep,
+    response_builder: ResponseBuilderDep,
+    recurring_repo: RecurringStreamRepoDep,
+    period_type: PeriodType = Query(default=PeriodType.MONTHLY, description="Period granularity"),
+    upcoming_days: int = Query(
+        default=30, ge=1, le=90, description="Number of days to look ahead for bills"
+    ),
+) -> DashboardResponse:
+    user_id = current_user.id
+
+    sections: dict[str, _DashboardSection] = {
+        "spending": _DashboardSection(
+            key=analytics_cache.current_spending_key(user_id, period_type.value),
+            model=SpendingSummaryResponse,
+            compute=lambda: response_builder.build_current_spending(user_id, period_type),
+            store=lambda r: analytics_cache.set_current_spending(user_id, period_type.value, r),
+        ),
+        "cash_flow": _DashboardSection(
+            key=analytics_cache.cashflow_current_key(user_id),
+            model=CashFlowMetricsResponse,
+            compute=lambda: response_builder.build_current_cash_flow(user_id),
+            store=lambda r: analytics_cache.set_cashflow_current(user_id, r),
+        ),
+        "pacing": _DashboardSection(
+            key=analytics_cache.pacing_key(user_id),
+            model=PacingResponse,
+            compute=lambda: response_builder.build_pacing(user_id),
+            store=lambda r: analytics_cache.set_pacing(user_id, r),
+        ),
+        "target_status": _DashboardSection(
+            key=analytics_cache.target_status_key(user_id),
+            model=TargetStatusResponse,
+            compute=lambda: response_builder.build_target_status(user_id),
+            store=lambda r: analytics_cache.set_target_status(user_id, r),
+        ),
+        "upcoming_bills": _DashboardSection(
+            key=recurring_cache.upcoming_bills_key(user_id, upcoming_days),
+            model=UpcomingBillsListResponse,
+            compute=lambda: build_upcoming_bills_response(recurring_repo, user_id, upcoming_days),
+            store=lambda r: recurring_cache.set_upcoming_bills(user_id, upcoming_days, r),
+        ),
+    }
+
+    raw_values = cache_service.get_many([section.key for section in sections.values()])
+
+    resolved: dict[str, BaseModel | None] = {}
+    missing: list[str] = []
+    for name, raw in zip(sections, raw_values, strict=True):
+        cached = _parse_section(sections[name].model, raw)
+        if cached is None:
+            missing.append(name)
+        else:
+            resolved[name] = cached
+
+    computed = await asyncio.gather(
+        *(asyncio.to_thread(sections[name].compute) for name in missing)
+    )
+
+    for name, value in zip(missing, computed, strict=True):
+        resolved[name] = value
+        if value is not None:
+            sections[name].store(value)
+
+    logger.debug(
+        "dashboard.assembled",
+        user_id=str(user_id),
+        cached_sections=len(sections) - len(missing),
+        computed_sections=len(missing),
+    )
+
+    return DashboardResponse.model_validate(resolved)
+
+
+def _parse_section(model: type[BaseModel], raw: bytes | None) -> BaseModel | None:
+    if raw is None:
+        return None
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError:
+        return None
@@ -1,7 +1,14 @@
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
-from models.common import CacheStatsResponse, DomainCacheStats, HealthResponse
+from models.common import (
+    CacheStatsResponse,
+    DomainCacheStats,
+    HealthResponse,
+    KeyFamilyCacheStats,
+)
 from services.cache.base import get_cache_service
+from services.plaid import get_plaid_service
 
 router = APIRouter()
 
@@ -23,8 +30,24 @@ async def cache_stats() -> CacheStatsResponse:
         total_hits=stats["total_hits"],
         total_misses=stats["total_misses"],
         hit_rate=stats["hit_rate"],
+        total_errors=stats["total_errors"],
+        error_rate=stats["error_rate"],
         domains={
             name: DomainCacheStats(**domain_stats)
             for name, domain_stats in stats["domains"].items()
         },
+        families={
+            name: KeyFamilyCacheStats(**family_stats)
+            for name, family_stats in stats["families"].items()
+        },
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    cache = get_cache_service()
+    plaid_service = get_plaid_service()
+    return PlainTextResponse(
+        cache.render_metrics() + plaid_service.render_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
     )
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated, Any
 from uuid import UUID
 
@@ -18,6 +19,7 @@ from models.plaid import (
 )
 from repositories.account import AccountRepository, get_account_repository
 from repositories.plaid_item import PlaidItemRepository, get_plaid_item_repository
+from services.cache.invalidation import CacheInvalidator, get_cache_invalidator
 from services.encryption import EncryptionService, get_encryption_service
 from services.plaid import PlaidService, get_plaid_service
 
@@ -30,6 +32,7 @@ EncryptionServiceDep = Annotated[EncryptionService, Depends(get_encryption_servi
 PlaidItemRepoDep = Annotated[PlaidItemRepository, Depends(get_plaid_item_repository)]
 AccountRepoDep = Annotated[AccountRepository, Depends(get_account_repository)]
 CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
+CacheInvalidatorDep = Annotated[CacheInvalidator, Depends(get_cache_invalidator)]
 
 
 @router.post(
@@ -73,6 +76,7 @@ async def exchange_public_token(
     encryption_service: EncryptionServiceDep,
     plaid_item_repo: PlaidItemRepoDep,
     account_repo: AccountRepoDep,
+    cache_invalidator: CacheInvalidatorDep,
 ) -> ExchangeTokenResponse:
     try:
         exchange_result = plaid_service.exchange_public_token(exchange_request.public_token)
@@ -94,8 +98,9 @@ async def exchange_public_token(
             plaid_item_repo.update_access_token(plaid_item_id, encrypted_token)
             plaid_item_repo.update_status(plaid_item_id, "active")
 
-            plaid_accounts = plaid_service.get_accounts(access_token)
+            item_info, plaid_accounts = await _fetch_item_and_accounts(plaid_service, access_token)
             _sync_accounts(account_repo, plaid_item_id, plaid_accounts)
+            cache_invalidator.on_account_sync(current_user.id)
 
             updated_accounts = account_repo.get_by_plaid_item_id(plaid_item_id)
             account_responses = [
@@ -114,8 +119,6 @@ async def exchange_public_token(
                 for acc in updated_accounts
             ]
 
-            item_info = plaid_service.get_item(access_token)
-
             plaid_item_response = PlaidItemResponse(
                 id=plaid_item_id,
                 item_id=item_id,
@@ -131,7 +134,7 @@ async def exchange_public_token(
                 status="success",
             )
 
-        item_info = plaid_service.get_item(access_token)
+        item_info, plaid_accounts = await _fetch_item_and_accounts(plaid_service, access_token)
         encrypted_token = encryption_service.encrypt(access_token)
 
         plaid_item_data = PlaidItemCreate(
@@ -144,8 +147,6 @@ async def exchange_public_token(
         created_item = plaid_item_repo.create(plaid_item_data)
         plaid_item_id = UUID(created_item["id"])
 
-        plaid_accounts = plaid_service.get_accounts(access_token)
-
         account_creates = [
             AccountCreate(
                 plaid_item_id=plaid_item_id,
@@ -162,6 +163,7 @@ async def exchange_public_token(
             for acc in plaid_accounts
         ]
         created_accounts = account_repo.create_many(account_creates)
+        cache_invalidator.on_account_sync(current_user.id)
 
         account_responses = [
             AccountResponse(
@@ -203,6 +205,17 @@ async def exchange_public_token(
         ) from e
 
 
+async def _fetch_item_and_accounts(
+    plaid_service: PlaidService,
+    access_token: str,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    item_info, plaid_accounts = await asyncio.gather(
+        asyncio.to_thread(plaid_service.get_item, access_token),
+        asyncio.to_thread(plaid_service.get_accounts, access_token),
+    )
+    return item_info, plaid_accounts
+
+
 def _sync_accounts(
     account_repo: AccountRepository,
     plaid_item_id: UUID,
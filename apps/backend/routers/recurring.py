@@ -38,6 +38,41 @@ RecurringCacheDep = Annotated[RecurringCache, Depends(get_recurring_cache)]
 CacheInvalidatorDep = Annotated[CacheInvalidator, Depends(get_cache_invalidator)]
 
 
+def build_upcoming_bills_response(
+    recurring_repo: RecurringStreamRepository,
+    user_id: UUID,
+    days: int,
+) -> UpcomingBillsListResponse:
+    streams = recurring_repo.get_upcoming(user_id, days_ahead=days)
+    today = date.today()
+
+    bills: list[UpcomingBillResponse] = []
+    total_amount = Decimal("0")
+
+    for stream in streams:
+        predicted = _parse_date(stream.get("predicted_next_date"))
+        if not predicted:
+            continue
+
+        days_until = (predicted - today).days
+        amount = Decimal(str(stream["last_amount"]))
+
+        bills.append(
+            UpcomingBillResponse(
+                stream=_to_stream_response(stream),
+                days_until_due=days_until,
+                expected_amount=amount,
+            )
+        )
+        total_amount += amount
+
+    return UpcomingBillsListResponse(
+        bills=bills,
+        total_amount=total_amount,
+        period_days=days,
+    )
+
+
 def _to_stream_response(stream: dict[str, Any]) -> RecurringStreamResponse:
     return RecurringStreamResponse(
         id=UUID(stream["id"]),
@@ -198,34 +233,7 @@ async def get_upcoming_bills(
     if cached is not None:
         return cached
 
-    streams = recurring_repo.get_upcoming(current_user.id, days_ahead=days)
-    today = date.today()
-
-    bills: list[UpcomingBillResponse] = []
-    total_amount = Decimal("0")
-
-    for stream in streams:
-        predicted = _parse_date(stream.get("predicted_next_date"))
-        if not predicted:
-            continue
-
-        days_until = (predicted - today).days
-        amount = Decimal(str(stream["last_amount"]))
-
-        bills.append(
-            UpcomingBillResponse(
-                stream=_to_stream_response(stream),
-                days_until_due=days_until,
-                expected_amount=amount,
-            )
-        )
-        total_amount += amount
-
-    response = UpcomingBillsListResponse(
-        bills=bills,
-        total_amount=total_amount,
-        period_days=days,
-    )
+    response = build_upcoming_bills_response(recurring_repo, current_user.id, days)
     recurring_cache.set_upcoming_bills(current_user.id, days, response)
     return response
 
@@ -332,5 +340,6 @@ async def sync_recurring(
         total.streams_updated += result.streams_updated
         total.streams_deactivated += result.streams_deactivated
         total.alerts_created += result.alerts_created
+        total.streams_unchanged += result.streams_unchanged
 
     return total
@@ -12,9 +12,8 @@ from models.transaction import (
     TransactionResponse,
     TransactionsListResponse,
 )
-from repositories.account import AccountRepository, get_account_repository
-from repositories.plaid_item import PlaidItemRepository, get_plaid_item_repository
 from repositories.transaction import TransactionRepository, get_transaction_repository
+from services.ownership import OwnershipService, get_ownership_service
 
 router = APIRouter()
 limiter = get_limiter()
@@ -22,8 +21,7 @@ limits = get_rate_limits()
 
 CurrentUserDep = Annotated[AuthenticatedUser, Depends(get_current_user)]
 TransactionRepoDep = Annotated[TransactionRepository, Depends(get_transaction_repository)]
-AccountRepoDep = Annotated[AccountRepository, Depends(get_account_repository)]
-PlaidItemRepoDep = Annotated[PlaidItemRepository, Depends(get_plaid_item_repository)]
+OwnershipDep = Annotated[OwnershipService, Depends(get_ownership_service)]
 
 
 @router.get(
@@ -101,8 +99,7 @@ async def get_transaction(
     transaction_id: UUID,
     current_user: CurrentUserDep,
     transaction_repo: TransactionRepoDep,
-    account_repo: AccountRepoDep,
-    plaid_item_repo: PlaidItemRepoDep,
+    ownership: OwnershipDep,
 ) -> TransactionDetailResponse:
     transaction = transaction_repo.get_by_id(transaction_id)
     if not transaction:
@@ -111,15 +108,7 @@ async def get_transaction(
             detail="Transaction not found",
         )
 
-    account = account_repo.get_by_id(UUID(transaction["account_id"]))
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
-        )
-
-    plaid_item = plaid_item_repo.get_by_id(UUID(account["plaid_item_id"]))
-    if not plaid_item or plaid_item["user_id"] != str(current_user.id):
+    if not ownership.owns_account(current_user.id, UUID(transaction["account_id"])):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found",
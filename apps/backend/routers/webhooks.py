@@ -1,7 +1,9 @@
-from typing import Annotated
+from typing import Annotated, Any
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, Header, Request
 from pydantic import ValidationError
+from starlette.background import BackgroundTask
 from starlette.responses import JSONResponse
 
 from config import Settings, get_settings
@@ -41,30 +43,33 @@ async def receive_plaid_webhook(
     webhook = _parse_webhook_body(raw_body)
 
     idempotency_key = webhook_service.generate_idempotency_key(webhook)
+    payload = webhook.model_dump()
+
+    if webhook_service.is_queue_enabled():
+        response = await _ingest_queued(webhook_service, webhook, idempotency_key, payload)
+        if response is not None:
+            return response
+
     if webhook_service.is_duplicate(idempotency_key):
-        return JSONResponse(
-            content=WebhookAcknowledgeResponse(
-                received=True,
-                event_id=None,
-                status="duplicate",
-            ).model_dump(mode="json"),
-            status_code=200,
-        )
+        return _acknowledge(None, "duplicate")
 
-    payload = webhook.model_dump()
     event_id = webhook_service.store_event(webhook, payload)
 
     enqueued = await webhook_service.enqueue_processing(webhook, event_id, payload)
 
     if enqueued:
-        return JSONResponse(
-            content=WebhookAcknowledgeResponse(
-                received=True,
-                event_id=event_id,
-                status="queued",
-            ).model_dump(mode="json"),
-            status_code=200,
+        return _acknowledge(event_id, "queued")
+
+    if webhook_service.is_queue_enabled():
+        # The event row stays pending and the worker's sweep re-enqueues it, so
+        # sync work never runs on the API process.
+        logger.warning(
+            "webhook.left_for_sweep",
+            event_id=str(event_id),
+            webhook_type=webhook.webhook_type,
+            webhook_code=webhook.webhook_code,
         )
+        return _acknowledge(event_id, "pending")
 
     logger.warning(
         "webhook.fallback_to_background_task",
@@ -75,14 +80,45 @@ async def receive_plaid_webhook(
 
     background_task = webhook_service.create_fallback_background_task(webhook, event_id)
 
+    return _acknowledge(event_id, "accepted", background=background_task)
+
+
+async def _ingest_queued(
+    webhook_service: WebhookService,
+    webhook: PlaidWebhookRequest,
+    idempotency_key: str,
+    payload: dict[str, Any],
+) -> JSONResponse | None:
+    event_id = uuid4()
+
+    # Claiming the key, recording the event and queueing its job is a single
+    # Redis round-trip that replaces the database duplicate check and insert;
+    # the worker persists the event row, and the sweep writes it if the job is
+    # lost first. None means Redis could not be reached, so the caller falls
+    # back to the database path.
+    claimed = await webhook_service.claim_and_enqueue(idempotency_key, event_id, webhook, payload)
+    if claimed is None:
+        return None
+    if not claimed:
+        return _acknowledge(None, "duplicate")
+
+    return _acknowledge(event_id, "queued")
+
+
+def _acknowledge(
+    event_id: UUID | None,
+    status: str,
+    *,
+    background: BackgroundTask | None = None,
+) -> JSONResponse:
     return JSONResponse(
         content=WebhookAcknowledgeResponse(
             received=True,
             event_id=event_id,
-            status="accepted",
+            status=status,
         ).model_dump(mode="json"),
         status_code=200,
-        background=background_task,
+        background=background,
     )
 
 
@@ -7,8 +7,8 @@ case "${SERVICE_TYPE}" in
     exec /app/.venv/bin/uvicorn main:app --host 0.0.0.0 --port "${PORT:-8000}"
     ;;
   worker)
-    echo "Starting ARQ worker..."
-    exec /app/.venv/bin/arq workers.WorkerSettings
+    echo "Starting ARQ worker lanes (${WORKER_LANES:-high,normal,bulk})..."
+    exec /app/.venv/bin/python -m workers.run
     ;;
   *)
     echo "ERROR: SERVICE_TYPE must be 'api' or 'worker' (got '${SERVICE_TYPE}')"
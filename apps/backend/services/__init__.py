@@ -21,6 +21,11 @@ from services.encryption import (
     EncryptionServiceContainer,
     get_encryption_service,
 )
+from services.ownership import (
+    OwnershipService,
+    OwnershipServiceContainer,
+    get_ownership_service,
+)
 from services.plaid import (
     PlaidRecurringResponse,
     PlaidRecurringStream,
@@ -71,6 +76,8 @@ __all__ = [
     "EncryptionService",
     "EncryptionServiceContainer",
     "EnqueueResult",
+    "OwnershipService",
+    "OwnershipServiceContainer",
     "PlaidRecurringResponse",
     "PlaidRecurringStream",
     "PlaidService",
@@ -99,6 +106,7 @@ __all__ = [
     "get_auth_service",
     "get_database_service",
     "get_encryption_service",
+    "get_ownership_service",
     "get_plaid_service",
     "get_recurring_sync_service",
     "get_spending_aggregator",
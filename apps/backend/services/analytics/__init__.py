@@ -55,6 +55,12 @@ from services.analytics.period_calculator import (
     get_previous_period_start,
     is_period_finalized,
 )
+from services.analytics.response_builder import (
+    MONTHS_REQUIRED_FOR_TARGET,
+    AnalyticsResponseBuilder,
+    AnalyticsResponseBuilderContainer,
+    get_analytics_response_builder,
+)
 from services.analytics.spending_aggregator import (
     AggregationResult,
     SpendingAggregator,
@@ -76,8 +82,11 @@ __all__ = [
     "MAX_CREEP_SCORE",
     "MINIMUM_BASELINE_MONTHS",
     "MIN_CREEP_SCORE",
+    "MONTHS_REQUIRED_FOR_TARGET",
     "ROLLING_BASELINE_MONTHS",
     "AggregationResult",
+    "AnalyticsResponseBuilder",
+    "AnalyticsResponseBuilderContainer",
     "BaselineCalculator",
     "BaselineCalculatorContainer",
     "BaselineComputationResult",
@@ -102,6 +111,7 @@ __all__ = [
     "SpendingComputationManagerContainer",
     "TransferDetector",
     "TransferDetectorContainer",
+    "get_analytics_response_builder",
     "get_baseline_calculator",
     "get_cash_flow_aggregator",
     "get_creep_scorer",
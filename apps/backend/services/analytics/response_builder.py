@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from models.analytics import (
+    CashFlowMetricsResponse,
+    CategorySpendingSummary,
+    PacingResponse,
+    SpendingPeriodWithDelta,
+    SpendingSummaryListResponse,
+    SpendingSummaryResponse,
+    TargetStatusResponse,
+    TargetStatusType,
+)
+from models.enums import PeriodType
+from services.analytics.period_calculator import (
+    get_current_period_start,
+    get_period_bounds,
+    get_previous_period_start,
+)
+
+if TYPE_CHECKING:
+    from repositories.cash_flow_metrics import CashFlowMetricsRepository
+    from repositories.category_spending import CategorySpendingRepository
+    from repositories.spending_period import SpendingPeriodRepository
+    from services.analytics.baseline_calculator import BaselineCalculator
+    from services.analytics.creep_scorer import CreepScorer
+
+
+MONTHS_REQUIRED_FOR_TARGET = 3
+
+
+class AnalyticsResponseBuilder:
+    def __init__(
+        self,
+        spending_period_repo: SpendingPeriodRepository,
+        category_spending_repo: CategorySpendingRepository,
+        cash_flow_repo: CashFlowMetricsRepository,
+        baseline_calculator: BaselineCalculator,
+        creep_scorer: CreepScorer,
+    ) -> None:
+        self._spending_period_repo = spending_period_repo
+        self._category_spending_repo = category_spending_repo
+        self._cash_flow_repo = cash_flow_repo
+        self._baseline_calculator = baseline_calculator
+        self._creep_scorer = creep_scorer
+
+    def build_spending_list(
+        self,
+        user_id: UUID,
+        period_type: PeriodType,
+        periods: int,
+    ) -> SpendingSummaryListResponse:
+        periods_data = self._spending_period_repo.get_periods_for_user(
+            user_id=user_id,
+            period_type=period_type,
+            limit=periods + 1,
+        )
+
+        result: list[SpendingPeriodWithDelta] = []
+
+        for i, period in enumerate(periods_data[:periods]):
+            previous_outflow: Decimal | None = None
+            change_amount: Decimal | None = None
+            change_percentage: Decimal | None = None
+
+            if i + 1 < len(periods_data):
+                previous = periods_data[i + 1]
+                previous_outflow = Decimal(
+                    str(previous.get("total_outflow_excluding_transfers", 0))
+                )
+                current_outflow = Decimal(str(period.get("total_outflow_excluding_transfers", 0)))
+
+                change_amount = current_outflow - previous_outflow
+                if previous_outflow > 0:
+                    change_percentage = (change_amount / previous_outflow) * 100
+
+            result.append(
+                to_spending_period_with_delta(
+                    period,
+                    previous_outflow,
+                    change_amount,
+                    change_percentage,
+                )
+            )
+
+        return SpendingSummaryListResponse(
+            periods=result,
+            total_periods=len(result),
+        )
+
+    def build_current_spending(
+        self,
+        user_id: UUID,
+        period_type: PeriodType,
+    ) -> SpendingSummaryResponse:
+        current_period_start = get_current_period_start(period_type)
+        _, period_end = get_period_bounds(current_period_start, period_type)
+
+        period = self._spending_period_repo.get_by_user_and_period(
+            user_id=user_id,
+            period_type=period_type,
+            period_start=current_period_start,
+        )
+
+        categories = self._category_spending_repo.get_top_categories(
+            user_id=user_id,
+            period_type=period_type,
+            period_start=current_period_start,
+            limit=10,
+        )
+
+        total_spending = (
+            Decimal(str(period.get("total_outflow_excluding_transfers", 0)))
+            if period
+            else Decimal("0")
+        )
+        total_income = (
+            Decimal(str(period.get("total_inflow_excluding_transfers", 0)))
+            if period
+            else Decimal("0")
+        )
+        net_flow = (
+            Decimal(str(period.get("net_flow_excluding_transfers", 0))) if period else Decimal("0")
+        )
+        transaction_count = period.get("transaction_count", 0) if period else 0
+
+        top_categories = build_category_summaries(categories, total_spending)
+
+        previous_period_start = get_previous_period_start(current_period_start, period_type)
+        previous_period = self._spending_period_repo.get_by_user_and_period(
+            user_id=user_id,
+            period_type=period_type,
+            period_start=previous_period_start,
+        )
+
+        mom_change: Decimal | None = None
+        if previous_period:
+            prev_spending = Decimal(
+                str(previous_period.get("total_outflow_excluding_transfers", 0))
+            )
+            if prev_spending > 0:
+                mom_change = ((total_spending - prev_spending) / prev_spending) * 100
+
+        rolling_3mo = self._spending_period_repo.get_rolling_average(user_id, period_type, 3)
+        rolling_6mo = self._spending_period_repo.get_rolling_average(user_id, period_type, 6)
+
+        return SpendingSummaryResponse(
+            period_type=period_type,
+            period_start=current_period_start,
+            period_end=period_end,
+            total_spending=total_spending,
+            total_income=total_income,
+            net_flow=net_flow,
+            transaction_count=transaction_count,
+            top_categories=top_categories,
+            month_over_month_change=mom_change,
+            rolling_average_3mo=rolling_3mo,
+            rolling_average_6mo=rolling_6mo,
+        )
+
+    def build_current_cash_flow(self, user_id: UUID) -> CashFlowMetricsResponse | None:
+        current_period_start = get_current_period_start(PeriodType.MONTHLY)
+
+        metrics = self._cash_flow_repo.get_by_user_and_period(
+            user_id=user_id,
+            period_start=current_period_start,
+        )
+        if not metrics:
+            return None
+
+        return to_cash_flow_response(metrics)
+
+    def build_pacing(self, user_id: UUID) -> PacingResponse | None:
+        return self._creep_scorer.get_pacing_status(user_id)
+
+    def build_target_status(self, user_id: UUID) -> TargetStatusResponse:
+        baseline_status = self._baseline_calculator.get_baseline_status(user_id)
+
+        if baseline_status.has_baselines:
+            next_review = None
+            if baseline_status.baseline_period_end:
+                next_review = baseline_status.baseline_period_end + timedelta(days=365)
+
+            return TargetStatusResponse(
+                status=TargetStatusType.ESTABLISHED,
+                months_available=baseline_status.months_count,
+                months_required=MONTHS_REQUIRED_FOR_TARGET,
+                established_at=baseline_status.baseline_period_end,
+                target_period_start=baseline_status.baseline_period_start,
+                target_period_end=baseline_status.baseline_period_end,
+                categories_count=baseline_status.categories_count,
+                next_review_at=next_review,
+            )
+
+        periods = self._spending_period_repo.get_periods_for_user(
+            user_id=user_id,
+            period_type=PeriodType.MONTHLY,
+            limit=MONTHS_REQUIRED_FOR_TARGET,
+        )
+
+        return TargetStatusResponse(
+            status=TargetStatusType.BUILDING,
+            months_available=len(periods),
+            months_required=MONTHS_REQUIRED_FOR_TARGET,
+            established_at=None,
+            target_period_start=None,
+            target_period_end=None,
+            categories_count=0,
+            next_review_at=None,
+        )
+
+
+def to_cash_flow_response(metrics: dict[str, Any]) -> CashFlowMetricsResponse:
+    return CashFlowMetricsResponse(
+        id=UUID(metrics["id"]),
+        user_id=UUID(metrics["user_id"]),
+        period_start=_parse_date(metrics["period_start"]),
+        total_income=Decimal(str(metrics["total_income"])),
+        total_expenses=Decimal(str(metrics["total_expenses"])),
+        net_cash_flow=Decimal(str(metrics["net_cash_flow"])),
+        savings_rate=Decimal(str(metrics["savings_rate"])) if metrics.get("savings_rate") else None,
+        recurring_expenses=Decimal(str(metrics["recurring_expenses"])),
+        discretionary_expenses=Decimal(str(metrics["discretionary_expenses"])),
+        income_sources_count=metrics["income_sources_count"],
+        expense_categories_count=metrics["expense_categories_count"],
+        largest_expense_category=metrics.get("largest_expense_category"),
+        largest_expense_amount=(
+            Decimal(str(metrics["largest_expense_amount"]))
+            if metrics.get("largest_expense_amount")
+            else None
+        ),
+        created_at=metrics["created_at"],
+        updated_at=metrics["updated_at"],
+    )
+
+
+def to_spending_period_with_delta(
+    period: dict[str, Any],
+    previous_period_outflow: Decimal | None,
+    change_amount: Decimal | None,
+    change_percentage: Decimal | None,
+) -> SpendingPeriodWithDelta:
+    return SpendingPeriodWithDelta(
+        id=UUID(period["id"]),
+        user_id=UUID(period["user_id"]),
+        period_type=PeriodType(period["period_type"]),
+        period_start=_parse_date(period["period_start"]),
+        period_end=_parse_date(period["period_end"]),
+        total_inflow=Decimal(str(period["total_inflow"])),
+        total_outflow=Decimal(str(period["total_outflow"])),
+        net_flow=Decimal(str(period["net_flow"])),
+        total_inflow_excluding_transfers=Decimal(str(period["total_inflow_excluding_transfers"])),
+        total_outflow_excluding_transfers=Decimal(str(period["total_outflow_excluding_transfers"])),
+        net_flow_excluding_transfers=Decimal(str(period["net_flow_excluding_transfers"])),
+        transaction_count=period["transaction_count"],
+        is_finalized=period["is_finalized"],
+        created_at=period["created_at"],
+        updated_at=period["updated_at"],
+        previous_period_outflow=previous_period_outflow,
+        change_amount=change_amount,
+        change_percentage=change_percentage,
+    )
+
+
+def build_category_summaries(
+    categories: list[dict[str, Any]],
+    total_spending: Decimal,
+) -> list[CategorySpendingSummary]:
+    result: list[CategorySpendingSummary] = []
+
+    for cat in categories:
+        amount = Decimal(str(cat["total_amount"]))
+        percentage = (amount / total_spending * 100) if total_spending > 0 else None
+
+        result.append(
+            CategorySpendingSummary(
+                category_primary=cat["category_primary"],
+                category_detailed=cat.get("category_detailed"),
+                total_amount=amount,
+                transaction_count=cat["transaction_count"],
+                average_transaction=Decimal(str(cat["average_transaction"]))
+                if cat.get("average_transaction")
+                else None,
+                percentage_of_total=percentage,
+            )
+        )
+
+    return result
+
+
+def _parse_date(value: str | date) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+class AnalyticsResponseBuilderContainer:
+    _instance: AnalyticsResponseBuilder | None = None
+
+    @classmethod
+    def get(cls) -> AnalyticsResponseBuilder:
+        if cls._instance is None:
+            from repositories.cash_flow_metrics import get_cash_flow_metrics_repository
+            from repositories.category_spending import get_category_spending_repository
+            from repositories.spending_period import get_spending_period_repository
+            from services.analytics.baseline_calculator import get_baseline_calculator
+            from services.analytics.creep_scorer import get_creep_scorer
+
+            cls._instance = AnalyticsResponseBuilder(
+                spending_period_repo=get_spending_period_repository(),
+                category_spending_repo=get_category_spending_repository(),
+                cash_flow_repo=get_cash_flow_metrics_repository(),
+                baseline_calculator=get_baseline_calculator(),
+                creep_scorer=get_creep_scorer(),
+            )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_analytics_response_builder() -> AnalyticsResponseBuilder:
+    return AnalyticsResponseBuilderContainer.get()
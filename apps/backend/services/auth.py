@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import math
+import threading
 from uuid import UUID
 
-from errors import UnauthorizedError
+from config import get_settings
+from errors import ServiceUnavailableError, UnauthorizedError
 from models.auth import AuthenticatedUser
 from observability import bind_context, get_logger
 from services.cache.auth_cache import AuthCache, get_auth_cache
 from services.database import DatabaseService, get_database_service
+from services.token_verification import SupabaseTokenVerifier, get_supabase_token_verifier
 
 logger = get_logger("services.auth")
 
@@ -16,41 +20,75 @@ class AuthService:
         self,
         database_service: DatabaseService,
         auth_cache: AuthCache,
+        token_verifier: SupabaseTokenVerifier | None = None,
+        *,
+        max_concurrency: int = 10,
+        acquire_timeout_seconds: float = 1.0,
     ) -> None:
         self._db = database_service
         self._cache = auth_cache
+        self._token_verifier = token_verifier
+        # Caps outbound Supabase Auth calls so a burst of uncached tokens waits
+        # briefly and then gets a 503 instead of fanning out to the auth server.
+        self._remote_slots = threading.BoundedSemaphore(max_concurrency)
+        self._acquire_timeout = acquire_timeout_seconds
 
     def validate_token(self, token: str) -> AuthenticatedUser:
+        if self._token_verifier is not None:
+            local_user = self._token_verifier.verify(token)
+            if local_user is not None:
+                bind_context(user_id=str(local_user.id))
+                return local_user
+
         cached_user = self._cache.get(token)
         if cached_user is not None:
             bind_context(user_id=str(cached_user.id))
             return cached_user
 
+        if self._cache.is_rejected(token):
+            logger.debug("auth.token_invalid", reason="recently_rejected")
+            raise UnauthorizedError(message="Invalid or expired token")
+
+        if not self._remote_slots.acquire(timeout=self._acquire_timeout):
+            logger.warning("auth.validation_saturated")
+            raise ServiceUnavailableError(
+                message="Token validation capacity exhausted",
+                code="FI-503-AUTH_CAPACITY",
+                retry_after_seconds=max(1, math.ceil(self._acquire_timeout)),
+            )
+
+        try:
+            authenticated_user = self._validate_remote(token)
+        finally:
+            self._remote_slots.release()
+
+        bind_context(user_id=str(authenticated_user.id))
+
+        logger.debug(
+            "auth.token_validated",
+            user_id=str(authenticated_user.id),
+        )
+
+        self._cache.set(token, authenticated_user)
+
+        return authenticated_user
+
+    def _validate_remote(self, token: str) -> AuthenticatedUser:
         try:
             response = self._db.service_client.auth.get_user(token)
 
             if response is None or response.user is None:
                 logger.warning("auth.token_invalid", reason="no_user_found")
+                self._cache.set_rejected(token)
                 raise UnauthorizedError(message="Invalid or expired token")
 
             user = response.user
 
-            authenticated_user = AuthenticatedUser(
+            return AuthenticatedUser(
                 id=UUID(user.id),
                 email=user.email,
                 role=user.role or "authenticated",
             )
-
-            bind_context(user_id=str(authenticated_user.id))
-
-            logger.debug(
-                "auth.token_validated",
-                user_id=str(authenticated_user.id),
-            )
-
-            self._cache.set(token, authenticated_user)
-
-            return authenticated_user
         except UnauthorizedError:
             raise
         except Exception as e:
@@ -60,6 +98,7 @@ class AuthService:
                     "auth.token_invalid",
                     reason="invalid_or_expired",
                 )
+                self._cache.set_rejected(token)
                 raise UnauthorizedError(message="Invalid or expired token") from e
 
             logger.exception("auth.validation_failed")
@@ -72,9 +111,21 @@ class AuthServiceContainer:
     @classmethod
     def get(cls) -> AuthService:
         if cls._instance is None:
+            settings = get_settings()
             database_service = get_database_service()
             auth_cache = get_auth_cache()
-            cls._instance = AuthService(database_service, auth_cache)
+            token_verifier = (
+                get_supabase_token_verifier()
+                if settings.supabase_jwt_verification != "remote"
+                else None
+            )
+            cls._instance = AuthService(
+                database_service,
+                auth_cache,
+                token_verifier,
+                max_concurrency=settings.supabase_auth_max_concurrency,
+                acquire_timeout_seconds=settings.supabase_auth_acquire_timeout_seconds,
+            )
         return cls._instance
 
     @classmethod
@@ -16,6 +16,7 @@ from services.cache.recurring_cache import (
     RecurringCacheContainer,
     get_recurring_cache,
 )
+from services.cache.warming import CacheWarmer, CacheWarmerContainer, get_cache_warmer
 
 __all__ = [
     "AccountCache",
@@ -28,6 +29,8 @@ __all__ = [
     "CacheInvalidatorContainer",
     "CacheService",
     "CacheServiceContainer",
+    "CacheWarmer",
+    "CacheWarmerContainer",
     "RecurringCache",
     "RecurringCacheContainer",
     "get_account_cache",
@@ -35,5 +38,6 @@ __all__ = [
     "get_auth_cache",
     "get_cache_invalidator",
     "get_cache_service",
+    "get_cache_warmer",
     "get_recurring_cache",
 ]
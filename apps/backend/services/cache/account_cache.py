@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import ClassVar
 from uuid import UUID
 
-from models.plaid import AccountsListResponse
+from models.plaid import AccountsListResponse, OwnershipIndex
 from observability import get_logger
 from services.cache.base import CacheService, get_cache_service
 
@@ -33,6 +33,19 @@ class AccountCache:
         key = self._key(user_id, "list")
         return self._cache.set(key, response.model_dump_json().encode(), self._ttl)
 
+    def get_ownership_index(self, user_id: UUID) -> OwnershipIndex | None:
+        raw = self._cache.get(self._key(user_id, "ownership"))
+        if raw is None:
+            return None
+        try:
+            return OwnershipIndex.model_validate_json(raw)
+        except Exception:
+            return None
+
+    def set_ownership_index(self, user_id: UUID, index: OwnershipIndex) -> bool:
+        key = self._key(user_id, "ownership")
+        return self._cache.set(key, index.model_dump_json().encode(), self._ttl)
+
     def invalidate_for_user(self, user_id: UUID) -> int:
         pattern = self._cache._build_key(self._DOMAIN, str(user_id), "*")
         return self._cache.delete_pattern(pattern)
@@ -71,10 +71,13 @@ class AnalyticsCache:
 
     # --- Spending ---
 
+    def current_spending_key(self, user_id: UUID, period_type: str) -> str:
+        return self._key(user_id, "spending", "current", period_type)
+
     def get_current_spending(
         self, user_id: UUID, period_type: str
     ) -> SpendingSummaryResponse | None:
-        raw = self._cache.get(self._key(user_id, "spending", "current", period_type))
+        raw = self._cache.get(self.current_spending_key(user_id, period_type))
         if raw is None:
             return None
         try:
@@ -85,7 +88,7 @@ class AnalyticsCache:
     def set_current_spending(
         self, user_id: UUID, period_type: str, response: SpendingSummaryResponse
     ) -> bool:
-        key = self._key(user_id, "spending", "current", period_type)
+        key = self.current_spending_key(user_id, period_type)
         return self._cache.set(key, response.model_dump_json().encode(), self._current_ttl)
 
     def get_spending_list(
@@ -222,8 +225,11 @@ class AnalyticsCache:
 
     # --- Cash Flow ---
 
+    def cashflow_current_key(self, user_id: UUID) -> str:
+        return self._key(user_id, "cashflow", "current")
+
     def get_cashflow_current(self, user_id: UUID) -> CashFlowMetricsResponse | None:
-        raw = self._cache.get(self._key(user_id, "cashflow", "current"))
+        raw = self._cache.get(self.cashflow_current_key(user_id))
         if raw is None:
             return None
         try:
@@ -232,7 +238,7 @@ class AnalyticsCache:
             return None
 
     def set_cashflow_current(self, user_id: UUID, response: CashFlowMetricsResponse) -> bool:
-        key = self._key(user_id, "cashflow", "current")
+        key = self.cashflow_current_key(user_id)
         return self._cache.set(key, response.model_dump_json().encode(), self._current_ttl)
 
     def get_cashflow_list(self, user_id: UUID, periods: int) -> CashFlowMetricsListResponse | None:
@@ -269,8 +275,11 @@ class AnalyticsCache:
 
     # --- Lifestyle Creep ---
 
+    def pacing_key(self, user_id: UUID) -> str:
+        return self._key(user_id, "creep", "pacing")
+
     def get_pacing(self, user_id: UUID) -> PacingResponse | None:
-        raw = self._cache.get(self._key(user_id, "creep", "pacing"))
+        raw = self._cache.get(self.pacing_key(user_id))
         if raw is None:
             return None
         try:
@@ -279,11 +288,14 @@ class AnalyticsCache:
             return None
 
     def set_pacing(self, user_id: UUID, response: PacingResponse) -> bool:
-        key = self._key(user_id, "creep", "pacing")
+        key = self.pacing_key(user_id)
         return self._cache.set(key, response.model_dump_json().encode(), self._pacing_ttl)
 
+    def target_status_key(self, user_id: UUID) -> str:
+        return self._key(user_id, "creep", "target_status")
+
     def get_target_status(self, user_id: UUID) -> TargetStatusResponse | None:
-        raw = self._cache.get(self._key(user_id, "creep", "target_status"))
+        raw = self._cache.get(self.target_status_key(user_id))
         if raw is None:
             return None
         try:
@@ -292,7 +304,7 @@ class AnalyticsCache:
             return None
 
     def set_target_status(self, user_id: UUID, response: TargetStatusResponse) -> bool:
-        key = self._key(user_id, "creep", "target_status")
+        key = self.target_status_key(user_id)
         return self._cache.set(key, response.model_dump_json().encode(), self._creep_ttl)
 
     def get_baselines(self, user_id: UUID) -> LifestyleBaselineListResponse | None:
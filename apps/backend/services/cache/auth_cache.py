@@ -12,14 +12,27 @@ logger = get_logger("services.cache.auth")
 
 class AuthCache:
     _DOMAIN: ClassVar[str] = "auth"
-
-    def __init__(self, cache_service: CacheService, ttl_seconds: int = 300) -> None:
+    _REJECTED: ClassVar[str] = "rejected"
+
+    def __init__(
+        self,
+        cache_service: CacheService,
+        ttl_seconds: int = 300,
+        rejected_ttl_seconds: int = 60,
+    ) -> None:
         self._cache = cache_service
         self._ttl = ttl_seconds
+        self._rejected_ttl = rejected_ttl_seconds
+
+    @staticmethod
+    def _token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()[:32]
 
     def _token_key(self, token: str) -> str:
-        token_hash = hashlib.sha256(token.encode()).hexdigest()[:32]
-        return self._cache._build_key(self._DOMAIN, token_hash)
+        return self._cache._build_key(self._DOMAIN, self._token_hash(token))
+
+    def _rejected_key(self, token: str) -> str:
+        return self._cache._build_key(self._DOMAIN, self._token_hash(token), self._REJECTED)
 
     def get(self, token: str) -> AuthenticatedUser | None:
         key = self._token_key(token)
@@ -43,6 +56,12 @@ class AuthCache:
         key = self._token_key(token)
         return self._cache.delete(key)
 
+    def is_rejected(self, token: str) -> bool:
+        return self._cache.get(self._rejected_key(token)) is not None
+
+    def set_rejected(self, token: str) -> bool:
+        return self._cache.set(self._rejected_key(token), b"1", self._rejected_ttl)
+
 
 class AuthCacheContainer:
     _instance: AuthCache | None = None
@@ -54,7 +73,11 @@ class AuthCacheContainer:
 
             settings = get_settings()
             cache_service = get_cache_service()
-            cls._instance = AuthCache(cache_service, ttl_seconds=settings.cache_auth_ttl_seconds)
+            cls._instance = AuthCache(
+                cache_service,
+                ttl_seconds=settings.cache_auth_ttl_seconds,
+                rejected_ttl_seconds=settings.cache_auth_rejected_ttl_seconds,
+            )
         return cls._instance
 
     @classmethod
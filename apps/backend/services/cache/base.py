@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import contextlib
-from collections import defaultdict
+import time
 from typing import Any, ClassVar
 
 from redis import Redis
@@ -9,6 +8,8 @@ from redis.exceptions import RedisError
 
 from config import Settings, get_settings
 from observability import get_logger
+from services.cache.metrics import CacheMetrics
+from services.redis_pool import RedisPoolManager, get_redis_pool_manager
 
 logger = get_logger("services.cache")
 
@@ -16,20 +17,16 @@ logger = get_logger("services.cache")
 class CacheService:
     _KEY_PREFIX: ClassVar[str] = "fi"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, redis_pool: RedisPoolManager) -> None:
         self._settings = settings
+        self._redis_pool = redis_pool
         self._client: Redis | None = None
         self._enabled = settings.cache_enabled
-        self._stats: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+        self._metrics = CacheMetrics()
 
     def _get_client(self) -> Redis:
         if self._client is None:
-            self._client = Redis.from_url(
-                self._settings.redis_url,
-                decode_responses=False,
-                socket_connect_timeout=5.0,
-                socket_timeout=5.0,
-            )
+            self._client = self._redis_pool.get_client()
         return self._client
 
     def _build_key(self, *parts: str) -> str:
@@ -42,73 +39,121 @@ class CacheService:
             return parts[1]
         return "unknown"
 
+    @staticmethod
+    def _extract_family(key: str) -> str:
+        parts = key.split(":")
+        if len(parts) >= 4 and parts[0] == "fi":
+            return f"{parts[1]}:{parts[3]}"
+        if len(parts) >= 2 and parts[0] == "fi":
+            return parts[1]
+        return "unknown"
+
     def get(self, key: str) -> bytes | None:
         if not self._enabled:
             return None
 
         domain = self._extract_domain(key)
+        started = time.perf_counter()
 
         try:
             client = self._get_client()
             raw_data = client.get(key)
 
             if raw_data is None:
-                self._stats[domain]["misses"] += 1
+                self._metrics.record_miss(domain)
                 logger.debug("cache.miss", key=key)
                 return None
 
             if not isinstance(raw_data, bytes):
-                self._stats[domain]["misses"] += 1
+                self._metrics.record_miss(domain)
                 logger.warning("cache.unexpected_type", key=key, data_type=type(raw_data).__name__)
                 return None
 
-            self._stats[domain]["hits"] += 1
+            self._metrics.record_hit(domain, self._extract_family(key), len(raw_data))
             logger.debug("cache.hit", key=key)
             return raw_data
 
         except RedisError as e:
-            self._stats[domain]["misses"] += 1
+            self._metrics.record_miss(domain)
+            self._metrics.record_error(domain, "get")
             logger.warning("cache.get_failed", key=key, error=str(e))
             return None
+        finally:
+            self._metrics.observe_latency("get", domain, time.perf_counter() - started)
+
+    def get_many(self, keys: list[str]) -> list[bytes | None]:
+        if not self._enabled or not keys:
+            return [None] * len(keys)
+
+        domains = {self._extract_domain(key) for key in keys}
+        started = time.perf_counter()
+
+        try:
+            client = self._get_client()
+            raw_values = client.mget(keys)
+        except RedisError as e:
+            for key in keys:
+                self._metrics.record_miss(self._extract_domain(key))
+            for domain in domains:
+                self._metrics.record_error(domain, "get_many")
+            logger.warning("cache.get_many_failed", key_count=len(keys), error=str(e))
+            return [None] * len(keys)
+        finally:
+            elapsed = time.perf_counter() - started
+            for domain in domains:
+                self._metrics.observe_latency("get_many", domain, elapsed)
+
+        if not isinstance(raw_values, list):
+            logger.warning("cache.unexpected_type", data_type=type(raw_values).__name__)
+            return [None] * len(keys)
+
+        results: list[bytes | None] = []
+        for key, raw_data in zip(keys, raw_values, strict=True):
+            domain = self._extract_domain(key)
+            if isinstance(raw_data, bytes):
+                self._metrics.record_hit(domain, self._extract_family(key), len(raw_data))
+                results.append(raw_data)
+            else:
+                self._metrics.record_miss(domain)
+                results.append(None)
+
+        hits = sum(1 for raw_data in results if raw_data is not None)
+        logger.debug("cache.get_many", key_count=len(keys), hits=hits)
+        return results
 
     def get_stats(self) -> dict[str, Any]:
-        total_hits = sum(d["hits"] for d in self._stats.values())
-        total_misses = sum(d["misses"] for d in self._stats.values())
-        total = total_hits + total_misses
-
-        domains: dict[str, dict[str, Any]] = {}
-        for domain, counts in sorted(self._stats.items()):
-            domain_total = counts["hits"] + counts["misses"]
-            domains[domain] = {
-                "hits": counts["hits"],
-                "misses": counts["misses"],
-                "hit_rate": round(counts["hits"] / domain_total, 4) if domain_total > 0 else 0.0,
-            }
-
-        return {
-            "total_hits": total_hits,
-            "total_misses": total_misses,
-            "hit_rate": round(total_hits / total, 4) if total > 0 else 0.0,
-            "domains": domains,
-        }
+        return self._metrics.snapshot()
+
+    def render_metrics(self) -> str:
+        return self._metrics.render_prometheus()
 
     def set(self, key: str, value: bytes, ttl: int) -> bool:
         if not self._enabled:
             return False
 
+        domain = self._extract_domain(key)
+        started = time.perf_counter()
+
         try:
             client = self._get_client()
             client.setex(key, ttl, value)
+            self._metrics.record_write(self._extract_family(key), len(value))
             logger.debug("cache.set", key=key, ttl_seconds=ttl)
             return True
         except RedisError as e:
+            self._metrics.record_error(domain, "set")
             logger.warning("cache.set_failed", key=key, error=str(e))
             return False
+        finally:
+            self._metrics.observe_latency("set", domain, time.perf_counter() - started)
 
     def delete(self, key: str) -> bool:
         if not self._enabled:
             return False
 
+        domain = self._extract_domain(key)
+        started = time.perf_counter()
+
         try:
             client = self._get_client()
             result = client.delete(key)
@@ -116,13 +161,19 @@ class CacheService:
             logger.debug("cache.delete", key=key, was_present=was_deleted)
             return was_deleted
         except RedisError as e:
+            self._metrics.record_error(domain, "delete")
             logger.warning("cache.delete_failed", key=key, error=str(e))
             return False
+        finally:
+            self._metrics.observe_latency("delete", domain, time.perf_counter() - started)
 
     def delete_pattern(self, pattern: str) -> int:
         if not self._enabled:
             return 0
 
+        domain = self._extract_domain(pattern)
+        started = time.perf_counter()
+
         try:
             client = self._get_client()
             deleted = 0
@@ -139,8 +190,11 @@ class CacheService:
             logger.debug("cache.delete_pattern", pattern=pattern, deleted_count=deleted)
             return deleted
         except RedisError as e:
+            self._metrics.record_error(domain, "delete_pattern")
             logger.warning("cache.delete_pattern_failed", pattern=pattern, error=str(e))
             return 0
+        finally:
+            self._metrics.observe_latency("delete_pattern", domain, time.perf_counter() - started)
 
     def is_available(self) -> bool:
         if not self._enabled:
@@ -154,10 +208,7 @@ class CacheService:
             return False
 
     def close(self) -> None:
-        if self._client is not None:
-            with contextlib.suppress(RedisError):
-                self._client.close()
-            self._client = None
+        self._client = None
 
 
 class CacheServiceContainer:
@@ -167,7 +218,7 @@ class CacheServiceContainer:
     def get(cls) -> CacheService:
         if cls._instance is None:
             settings = get_settings()
-            cls._instance = CacheService(settings)
+            cls._instance = CacheService(settings, get_redis_pool_manager())
         return cls._instance
 
     @classmethod
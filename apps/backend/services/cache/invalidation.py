@@ -51,6 +51,11 @@ class CacheInvalidator:
         count = self._analytics.invalidate_creep_for_user(user_id)
         log.debug("cache.invalidation.creep_computation", keys_deleted=count)
 
+    def on_account_sync(self, user_id: UUID) -> None:
+        log = logger.bind(user_id=str(user_id), event="account_sync")
+        count = self._accounts.invalidate_for_user(user_id)
+        log.debug("cache.invalidation.account_sync", keys_deleted=count)
+
     def on_plaid_item_deleted(self, user_id: UUID) -> None:
         log = logger.bind(user_id=str(user_id), event="plaid_item_deleted")
         count = 0
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+@dataclass(slots=True)
+class Histogram:
+    bounds: tuple[float, ...] = LATENCY_BUCKETS_SECONDS
+    bucket_counts: list[int] = field(init=False)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.bucket_counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def cumulative(self) -> list[int]:
+        result: list[int] = []
+        running = 0
+        for bucket_count in self.bucket_counts:
+            running += bucket_count
+            result.append(running)
+        return result
+
+
+@dataclass(slots=True)
+class _DomainCounters:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _FamilyCounters:
+    bytes_read: int = 0
+    bytes_written: int = 0
+    reads: int = 0
+    writes: int = 0
+
+
+class CacheMetrics:
+    _METRIC_PREFIX: ClassVar[str] = "fi_cache"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._domains: dict[str, _DomainCounters] = defaultdict(_DomainCounters)
+        self._families: dict[str, _FamilyCounters] = defaultdict(_FamilyCounters)
+        self._latency: dict[tuple[str, str], Histogram] = defaultdict(Histogram)
+        self._errors: dict[tuple[str, str], int] = defaultdict(int)
+
+    def record_hit(self, domain: str, family: str, size: int) -> None:
+        with self._lock:
+            self._domains[domain].hits += 1
+            family_counters = self._families[family]
+            family_counters.bytes_read += size
+            family_counters.reads += 1
+
+    def record_miss(self, domain: str) -> None:
+        with self._lock:
+            self._domains[domain].misses += 1
+
+    def record_write(self, family: str, size: int) -> None:
+        with self._lock:
+            family_counters = self._families[family]
+            family_counters.bytes_written += size
+            family_counters.writes += 1
+
+    def record_error(self, domain: str, operation: str) -> None:
+        with self._lock:
+            self._domains[domain].errors += 1
+            self._errors[(domain, operation)] += 1
+
+    def observe_latency(self, operation: str, domain: str, seconds: float) -> None:
+        with self._lock:
+            self._latency[(operation, domain)].observe(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            total_hits = sum(c.hits for c in self._domains.values())
+            total_misses = sum(c.misses for c in self._domains.values())
+            total_errors = sum(c.errors for c in self._domains.values())
+            total_operations = sum(h.count for h in self._latency.values())
+            lookups = total_hits + total_misses
+
+            domains: dict[str, dict[str, Any]] = {}
+            for domain, counters in sorted(self._domains.items()):
+                domain_lookups = counters.hits + counters.misses
+                domain_operations = sum(
+                    h.count for (_, d), h in self._latency.items() if d == domain
+                )
+                domains[domain] = {
+                    "hits": counters.hits,
+                    "misses": counters.misses,
+                    "hit_rate": _ratio(counters.hits, domain_lookups),
+                    "errors": counters.errors,
+                    "error_rate": _ratio(counters.errors, domain_operations),
+                    "get_latency": self._latency_summary("get", domain),
+                    "set_latency": self._latency_summary("set", domain),
+                }
+
+            families: dict[str, dict[str, Any]] = {}
+            for family, family_counters in sorted(self._families.items()):
+                families[family] = {
+                    "bytes_read": family_counters.bytes_read,
+                    "bytes_written": family_counters.bytes_written,
+                    "reads": family_counters.reads,
+                    "writes": family_counters.writes,
+                    "avg_value_bytes": (
+                        round(family_counters.bytes_written / family_counters.writes, 1)
+                        if family_counters.writes > 0
+                        else 0.0
+                    ),
+                }
+
+            return {
+                "total_hits": total_hits,
+                "total_misses": total_misses,
+                "hit_rate": _ratio(total_hits, lookups),
+                "total_errors": total_errors,
+                "error_rate": _ratio(total_errors, total_operations),
+                "domains": domains,
+                "families": families,
+            }
+
+    def render_prometheus(self) -> str:
+        prefix = self._METRIC_PREFIX
+        lines: list[str] = []
+
+        with self._lock:
+            lines.append(f"# HELP {prefix}_lookups_total Cache lookups by domain and result")
+            lines.append(f"# TYPE {prefix}_lookups_total counter")
+            for domain, counters in sorted(self._domains.items()):
+                lines.append(
+                    f'{prefix}_lookups_total{{domain="{domain}",result="hit"}} {counters.hits}'
+                )
+                lines.append(
+                    f'{prefix}_lookups_total{{domain="{domain}",result="miss"}} {counters.misses}'
+                )
+
+            lines.append(f"# HELP {prefix}_errors_total Redis errors by domain and operation")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for (domain, operation), count in sorted(self._errors.items()):
+                lines.append(
+                    f'{prefix}_errors_total{{domain="{domain}",operation="{operation}"}} {count}'
+                )
+
+            lines.append(f"# HELP {prefix}_operation_seconds Cache operation latency")
+            lines.append(f"# TYPE {prefix}_operation_seconds histogram")
+            for (operation, domain), histogram in sorted(self._latency.items()):
+                labels = f'operation="{operation}",domain="{domain}"'
+                for bound, cumulative in zip(
+                    LATENCY_BUCKETS_SECONDS, histogram.cumulative(), strict=True
+                ):
+                    lines.append(
+                        f'{prefix}_operation_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{prefix}_operation_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}'
+                )
+                lines.append(f"{prefix}_operation_seconds_sum{{{labels}}} {histogram.total}")
+                lines.append(f"{prefix}_operation_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append(f"# HELP {prefix}_value_bytes_total Payload bytes by key family")
+            lines.append(f"# TYPE {prefix}_value_bytes_total counter")
+            for family, family_counters in sorted(self._families.items()):
+                lines.append(
+                    f'{prefix}_value_bytes_total{{family="{family}",direction="read"}} '
+                    f"{family_counters.bytes_read}"
+                )
+                lines.append(
+                    f'{prefix}_value_bytes_total{{family="{family}",direction="write"}} '
+                    f"{family_counters.bytes_written}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def _latency_summary(self, operation: str, domain: str) -> dict[str, Any]:
+        histogram = self._latency.get((operation, domain))
+        if histogram is None:
+            return {"count": 0, "avg_ms": 0.0, "buckets": {}}
+
+        return {
+            "count": histogram.count,
+            "avg_ms": round(histogram.total / histogram.count * 1000, 3)
+            if histogram.count > 0
+            else 0.0,
+            "buckets": {
+                str(bound): cumulative
+                for bound, cumulative in zip(
+                    LATENCY_BUCKETS_SECONDS, histogram.cumulative(), strict=True
+                )
+            },
+        }
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator > 0 else 0.0
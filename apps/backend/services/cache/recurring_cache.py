@@ -37,8 +37,11 @@ class RecurringCache:
         key = self._key(user_id, "list", str(active_only).lower())
         return self._cache.set(key, response.model_dump_json().encode(), self._ttl)
 
+    def upcoming_bills_key(self, user_id: UUID, days: int) -> str:
+        return self._key(user_id, "upcoming", str(days))
+
     def get_upcoming_bills(self, user_id: UUID, days: int) -> UpcomingBillsListResponse | None:
-        raw = self._cache.get(self._key(user_id, "upcoming", str(days)))
+        raw = self._cache.get(self.upcoming_bills_key(user_id, days))
         if raw is None:
             return None
         try:
@@ -49,7 +52,7 @@ class RecurringCache:
     def set_upcoming_bills(
         self, user_id: UUID, days: int, response: UpcomingBillsListResponse
     ) -> bool:
-        key = self._key(user_id, "upcoming", str(days))
+        key = self.upcoming_bills_key(user_id, days)
         return self._cache.set(key, response.model_dump_json().encode(), self._ttl)
 
     def invalidate_for_user(self, user_id: UUID) -> int:
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar
+from uuid import UUID
+
+from models.enums import PeriodType
+from observability import get_logger
+
+if TYPE_CHECKING:
+    from services.analytics.response_builder import AnalyticsResponseBuilder
+    from services.cache.analytics_cache import AnalyticsCache
+
+logger = get_logger("services.cache.warming")
+
+
+class CacheWarmer:
+    _PERIOD_TYPE: ClassVar[PeriodType] = PeriodType.MONTHLY
+    _SPENDING_LIST_PERIODS: ClassVar[int] = 6
+
+    def __init__(
+        self,
+        analytics_cache: AnalyticsCache,
+        response_builder: AnalyticsResponseBuilder,
+    ) -> None:
+        self._analytics = analytics_cache
+        self._builder = response_builder
+
+    def on_analytics_computation(self, user_id: UUID) -> int:
+        log = logger.bind(user_id=str(user_id), event="analytics_computation")
+        period_type = self._PERIOD_TYPE
+        periods = self._SPENDING_LIST_PERIODS
+
+        warmers: dict[str, Callable[[], bool]] = {
+            "spending_current": lambda: self._analytics.set_current_spending(
+                user_id,
+                period_type.value,
+                self._builder.build_current_spending(user_id, period_type),
+            ),
+            "spending_list": lambda: self._analytics.set_spending_list(
+                user_id,
+                period_type.value,
+                periods,
+                self._builder.build_spending_list(user_id, period_type, periods),
+            ),
+            "cashflow_current": lambda: self._warm_cashflow_current(user_id),
+            "pacing": lambda: self._warm_pacing(user_id),
+            "target_status": lambda: self._analytics.set_target_status(
+                user_id, self._builder.build_target_status(user_id)
+            ),
+        }
+
+        warmed = 0
+        for name, warm in warmers.items():
+            try:
+                if warm():
+                    warmed += 1
+            except Exception as e:
+                log.warning("cache.warming.section_failed", section=name, error=str(e))
+
+        log.debug("cache.warming.analytics_computation", keys_warmed=warmed)
+        return warmed
+
+    def _warm_cashflow_current(self, user_id: UUID) -> bool:
+        response = self._builder.build_current_cash_flow(user_id)
+        if response is None:
+            return False
+        return self._analytics.set_cashflow_current(user_id, response)
+
+    def _warm_pacing(self, user_id: UUID) -> bool:
+        response = self._builder.build_pacing(user_id)
+        if response is None:
+            return False
+        return self._analytics.set_pacing(user_id, response)
+
+
+class CacheWarmerContainer:
+    _instance: CacheWarmer | None = None
+
+    @classmethod
+    def get(cls) -> CacheWarmer:
+        if cls._instance is None:
+            from services.analytics.response_builder import get_analytics_response_builder
+            from services.cache.analytics_cache import get_analytics_cache
+
+            cls._instance = CacheWarmer(
+                analytics_cache=get_analytics_cache(),
+                response_builder=get_analytics_response_builder(),
+            )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_cache_warmer() -> CacheWarmer:
+    return CacheWarmerContainer.get()
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+
+# Fingerprint of a row as written to the database; syncs compare it with the
+# stored content_hash column to skip rewriting rows Plaid resent unchanged.
+def content_hash(row: dict[str, Any]) -> str:
+    payload = json.dumps(row, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
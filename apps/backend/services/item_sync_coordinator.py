@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import ClassVar
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from config import Settings, get_settings
+from observability import get_logger
+from services.redis_pool import RedisPoolManager, get_redis_pool_manager
+
+logger = get_logger("services.item_sync_coordinator")
+
+# Releases the lock unless another sync was requested while it was held; in that
+# case the TTL is extended and the holder must run again. -1 means the lock was lost.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return -1
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return 0
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_ABANDON_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ItemSyncLease:
+    item_id: str
+    token: str
+    locked: bool
+
+
+class ItemSyncCoordinator:
+    _KEY_PREFIX: ClassVar[str] = "finance-interceptor:item-sync"
+
+    def __init__(self, settings: Settings, redis_pool: RedisPoolManager) -> None:
+        self._settings = settings
+        self._redis_pool = redis_pool
+        self._ttl_ms = settings.webhook_item_sync_lock_ttl_seconds * 1000
+
+    def _get_redis(self) -> Redis:
+        return self._redis_pool.get_arq_redis()
+
+    def _lock_key(self, item_id: str) -> str:
+        return f"{self._KEY_PREFIX}:lock:{item_id}"
+
+    def _pending_key(self, item_id: str) -> str:
+        return f"{self._KEY_PREFIX}:pending:{item_id}"
+
+    async def acquire(self, item_id: str) -> ItemSyncLease | None:
+        token = uuid.uuid4().hex
+
+        try:
+            async with self._get_redis().pipeline(transaction=True) as pipe:
+                pipe.set(self._pending_key(item_id), token, px=self._ttl_ms)
+                pipe.set(self._lock_key(item_id), token, nx=True, px=self._ttl_ms)
+                _, acquired = await pipe.execute()
+        except RedisError as e:
+            logger.warning("item_sync.acquire_failed", item_id=item_id, error=str(e))
+            return ItemSyncLease(item_id=item_id, token=token, locked=False)
+
+        if not acquired:
+            logger.info("item_sync.coalesced", item_id=item_id)
+            return None
+
+        logger.debug("item_sync.lock_acquired", item_id=item_id)
+        return ItemSyncLease(item_id=item_id, token=token, locked=True)
+
+    async def begin_run(self, lease: ItemSyncLease) -> None:
+        if not lease.locked:
+            return
+
+        try:
+            async with self._get_redis().pipeline(transaction=True) as pipe:
+                pipe.delete(self._pending_key(lease.item_id))
+                pipe.pexpire(self._lock_key(lease.item_id), self._ttl_ms)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning("item_sync.begin_run_failed", item_id=lease.item_id, error=str(e))
+
+    @contextlib.asynccontextmanager
+    async def hold(self, lease: ItemSyncLease) -> AsyncIterator[None]:
+        # A sync can outlive the lock TTL, so keep extending it while the run is
+        # in progress instead of letting a second worker start on the same item.
+        if not lease.locked:
+            yield
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(lease))
+        try:
+            yield
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _heartbeat(self, lease: ItemSyncLease) -> None:
+        interval = self._ttl_ms / 3000
+        script = self._get_redis().register_script(_RENEW_SCRIPT)
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await script(
+                    keys=[self._lock_key(lease.item_id)], args=[lease.token, self._ttl_ms]
+                )
+            except RedisError as e:
+                logger.warning("item_sync.renew_failed", item_id=lease.item_id, error=str(e))
+                continue
+
+            if not renewed:
+                logger.warning("item_sync.lock_lost", item_id=lease.item_id)
+                return
+
+    async def release(self, lease: ItemSyncLease) -> bool:
+        if not lease.locked:
+            return True
+
+        try:
+            script = self._get_redis().register_script(_RELEASE_SCRIPT)
+            outcome = await script(
+                keys=[self._lock_key(lease.item_id), self._pending_key(lease.item_id)],
+                args=[lease.token, self._ttl_ms],
+            )
+        except RedisError as e:
+            logger.warning("item_sync.release_failed", item_id=lease.item_id, error=str(e))
+            return True
+
+        if outcome == -1:
+            logger.warning("item_sync.lock_lost", item_id=lease.item_id)
+        return bool(outcome != 0)
+
+    async def abandon(self, lease: ItemSyncLease) -> None:
+        if not lease.locked:
+            return
+
+        try:
+            script = self._get_redis().register_script(_ABANDON_SCRIPT)
+            await script(keys=[self._lock_key(lease.item_id)], args=[lease.token])
+        except RedisError as e:
+            logger.warning("item_sync.abandon_failed", item_id=lease.item_id, error=str(e))
+
+
+class ItemSyncCoordinatorContainer:
+    _instance: ItemSyncCoordinator | None = None
+
+    @classmethod
+    def get(cls) -> ItemSyncCoordinator:
+        if cls._instance is None:
+            cls._instance = ItemSyncCoordinator(get_settings(), get_redis_pool_manager())
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_item_sync_coordinator() -> ItemSyncCoordinator:
+    return ItemSyncCoordinatorContainer.get()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from models.plaid import OwnershipIndex
+from observability import get_logger
+
+if TYPE_CHECKING:
+    from repositories.account import AccountRepository
+    from repositories.plaid_item import PlaidItemRepository
+    from services.cache.account_cache import AccountCache
+
+logger = get_logger("services.ownership")
+
+
+class OwnershipService:
+    def __init__(
+        self,
+        plaid_item_repo: PlaidItemRepository,
+        account_repo: AccountRepository,
+        account_cache: AccountCache,
+    ) -> None:
+        self._plaid_item_repo = plaid_item_repo
+        self._account_repo = account_repo
+        self._account_cache = account_cache
+
+    def get_index(self, user_id: UUID) -> OwnershipIndex:
+        cached = self._account_cache.get_ownership_index(user_id)
+        if cached is not None:
+            return cached
+        return self.refresh_index(user_id)
+
+    def refresh_index(self, user_id: UUID) -> OwnershipIndex:
+        plaid_items = self._plaid_item_repo.get_by_user_id(user_id)
+        accounts = self._account_repo.get_by_plaid_item_ids(
+            [UUID(item["id"]) for item in plaid_items]
+        )
+        return self.remember(user_id, plaid_items, accounts)
+
+    def remember(
+        self,
+        user_id: UUID,
+        plaid_items: list[dict[str, Any]],
+        accounts: list[dict[str, Any]],
+    ) -> OwnershipIndex:
+        index = OwnershipIndex(
+            plaid_item_ids=[UUID(item["id"]) for item in plaid_items],
+            account_plaid_items={UUID(acc["id"]): UUID(acc["plaid_item_id"]) for acc in accounts},
+        )
+        self._account_cache.set_ownership_index(user_id, index)
+        logger.debug(
+            "ownership.index_built",
+            user_id=str(user_id),
+            plaid_item_count=len(index.plaid_item_ids),
+            account_count=len(index.account_plaid_items),
+        )
+        return index
+
+    def get_plaid_item_for_account(self, user_id: UUID, account_id: UUID) -> UUID | None:
+        plaid_item_id = self.get_index(user_id).account_plaid_items.get(account_id)
+        if plaid_item_id is not None:
+            return plaid_item_id
+        # A miss may come from an index cached before the account was linked.
+        return self.refresh_index(user_id).account_plaid_items.get(account_id)
+
+    def owns_account(self, user_id: UUID, account_id: UUID) -> bool:
+        return self.get_plaid_item_for_account(user_id, account_id) is not None
+
+    def owns_plaid_item(self, user_id: UUID, plaid_item_id: UUID) -> bool:
+        if self.get_index(user_id).owns_plaid_item(plaid_item_id):
+            return True
+        return self.refresh_index(user_id).owns_plaid_item(plaid_item_id)
+
+
+class OwnershipServiceContainer:
+    _instance: OwnershipService | None = None
+
+    @classmethod
+    def get(cls) -> OwnershipService:
+        if cls._instance is None:
+            from repositories.account import get_account_repository
+            from repositories.plaid_item import get_plaid_item_repository
+            from services.cache.account_cache import get_account_cache
+
+            cls._instance = OwnershipService(
+                plaid_item_repo=get_plaid_item_repository(),
+                account_repo=get_account_repository(),
+                account_cache=get_account_cache(),
+            )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_ownership_service() -> OwnershipService:
+    return OwnershipServiceContainer.get()
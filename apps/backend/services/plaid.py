@@ -1,9 +1,16 @@
+import json
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import date
 from decimal import Decimal
 from typing import Any, ClassVar
 
 import plaid
 from plaid.api import plaid_api
+from plaid.exceptions import ApiException
 from plaid.model.accounts_get_request import AccountsGetRequest
 from plaid.model.country_code import CountryCode
 from plaid.model.item_get_request import ItemGetRequest
@@ -14,10 +21,13 @@ from plaid.model.products import Products
 from plaid.model.transactions_recurring_get_request import TransactionsRecurringGetRequest
 from plaid.model.transactions_sync_request import TransactionsSyncRequest
 from plaid.model.webhook_verification_key_get_request import WebhookVerificationKeyGetRequest
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from config import Settings, get_settings
 from models.transaction import PlaidTransactionData
 from observability import get_logger
+from services.plaid_metrics import PlaidMetrics
 
 logger = get_logger("services.plaid")
 
@@ -141,6 +151,17 @@ class PlaidRecurringResponse:
         self.updated_datetime = updated_datetime
 
 
+def _error_code(error: Exception) -> str:
+    if isinstance(error, ApiException):
+        try:
+            body = json.loads(error.body or "{}")
+        except (TypeError, ValueError):
+            body = {}
+        code = body.get("error_code") if isinstance(body, dict) else None
+        return str(code) if code else f"http_{error.status}"
+    return type(error).__name__
+
+
 class PlaidServiceError(Exception):
     def __init__(self, message: str = "Plaid operation failed") -> None:
         self.message = message
@@ -156,8 +177,15 @@ class PlaidService:
 
     _DEFAULT_REDIRECT_URI: ClassVar[str] = "https://auth.expo.io/@pnaresh/finance-interceptor"
 
+    # Sync-style endpoints page through large result sets and routinely take
+    # far longer than the other calls, so they get their own read timeout.
+    _SYNC_ENDPOINTS: ClassVar[frozenset[str]] = frozenset(
+        {"transactions_sync", "transactions_recurring_get"}
+    )
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        self._metrics = PlaidMetrics()
         self._client = self._create_client()
 
     def _create_client(self) -> plaid_api.PlaidApi:
@@ -172,9 +200,59 @@ class PlaidService:
                 "secret": self._settings.plaid_secret,
             },
         )
+        # One pool per process is shared by the API, the inline webhook path and
+        # every worker task, since PlaidService is a process-wide singleton.
+        configuration.connection_pool_maxsize = self._settings.plaid_pool_maxsize
+        configuration.retries = Retry(
+            total=self._settings.plaid_connect_retries,
+            connect=self._settings.plaid_connect_retries,
+            read=0,
+            status=0,
+            backoff_factor=0.25,
+        )
+        configuration.socket_options = [
+            *HTTPConnection.default_socket_options,
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
         api_client = plaid.ApiClient(configuration)
         return plaid_api.PlaidApi(api_client)
 
+    def _timeout(self, endpoint: str) -> tuple[float, float]:
+        read_timeout = (
+            self._settings.plaid_sync_read_timeout_seconds
+            if endpoint in self._SYNC_ENDPOINTS
+            else self._settings.plaid_read_timeout_seconds
+        )
+        return self._settings.plaid_connect_timeout_seconds, read_timeout
+
+    def _call(self, endpoint: str, method: Callable[..., Any], request: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            response = method(request, _request_timeout=self._timeout(endpoint))
+        except Exception as e:
+            self._record(endpoint, started, _error_code(e))
+            raise
+        self._record(endpoint, started)
+        return response
+
+    def _record(self, endpoint: str, started: float, error_code: str | None = None) -> None:
+        elapsed = time.perf_counter() - started
+        self._metrics.observe(endpoint, elapsed, error_code)
+        if error_code is None:
+            logger.debug(
+                "plaid.request.completed", endpoint=endpoint, duration_ms=round(elapsed * 1000, 1)
+            )
+        else:
+            logger.warning(
+                "plaid.request.failed",
+                endpoint=endpoint,
+                error_code=error_code,
+                duration_ms=round(elapsed * 1000, 1),
+            )
+
+    def render_metrics(self) -> str:
+        return self._metrics.render_prometheus()
+
     def create_link_token(
         self,
         user_id: str,
@@ -196,7 +274,7 @@ class PlaidService:
             request_params["webhook"] = self._settings.plaid_webhook_url
 
         request = LinkTokenCreateRequest(**request_params)
-        response = self._client.link_token_create(request)
+        response = self._call("link_token_create", self._client.link_token_create, request)
 
         log.info("plaid.link_token.created")
         result: dict[str, str] = response.to_dict()
@@ -206,7 +284,9 @@ class PlaidService:
         logger.info("plaid.public_token.exchanging")
 
         request = ItemPublicTokenExchangeRequest(public_token=public_token)
-        response = self._client.item_public_token_exchange(request)
+        response = self._call(
+            "item_public_token_exchange", self._client.item_public_token_exchange, request
+        )
 
         logger.info(
             "plaid.public_token.exchanged",
@@ -222,7 +302,7 @@ class PlaidService:
         logger.debug("plaid.item.fetching")
 
         request = ItemGetRequest(access_token=access_token)
-        response = self._client.item_get(request)
+        response = self._call("item_get", self._client.item_get, request)
         item = response.item
 
         logger.debug(
@@ -241,7 +321,7 @@ class PlaidService:
         logger.debug("plaid.accounts.fetching")
 
         request = AccountsGetRequest(access_token=access_token)
-        response = self._client.accounts_get(request)
+        response = self._call("accounts_get", self._client.accounts_get, request)
 
         accounts = []
         for account in response.accounts:
@@ -286,7 +366,7 @@ class PlaidService:
             request_params["cursor"] = cursor
 
         request = TransactionsSyncRequest(**request_params)
-        response = self._client.transactions_sync(request)
+        response = self._call("transactions_sync", self._client.transactions_sync, request)
 
         added = [self._parse_transaction(t) for t in response.added]
         modified = [self._parse_transaction(t) for t in response.modified]
@@ -317,7 +397,9 @@ class PlaidService:
             request_params["account_ids"] = account_ids
 
         request = TransactionsRecurringGetRequest(**request_params)
-        response = self._client.transactions_recurring_get(request)
+        response = self._call(
+            "transactions_recurring_get", self._client.transactions_recurring_get, request
+        )
 
         response_dict = response.to_dict()
 
@@ -345,7 +427,9 @@ class PlaidService:
         log.debug("plaid.webhook_verification_key.fetching")
 
         request = WebhookVerificationKeyGetRequest(key_id=key_id)
-        response = self._client.webhook_verification_key_get(request)
+        response = self._call(
+            "webhook_verification_key_get", self._client.webhook_verification_key_get, request
+        )
 
         key_data = response.to_dict().get("key", {})
 
@@ -417,6 +501,43 @@ class PlaidService:
         )
 
 
+# Caps concurrent Plaid calls per institution across every fan-out in the
+# process, so syncing many items never bursts one institution's rate limit.
+class InstitutionLimiter:
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, institution_id: str) -> Iterator[None]:
+        with self._lock:
+            semaphore = self._semaphores.get(institution_id)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._limit)
+                self._semaphores[institution_id] = semaphore
+        with semaphore:
+            yield
+
+
+class InstitutionLimiterContainer:
+    _instance: InstitutionLimiter | None = None
+
+    @classmethod
+    def get(cls) -> InstitutionLimiter:
+        if cls._instance is None:
+            cls._instance = InstitutionLimiter(get_settings().plaid_institution_concurrency)
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_institution_limiter() -> InstitutionLimiter:
+    return InstitutionLimiterContainer.get()
+
+
 class PlaidServiceContainer:
     _instance: PlaidService | None = None
 
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import ClassVar
+
+from services.cache.metrics import Histogram
+
+PLAID_LATENCY_BUCKETS_SECONDS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def _plaid_histogram() -> Histogram:
+    return Histogram(bounds=PLAID_LATENCY_BUCKETS_SECONDS)
+
+
+class PlaidMetrics:
+    _METRIC_PREFIX: ClassVar[str] = "fi_plaid"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[str, Histogram] = defaultdict(_plaid_histogram)
+        self._errors: dict[tuple[str, str], int] = defaultdict(int)
+
+    def observe(self, endpoint: str, seconds: float, error_code: str | None = None) -> None:
+        with self._lock:
+            self._latency[endpoint].observe(seconds)
+            if error_code is not None:
+                self._errors[(endpoint, error_code)] += 1
+
+    def render_prometheus(self) -> str:
+        prefix = self._METRIC_PREFIX
+        lines: list[str] = []
+
+        with self._lock:
+            lines.append(f"# HELP {prefix}_request_seconds Plaid API request latency by endpoint")
+            lines.append(f"# TYPE {prefix}_request_seconds histogram")
+            for endpoint, histogram in sorted(self._latency.items()):
+                labels = f'endpoint="{endpoint}"'
+                for bound, cumulative in zip(
+                    PLAID_LATENCY_BUCKETS_SECONDS, histogram.cumulative(), strict=True
+                ):
+                    lines.append(
+                        f'{prefix}_request_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{prefix}_request_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}'
+                )
+                lines.append(f"{prefix}_request_seconds_sum{{{labels}}} {histogram.total}")
+                lines.append(f"{prefix}_request_seconds_count{{{labels}}} {histogram.count}")
+
+            lines.append(f"# HELP {prefix}_errors_total Plaid API errors by endpoint and code")
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for (endpoint, code), count in sorted(self._errors.items()):
+                lines.append(
+                    f'{prefix}_errors_total{{endpoint="{endpoint}",error_code="{code}"}} {count}'
+                )
+
+        return "\n".join(lines) + "\n"
@@ -15,6 +15,8 @@ from services.recurring.price_sensitivity import (
 if TYPE_CHECKING:
     from repositories.alert import AlertRepository
 
+ALERT_DEDUPE_WINDOW_HOURS = 168
+
 
 class AlertDetectionService:
     def __init__(self, alert_repo: AlertRepository) -> None:
@@ -26,12 +28,15 @@ class AlertDetectionService:
         existing: dict[str, Any] | None,
         updated: PlaidRecurringStream,
         stream_id: UUID | None = None,
+        recent_alert_types: set[AlertType] | None = None,
     ) -> list[AlertCreate]:
         alerts: list[AlertCreate] = []
 
         if existing is None:
             if updated.status.upper() == "EARLY_DETECTION":
-                alert = self._create_new_subscription_alert(user_id, updated, stream_id)
+                alert = self._create_new_subscription_alert(
+                    user_id, updated, stream_id, recent_alert_types
+                )
                 if alert:
                     alerts.append(alert)
             return alerts
@@ -40,7 +45,9 @@ class AlertDetectionService:
         updated_status_str = updated.status.upper()
 
         if existing_status == StreamStatus.MATURE:
-            price_alert = self._detect_price_change(user_id, existing, updated, stream_id)
+            price_alert = self._detect_price_change(
+                user_id, existing, updated, stream_id, recent_alert_types
+            )
             if price_alert:
                 alerts.append(price_alert)
 
@@ -48,18 +55,37 @@ class AlertDetectionService:
         was_active = existing.get("is_active", True)
 
         if existing_status != StreamStatus.TOMBSTONED and is_becoming_inactive and was_active:
-            cancelled_alert = self._create_cancelled_alert(user_id, existing, stream_id)
+            cancelled_alert = self._create_cancelled_alert(
+                user_id, existing, stream_id, recent_alert_types
+            )
             if cancelled_alert:
                 alerts.append(cancelled_alert)
 
         return alerts
 
+    # A sync that prefetched the recent alerts for its streams passes them in
+    # so deduplication does not cost a query per alert.
+    def _has_recent_alert(
+        self,
+        stream_id: UUID | None,
+        alert_type: AlertType,
+        recent_alert_types: set[AlertType] | None,
+    ) -> bool:
+        if not stream_id:
+            return False
+        if recent_alert_types is not None:
+            return alert_type in recent_alert_types
+        return self._alert_repo.exists_for_stream_and_type(
+            stream_id, alert_type, since_hours=ALERT_DEDUPE_WINDOW_HOURS
+        )
+
     def _detect_price_change(
         self,
         user_id: UUID,
         existing: dict[str, Any],
         updated: PlaidRecurringStream,
         stream_id: UUID | None,
+        recent_alert_types: set[AlertType] | None,
     ) -> AlertCreate | None:
         previous_str = existing.get("last_amount")
         if previous_str is None:
@@ -78,15 +104,11 @@ class AlertDetectionService:
         if abs(change_percentage) < threshold * Decimal("100"):
             return None
 
-        if stream_id:
-            alert_type = (
-                AlertType.PRICE_INCREASE if change_percentage > 0 else AlertType.PRICE_DECREASE
-            )
-            if self._alert_repo.exists_for_stream_and_type(stream_id, alert_type, since_hours=168):
-                return None
+        alert_type = AlertType.PRICE_INCREASE if change_percentage > 0 else AlertType.PRICE_DECREASE
+        if self._has_recent_alert(stream_id, alert_type, recent_alert_types):
+            return None
 
         severity = self._determine_severity(change_percentage)
-        alert_type = AlertType.PRICE_INCREASE if change_percentage > 0 else AlertType.PRICE_DECREASE
         merchant = existing.get("merchant_name") or existing.get("description", "Unknown")
         change_amount = current - previous
 
@@ -116,10 +138,9 @@ class AlertDetectionService:
         user_id: UUID,
         stream: PlaidRecurringStream,
         stream_id: UUID | None,
+        recent_alert_types: set[AlertType] | None,
     ) -> AlertCreate | None:
-        if stream_id and self._alert_repo.exists_for_stream_and_type(
-            stream_id, AlertType.NEW_SUBSCRIPTION, since_hours=168
-        ):
+        if self._has_recent_alert(stream_id, AlertType.NEW_SUBSCRIPTION, recent_alert_types):
             return None
 
         merchant = stream.merchant_name or stream.description
@@ -151,10 +172,9 @@ class AlertDetectionService:
         user_id: UUID,
         existing: dict[str, Any],
         stream_id: UUID | None,
+        recent_alert_types: set[AlertType] | None,
     ) -> AlertCreate | None:
-        if stream_id and self._alert_repo.exists_for_stream_and_type(
-            stream_id, AlertType.CANCELLED_SUBSCRIPTION, since_hours=168
-        ):
+        if self._has_recent_alert(stream_id, AlertType.CANCELLED_SUBSCRIPTION, recent_alert_types):
             return None
 
         merchant = existing.get("merchant_name") or existing.get("description", "Unknown")
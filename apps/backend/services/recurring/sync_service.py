@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from models.enums import FrequencyType, StreamStatus, StreamType
 from models.recurring import AlertCreate, RecurringStreamCreate, RecurringSyncResult
 from observability import get_logger
+from services.content_hash import content_hash
 from services.plaid import PlaidRecurringStream
+from services.recurring.alert_detection import ALERT_DEDUPE_WINDOW_HOURS
 
 if TYPE_CHECKING:
     from repositories.account import AccountRepository
@@ -14,7 +17,7 @@ if TYPE_CHECKING:
     from repositories.plaid_item import PlaidItemRepository
     from repositories.recurring_stream import RecurringStreamRepository
     from services.encryption import EncryptionService
-    from services.plaid import PlaidService
+    from services.plaid import InstitutionLimiter, PlaidService
     from services.recurring.alert_detection import AlertDetectionService
 
 logger = get_logger("services.recurring_sync")
@@ -36,6 +39,9 @@ class RecurringSyncService:
         recurring_stream_repo: RecurringStreamRepository,
         alert_repo: AlertRepository,
         alert_detection_service: AlertDetectionService,
+        *,
+        institution_limiter: InstitutionLimiter,
+        item_concurrency: int = 4,
     ) -> None:
         self._plaid_service = plaid_service
         self._encryption_service = encryption_service
@@ -44,6 +50,8 @@ class RecurringSyncService:
         self._recurring_stream_repo = recurring_stream_repo
         self._alert_repo = alert_repo
         self._alert_detection_service = alert_detection_service
+        self._institution_limiter = institution_limiter
+        self._item_concurrency = max(1, item_concurrency)
 
     def sync_for_plaid_item(self, plaid_item_id: UUID) -> RecurringSyncResult:
         log = logger.bind(plaid_item_id=str(plaid_item_id))
@@ -65,46 +73,82 @@ class RecurringSyncService:
             account_count=len(account_id_map),
         )
 
-        response = self._plaid_service.get_recurring_transactions(access_token)
+        institution = plaid_item.get("institution_id") or plaid_item["item_id"]
+        with self._institution_limiter.slot(institution):
+            response = self._plaid_service.get_recurring_transactions(access_token)
+
+        existing_streams = self._recurring_stream_repo.get_by_plaid_item_id(plaid_item_id)
+        existing_by_stream_id = {stream["stream_id"]: stream for stream in existing_streams}
+
+        active_stream_ids: set[str] = set()
+        changed: list[tuple[PlaidRecurringStream, dict[str, Any]]] = []
+        unchanged_ids: list[str] = []
+
+        for stream_type, streams in (
+            (StreamType.INFLOW, response.inflow_streams),
+            (StreamType.OUTFLOW, response.outflow_streams),
+        ):
+            for stream in streams:
+                active_stream_ids.add(stream.stream_id)
+                stream_data = self._build_stream(
+                    stream=stream,
+                    stream_type=stream_type,
+                    user_id=user_id,
+                    plaid_item_id=plaid_item_id,
+                    account_id_map=account_id_map,
+                )
+                if stream_data is None:
+                    continue
+
+                row = stream_data.model_dump(mode="json")
+                row["content_hash"] = content_hash(row)
+                existing = existing_by_stream_id.get(stream.stream_id)
+                if existing is not None and existing.get("content_hash") == row["content_hash"]:
+                    unchanged_ids.append(existing["id"])
+                else:
+                    changed.append((stream, row))
+
+        # Unchanged streams only get their sync timestamp bumped; the full row,
+        # including plaid_raw and transaction_ids, is written for changed ones.
+        written = self._recurring_stream_repo.upsert_rows([row for _, row in changed])
+        self._recurring_stream_repo.mark_synced(unchanged_ids)
+        ids_by_stream_id = {row["stream_id"]: UUID(row["id"]) for row in written}
+
+        recent_alerts = self._alert_repo.get_recent_types_by_stream(
+            [
+                UUID(existing_by_stream_id[stream.stream_id]["id"])
+                for stream, _ in changed
+                if stream.stream_id in existing_by_stream_id
+            ],
+            since_hours=ALERT_DEDUPE_WINDOW_HOURS,
+        )
 
         streams_created = 0
         streams_updated = 0
-        alerts_created = 0
-        active_stream_ids: set[str] = set()
         all_alerts: list[AlertCreate] = []
 
-        for stream in response.inflow_streams:
-            result = self._process_stream(
-                stream=stream,
-                stream_type=StreamType.INFLOW,
-                user_id=user_id,
-                plaid_item_id=plaid_item_id,
-                account_id_map=account_id_map,
-            )
-            active_stream_ids.add(stream.stream_id)
-            if result["created"]:
+        for stream, _ in changed:
+            existing = existing_by_stream_id.get(stream.stream_id)
+            if existing is None:
                 streams_created += 1
             else:
                 streams_updated += 1
-            all_alerts.extend(result["alerts"])
 
-        for stream in response.outflow_streams:
-            result = self._process_stream(
-                stream=stream,
-                stream_type=StreamType.OUTFLOW,
-                user_id=user_id,
-                plaid_item_id=plaid_item_id,
-                account_id_map=account_id_map,
+            stream_uuid = ids_by_stream_id.get(stream.stream_id)
+            all_alerts.extend(
+                self._alert_detection_service.detect_alerts(
+                    user_id=user_id,
+                    existing=existing,
+                    updated=stream,
+                    stream_id=stream_uuid,
+                    recent_alert_types=recent_alerts.get(stream_uuid, set())
+                    if stream_uuid
+                    else None,
+                )
             )
-            active_stream_ids.add(stream.stream_id)
-            if result["created"]:
-                streams_created += 1
-            else:
-                streams_updated += 1
-            all_alerts.extend(result["alerts"])
 
         deactivated = self._recurring_stream_repo.deactivate_missing(
-            plaid_item_id, active_stream_ids
+            plaid_item_id, active_stream_ids, existing=existing_streams
         )
 
         for deactivated_stream in deactivated:
@@ -123,14 +167,13 @@ class RecurringSyncService:
             )
             all_alerts.append(cancelled_alert)
 
-        for alert in all_alerts:
-            self._alert_repo.create(alert)
-            alerts_created += 1
+        alerts_created = len(self._alert_repo.create_many(all_alerts))
 
         log.info(
             "recurring_sync.completed",
             streams_created=streams_created,
             streams_updated=streams_updated,
+            streams_unchanged=len(unchanged_ids),
             streams_deactivated=len(deactivated),
             alerts_created=alerts_created,
             inflow_count=len(response.inflow_streams),
@@ -138,28 +181,27 @@ class RecurringSyncService:
         )
 
         return RecurringSyncResult(
-            streams_synced=streams_created + streams_updated,
+            streams_synced=streams_created + streams_updated + len(unchanged_ids),
             streams_created=streams_created,
             streams_updated=streams_updated,
             streams_deactivated=len(deactivated),
             alerts_created=alerts_created,
+            streams_unchanged=len(unchanged_ids),
         )
 
-    def _process_stream(
+    def _build_stream(
         self,
         stream: PlaidRecurringStream,
         stream_type: StreamType,
         user_id: UUID,
         plaid_item_id: UUID,
         account_id_map: dict[str, UUID],
-    ) -> dict[str, Any]:
+    ) -> RecurringStreamCreate | None:
         account_id = account_id_map.get(stream.account_id)
         if not account_id:
-            return {"created": False, "alerts": []}
+            return None
 
-        existing = self._recurring_stream_repo.get_by_stream_id(plaid_item_id, stream.stream_id)
-
-        stream_data = RecurringStreamCreate(
+        return RecurringStreamCreate(
             user_id=user_id,
             plaid_item_id=plaid_item_id,
             account_id=account_id,
@@ -183,21 +225,6 @@ class RecurringSyncService:
             plaid_raw=stream.raw_data,
         )
 
-        result = self._recurring_stream_repo.upsert(stream_data)
-        stream_uuid = UUID(result["id"])
-
-        alerts = self._alert_detection_service.detect_alerts(
-            user_id=user_id,
-            existing=existing,
-            updated=stream,
-            stream_id=stream_uuid,
-        )
-
-        return {
-            "created": existing is None,
-            "alerts": alerts,
-        }
-
     def _build_cancelled_message(self, stream: dict[str, Any]) -> str:
         merchant = stream.get("merchant_name") or stream.get("description", "Unknown")
         return f"We haven't seen a charge from {merchant} recently."
@@ -206,24 +233,38 @@ class RecurringSyncService:
         log = logger.bind(user_id=str(user_id))
         log.info("recurring_sync.user_sync_started")
 
-        plaid_items = self._plaid_item_repo.get_by_user_id(user_id)
-        results = []
+        plaid_items = [
+            item
+            for item in self._plaid_item_repo.get_by_user_id(user_id)
+            if item.get("status") == "active"
+        ]
+        results: list[RecurringSyncResult] = []
         errors = 0
 
-        for item in plaid_items:
-            if item.get("status") != "active":
-                continue
-
-            try:
-                result = self.sync_for_plaid_item(UUID(item["id"]))
-                results.append(result)
-            except RecurringSyncError:
-                errors += 1
-                log.warning(
-                    "recurring_sync.item_sync_failed",
-                    plaid_item_id=item["id"],
-                )
-                continue
+        if not plaid_items:
+            log.info("recurring_sync.user_sync_completed", items_synced=0, items_failed=0)
+            return results
+
+        # Items sync concurrently; Plaid calls are further capped per
+        # institution by the shared limiter inside sync_for_plaid_item.
+        with ThreadPoolExecutor(
+            max_workers=min(self._item_concurrency, len(plaid_items)),
+            thread_name_prefix="recurring-sync",
+        ) as executor:
+            futures = [
+                (item, executor.submit(self.sync_for_plaid_item, UUID(item["id"])))
+                for item in plaid_items
+            ]
+
+            for item, future in futures:
+                try:
+                    results.append(future.result())
+                except RecurringSyncError:
+                    errors += 1
+                    log.warning(
+                        "recurring_sync.item_sync_failed",
+                        plaid_item_id=item["id"],
+                    )
 
         log.info(
             "recurring_sync.user_sync_completed",
@@ -240,12 +281,13 @@ class RecurringSyncServiceContainer:
     @classmethod
     def get(cls) -> RecurringSyncService:
         if cls._instance is None:
+            from config import get_settings
             from repositories.account import get_account_repository
             from repositories.alert import get_alert_repository
             from repositories.plaid_item import get_plaid_item_repository
             from repositories.recurring_stream import get_recurring_stream_repository
             from services.encryption import get_encryption_service
-            from services.plaid import get_plaid_service
+            from services.plaid import get_institution_limiter, get_plaid_service
             from services.recurring.alert_detection import get_alert_detection_service
 
             cls._instance = RecurringSyncService(
@@ -256,6 +298,8 @@ class RecurringSyncServiceContainer:
                 recurring_stream_repo=get_recurring_stream_repository(),
                 alert_repo=get_alert_repository(),
                 alert_detection_service=get_alert_detection_service(),
+                institution_limiter=get_institution_limiter(),
+                item_concurrency=get_settings().plaid_item_sync_concurrency,
             )
         return cls._instance
 
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+
+from arq.connections import ArqRedis, RedisSettings
+from redis import BlockingConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import EqualJitterBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.retry import Retry
+
+from config import Settings, get_settings
+from observability import get_logger
+
+logger = get_logger("services.redis_pool")
+
+_RETRYABLE_ERRORS: tuple[type[RedisError], ...] = (RedisConnectionError, RedisTimeoutError)
+
+
+class RedisPoolManager:
+    def __init__(self, settings: Settings) -> None:
+        self._settings = settings
+        self._pool: BlockingConnectionPool | None = None
+        self._client: Redis | None = None
+        self._async_pool: AsyncBlockingConnectionPool | None = None
+        self._arq_redis: ArqRedis | None = None
+
+    def _backoff(self) -> EqualJitterBackoff:
+        return EqualJitterBackoff(
+            cap=self._settings.redis_retry_backoff_cap_seconds,
+            base=self._settings.redis_retry_backoff_base_seconds,
+        )
+
+    def get_pool(self) -> BlockingConnectionPool:
+        if self._pool is None:
+            self._pool = BlockingConnectionPool.from_url(
+                self._settings.redis_url,
+                max_connections=self._settings.redis_max_connections,
+                timeout=self._settings.redis_pool_timeout_seconds,
+                socket_connect_timeout=self._settings.redis_connect_timeout_seconds,
+                socket_timeout=self._settings.redis_socket_timeout_seconds,
+                health_check_interval=self._settings.redis_health_check_interval_seconds,
+                retry=Retry(
+                    self._backoff(),
+                    self._settings.redis_retry_attempts,
+                    supported_errors=_RETRYABLE_ERRORS,
+                ),
+                retry_on_error=list(_RETRYABLE_ERRORS),
+            )
+            logger.info(
+                "redis_pool.created",
+                kind="sync",
+                max_connections=self._settings.redis_max_connections,
+            )
+        return self._pool
+
+    def get_client(self) -> Redis:
+        if self._client is None:
+            self._client = Redis.from_pool(self.get_pool())
+        return self._client
+
+    def get_async_pool(self) -> AsyncBlockingConnectionPool:
+        if self._async_pool is None:
+            self._async_pool = AsyncBlockingConnectionPool.from_url(
+                self._settings.redis_url,
+                max_connections=self._settings.redis_max_connections,
+                timeout=self._settings.redis_pool_timeout_seconds,
+                socket_connect_timeout=self._settings.redis_connect_timeout_seconds,
+                socket_timeout=self._settings.redis_socket_timeout_seconds,
+                health_check_interval=self._settings.redis_health_check_interval_seconds,
+                retry=AsyncRetry(
+                    self._backoff(),
+                    self._settings.redis_retry_attempts,
+                    supported_errors=_RETRYABLE_ERRORS,
+                ),
+                retry_on_error=list(_RETRYABLE_ERRORS),
+            )
+            logger.info(
+                "redis_pool.created",
+                kind="async",
+                max_connections=self._settings.redis_max_connections,
+            )
+        return self._async_pool
+
+    def get_arq_redis(self) -> ArqRedis:
+        if self._arq_redis is None:
+            self._arq_redis = ArqRedis(pool_or_conn=self.get_async_pool())
+        return self._arq_redis
+
+    def get_arq_settings(self) -> RedisSettings:
+        return dataclasses.replace(
+            RedisSettings.from_dsn(self._settings.redis_url),
+            conn_timeout=max(1, round(self._settings.redis_connect_timeout_seconds)),
+            max_connections=self._settings.redis_max_connections,
+            retry_on_timeout=True,
+            retry_on_error=list(_RETRYABLE_ERRORS),
+            retry=AsyncRetry(
+                self._backoff(),
+                self._settings.redis_retry_attempts,
+                supported_errors=_RETRYABLE_ERRORS,
+            ),
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            with contextlib.suppress(RedisError):
+                self.get_client().close()
+        self._client = None
+        self._pool = None
+
+    async def aclose(self) -> None:
+        if self._arq_redis is not None:
+            with contextlib.suppress(RedisError):
+                await self._arq_redis.close()
+            self._arq_redis = None
+        if self._async_pool is not None:
+            await self._async_pool.disconnect()
+            self._async_pool = None
+
+
+class RedisPoolManagerContainer:
+    _instance: RedisPoolManager | None = None
+
+    @classmethod
+    def get(cls) -> RedisPoolManager:
+        if cls._instance is None:
+            cls._instance = RedisPoolManager(get_settings())
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        if cls._instance is not None:
+            cls._instance.close()
+        cls._instance = None
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._instance is not None:
+            await cls._instance.aclose()
+            cls._instance.close()
+        cls._instance = None
+
+
+def get_redis_pool_manager() -> RedisPoolManager:
+    return RedisPoolManagerContainer.get()
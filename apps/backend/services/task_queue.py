@@ -1,31 +1,113 @@
 from __future__ import annotations
 
+import json
+import math
+import time
+import uuid
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any
+from enum import StrEnum
+from typing import Any, cast
 from uuid import UUID
 
-from arq import create_pool
-from arq.connections import ArqRedis, RedisSettings
-from arq.jobs import Job, JobStatus
+from arq.connections import ArqRedis
+from arq.constants import job_key_prefix
+from arq.jobs import Job, JobStatus, serialize_job
+from arq.utils import timestamp_ms
+from redis.exceptions import RedisError
 
 from config import Settings, get_settings
 from errors import TaskQueueError
+from models.webhook import TransactionsWebhookCode
 from observability import get_logger
-
-if TYPE_CHECKING:
-    pass
+from services.redis_pool import RedisPoolManager, get_redis_pool_manager
 
 logger = get_logger("services.task_queue")
 
-_CANCELLABLE_STATUSES: frozenset[JobStatus] = frozenset(
+# Pushes the user's next-run-at deadline forward (using server time) and arms a
+# job slot. Returns 1 when the caller must enqueue the job, 0 when one is armed.
+_DEBOUNCE_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local deadline = now_ms + tonumber(ARGV[2])
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not current or tonumber(current) < deadline then
+    redis.call('ZADD', KEYS[1], deadline, ARGV[1])
+end
+if redis.call('SET', KEYS[2], ARGV[3], 'NX', 'PX', ARGV[4]) then
+    return 1
+end
+redis.call('PEXPIRE', KEYS[2], ARGV[4])
+return 0
+"""
+
+# Run by the job when it starts. Returns 0 when the deadline has passed (the
+# deadline is consumed and the slot disarmed), otherwise the milliseconds left,
+# after pointing the armed slot at the follow-up job the caller will enqueue.
+_CLAIM_SCRIPT = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local deadline = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if deadline and tonumber(deadline) > now_ms then
+    redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[3])
+    return tonumber(deadline) - now_ms
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('DEL', KEYS[2])
+return 0
+"""
+
+# Claims a webhook's idempotency key, records the event until its row is
+# written (so the sweep can recover it if the job is lost) and queues its arq
+# job, all in one round-trip. The job is written the way ArqRedis.enqueue_job
+# writes it, minus the existence check a fresh event id does not need.
+_INGEST_WEBHOOK_SCRIPT = """
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+redis.call('PSETEX', KEYS[3], ARGV[4], ARGV[5])
+redis.call('ZADD', KEYS[4], ARGV[6], ARGV[7])
+return 1
+"""
+
+_ARMED_GRACE_SECONDS = 600
+
+_ACTIVE_JOB_STATUSES: frozenset[JobStatus] = frozenset(
+    {JobStatus.deferred, JobStatus.queued, JobStatus.in_progress}
+)
+
+_BASE_QUEUE_NAME = "finance-interceptor:tasks"
+
+_BULK_WEBHOOK_CODES: frozenset[str] = frozenset(
+    {
+        TransactionsWebhookCode.INITIAL_UPDATE,
+        TransactionsWebhookCode.HISTORICAL_UPDATE,
+    }
+)
+
+_NORMAL_WEBHOOK_CODES: frozenset[str] = frozenset(
     {
-        JobStatus.queued,
-        JobStatus.deferred,
+        TransactionsWebhookCode.RECURRING_TRANSACTIONS_UPDATE,
     }
 )
 
 
+class QueueLane(StrEnum):
+    HIGH = "high"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+def get_queue_name(lane: QueueLane) -> str:
+    # The normal lane keeps the original queue name so jobs queued before lanes
+    # existed are still consumed.
+    if lane == QueueLane.NORMAL:
+        return _BASE_QUEUE_NAME
+    return f"{_BASE_QUEUE_NAME}:{lane}"
+
+
 @dataclass(frozen=True, slots=True)
 class EnqueueResult:
     job_id: str
@@ -41,55 +123,52 @@ class WebhookEnqueueResult:
 
 class TaskQueueService:
     _ANALYTICS_JOB_PREFIX = "analytics"
-    _QUEUE_NAME = "finance-interceptor:tasks"
+    _ANALYTICS_DEADLINES_KEY = "finance-interceptor:analytics:next-run-at"
+    _ANALYTICS_ARMED_PREFIX = "finance-interceptor:analytics:armed"
+    _WEBHOOK_IDEMPOTENCY_PREFIX = "finance-interceptor:webhook:idempotency"
+    _WEBHOOK_UNPERSISTED_KEY = "finance-interceptor:webhook:unpersisted"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, redis_pool: RedisPoolManager) -> None:
         self._settings = settings
+        self._redis_pool = redis_pool
         self._redis: ArqRedis | None = None
 
     async def _get_redis(self) -> ArqRedis:
         if self._redis is None:
-            redis_settings = RedisSettings.from_dsn(self._settings.redis_url)
-            self._redis = await create_pool(redis_settings)
+            self._redis = self._redis_pool.get_arq_redis()
         return self._redis
 
     async def close(self) -> None:
-        if self._redis is not None:
-            await self._redis.close()
-            self._redis = None
-
-    def _get_analytics_job_id(self, user_id: UUID) -> str:
-        return f"{self._ANALYTICS_JOB_PREFIX}:{user_id}"
-
-    async def _get_job_status_and_handle(self, job_id: str) -> tuple[JobStatus | None, bool]:
-        redis = await self._get_redis()
-        job = Job(job_id, redis)
+        self._redis = None
 
-        try:
-            status = await job.status()
+    @staticmethod
+    def route_webhook(webhook_code: str) -> QueueLane:
+        if webhook_code in _BULK_WEBHOOK_CODES:
+            return QueueLane.BULK
+        if webhook_code in _NORMAL_WEBHOOK_CODES:
+            return QueueLane.NORMAL
+        return QueueLane.HIGH
 
-            if status in _CANCELLABLE_STATUSES:
-                await job.abort()
-                logger.debug(
-                    "task_queue.job_cancelled", job_id=job_id, previous_status=status.value
-                )
-                return status, True
+    def _new_analytics_job_id(self, user_id: UUID) -> str:
+        return f"{self._ANALYTICS_JOB_PREFIX}:{user_id}:{uuid.uuid4().hex[:12]}"
 
-            if status == JobStatus.complete:
-                result_key = f"arq:result:{job_id}"
-                await redis.delete(result_key)
-                logger.debug("task_queue.result_cleared", job_id=job_id)
-                return status, False
+    def _analytics_armed_key(self, user_id: UUID) -> str:
+        return f"{self._ANALYTICS_ARMED_PREFIX}:{user_id}"
 
-            if status == JobStatus.in_progress:
-                logger.debug("task_queue.job_in_progress", job_id=job_id)
-                return status, False
+    def _analytics_armed_ttl_ms(self, defer_seconds: int) -> int:
+        return (defer_seconds + _ARMED_GRACE_SECONDS) * 1000
 
-            return status, False
+    async def _enqueue_analytics_job(self, user_id: UUID, job_id: str, defer_seconds: int) -> bool:
+        redis = await self._get_redis()
 
-        except Exception:
-            logger.warning("task_queue.status_check_failed", job_id=job_id)
-            return None, False
+        job = await redis.enqueue_job(
+            "compute_analytics_for_user",
+            str(user_id),
+            _job_id=job_id,
+            _defer_by=timedelta(seconds=defer_seconds),
+            _queue_name=get_queue_name(QueueLane.NORMAL),
+        )
+        return job is not None
 
     async def enqueue_analytics_computation(
         self,
@@ -102,46 +181,147 @@ class TaskQueueService:
         if defer_seconds is None:
             defer_seconds = self._settings.task_debounce_seconds
 
-        job_id = self._get_analytics_job_id(user_id)
-        log = logger.bind(user_id=str(user_id), job_id=job_id)
-
-        previous_status, was_debounced = await self._get_job_status_and_handle(job_id)
+        redis = await self._get_redis()
+        armed_key = self._analytics_armed_key(user_id)
+        candidate_job_id = self._new_analytics_job_id(user_id)
+        log = logger.bind(user_id=str(user_id))
+
+        debounce = redis.register_script(_DEBOUNCE_SCRIPT)
+        must_enqueue = await debounce(
+            keys=[self._ANALYTICS_DEADLINES_KEY, armed_key],
+            args=[
+                str(user_id),
+                defer_seconds * 1000,
+                candidate_job_id,
+                self._analytics_armed_ttl_ms(defer_seconds),
+            ],
+        )
 
-        if was_debounced:
+        if not must_enqueue:
+            armed_job_id = await redis.get(armed_key)
+            job_id = armed_job_id.decode() if isinstance(armed_job_id, bytes) else ""
             log.info(
                 "task_queue.analytics.debounced",
+                job_id=job_id,
                 defer_seconds=defer_seconds,
-                previous_status=previous_status.value if previous_status else "unknown",
             )
+            return EnqueueResult(job_id=job_id, was_debounced=True, defer_seconds=defer_seconds)
 
-        redis = await self._get_redis()
-
-        job = await redis.enqueue_job(
-            "compute_analytics_for_user",
-            str(user_id),
-            _job_id=job_id,
-            _defer_by=timedelta(seconds=defer_seconds),
-            _queue_name=self._QUEUE_NAME,
-        )
+        try:
+            enqueued = await self._enqueue_analytics_job(user_id, candidate_job_id, defer_seconds)
+        except Exception:
+            await redis.delete(armed_key)
+            raise
 
-        if job is None:
+        if not enqueued:
+            await redis.delete(armed_key)
             log.warning(
                 "task_queue.analytics.enqueue_failed",
+                job_id=candidate_job_id,
                 reason="job_already_exists_or_enqueue_failed",
             )
+            raise TaskQueueError("Failed to enqueue analytics computation")
 
         log.info(
             "task_queue.analytics.enqueued",
+            job_id=candidate_job_id,
             defer_seconds=defer_seconds,
-            was_debounced=was_debounced,
         )
 
         return EnqueueResult(
-            job_id=job_id,
-            was_debounced=was_debounced,
+            job_id=candidate_job_id,
+            was_debounced=False,
             defer_seconds=defer_seconds,
         )
 
+    async def claim_analytics_run(self, user_id: UUID) -> EnqueueResult | None:
+        redis = await self._get_redis()
+        armed_key = self._analytics_armed_key(user_id)
+        next_job_id = self._new_analytics_job_id(user_id)
+        log = logger.bind(user_id=str(user_id))
+
+        try:
+            claim = redis.register_script(_CLAIM_SCRIPT)
+            remaining_ms = await claim(
+                keys=[self._ANALYTICS_DEADLINES_KEY, armed_key],
+                args=[
+                    str(user_id),
+                    next_job_id,
+                    self._analytics_armed_ttl_ms(self._settings.task_debounce_seconds),
+                ],
+            )
+        except RedisError as e:
+            log.warning("task_queue.analytics.claim_failed", error=str(e))
+            return None
+
+        if not remaining_ms or int(remaining_ms) <= 0:
+            return None
+
+        defer_seconds = math.ceil(int(remaining_ms) / 1000)
+
+        try:
+            enqueued = await self._enqueue_analytics_job(user_id, next_job_id, defer_seconds)
+        except Exception:
+            enqueued = False
+
+        if not enqueued:
+            log.warning("task_queue.analytics.reschedule_failed", job_id=next_job_id)
+            await redis.delete(armed_key)
+            return None
+
+        log.info(
+            "task_queue.analytics.rescheduled",
+            job_id=next_job_id,
+            defer_seconds=defer_seconds,
+        )
+        return EnqueueResult(job_id=next_job_id, was_debounced=True, defer_seconds=defer_seconds)
+
+    async def enqueue_analytics_stage(
+        self,
+        function_name: str,
+        run_id: str,
+        user_id: UUID,
+        stage_name: str,
+    ) -> bool:
+        redis = await self._get_redis()
+        job_id = f"{self._ANALYTICS_JOB_PREFIX}:{user_id}:{run_id}:{stage_name}"
+
+        job = await redis.enqueue_job(
+            function_name,
+            run_id,
+            str(user_id),
+            stage_name,
+            _job_id=job_id,
+            _queue_name=get_queue_name(QueueLane.NORMAL),
+        )
+
+        logger.debug(
+            "task_queue.analytics.stage_enqueued",
+            job_id=job_id,
+            stage=stage_name,
+            enqueued=job is not None,
+        )
+        return job is not None
+
+    async def enqueue_analytics_finalize(self, run_id: str, user_id: UUID) -> bool:
+        redis = await self._get_redis()
+        job_id = f"{self._ANALYTICS_JOB_PREFIX}:{user_id}:{run_id}:finalize"
+
+        job = await redis.enqueue_job(
+            "finalize_analytics_run",
+            run_id,
+            str(user_id),
+            _job_id=job_id,
+            _queue_name=get_queue_name(QueueLane.NORMAL),
+        )
+
+        logger.debug(
+            "task_queue.analytics.finalize_enqueued",
+            job_id=job_id,
+            enqueued=job is not None,
+        )
+        return job is not None
+
     async def get_job_status(self, job_id: str) -> JobStatus | None:
         redis = await self._get_redis()
         job = Job(job_id, redis)
@@ -152,8 +332,103 @@ class TaskQueueService:
             return None
 
     async def get_analytics_job_status(self, user_id: UUID) -> JobStatus | None:
-        job_id = self._get_analytics_job_id(user_id)
-        return await self.get_job_status(job_id)
+        redis = await self._get_redis()
+        job_id = await redis.get(self._analytics_armed_key(user_id))
+        if not isinstance(job_id, bytes):
+            return None
+        return await self.get_job_status(job_id.decode())
+
+    async def claim_and_enqueue_webhook(
+        self,
+        idempotency_key: str,
+        event_id: UUID,
+        *,
+        webhook_type: str,
+        webhook_code: str,
+        item_id: str,
+        payload: dict[str, Any],
+    ) -> bool | None:
+        if not self._settings.task_queue_enabled:
+            raise TaskQueueError("Task queue is disabled")
+
+        job_id = self._webhook_job_id(event_id)
+        lane = self.route_webhook(webhook_code)
+        record = {
+            "idempotency_key": idempotency_key,
+            "webhook_type": webhook_type,
+            "webhook_code": webhook_code,
+            "item_id": item_id,
+            "payload": payload,
+            "claimed_at": time.time(),
+        }
+        try:
+            redis = await self._get_redis()
+            enqueue_time_ms = timestamp_ms()
+            job = serialize_job(
+                "process_plaid_webhook",
+                (str(event_id), webhook_type, webhook_code, item_id, payload),
+                {"idempotency_key": idempotency_key},
+                None,
+                enqueue_time_ms,
+                serializer=redis.job_serializer,
+            )
+            script = redis.register_script(_INGEST_WEBHOOK_SCRIPT)
+            claimed = await script(
+                keys=[
+                    f"{self._WEBHOOK_IDEMPOTENCY_PREFIX}:{idempotency_key}",
+                    self._WEBHOOK_UNPERSISTED_KEY,
+                    job_key_prefix + job_id,
+                    get_queue_name(lane),
+                ],
+                args=[
+                    str(event_id),
+                    self._settings.webhook_idempotency_ttl_seconds,
+                    json.dumps(record),
+                    redis.expires_extra_ms,
+                    job,
+                    enqueue_time_ms,
+                    job_id,
+                ],
+            )
+        except RedisError as e:
+            logger.warning("task_queue.webhook.claim_failed", error=str(e))
+            return None
+
+        if claimed:
+            logger.info(
+                "task_queue.webhook.enqueued",
+                event_id=str(event_id),
+                job_id=job_id,
+                lane=lane.value,
+                webhook_type=webhook_type,
+                webhook_code=webhook_code,
+                attempt=0,
+                defer_seconds=0,
+            )
+        return bool(claimed)
+
+    # redis-py types hash commands as returning either a value or an
+    # awaitable; on the asyncio client they are always awaitable.
+    async def mark_webhook_persisted(self, event_id: UUID) -> None:
+        try:
+            redis = await self._get_redis()
+            await cast("Awaitable[int]", redis.hdel(self._WEBHOOK_UNPERSISTED_KEY, str(event_id)))
+        except RedisError as e:
+            logger.warning(
+                "task_queue.webhook.mark_persisted_failed", event_id=str(event_id), error=str(e)
+            )
+
+    async def get_unpersisted_webhooks(self) -> dict[UUID, dict[str, Any]]:
+        redis = await self._get_redis()
+        raw = await cast(
+            "Awaitable[dict[bytes, bytes]]", redis.hgetall(self._WEBHOOK_UNPERSISTED_KEY)
+        )
+
+        records: dict[UUID, dict[str, Any]] = {}
+        for field, value in raw.items():
+            event_id = field.decode() if isinstance(field, bytes) else str(field)
+            records[UUID(event_id)] = json.loads(value)
+        return records
 
     async def enqueue_webhook_processing(
         self,
@@ -162,12 +437,19 @@ class TaskQueueService:
         webhook_code: str,
         item_id: str,
         payload: dict[str, Any],
+        *,
+        idempotency_key: str | None = None,
+        attempt: int = 0,
+        defer_seconds: int = 0,
     ) -> WebhookEnqueueResult:
         if not self._settings.task_queue_enabled:
             raise TaskQueueError("Task queue is disabled")
 
-        job_id = f"webhook:{event_id}"
-        log = logger.bind(event_id=str(event_id), job_id=job_id)
+        # Each sweep attempt gets its own job id so it is not rejected by the
+        # result arq keeps for the previous, failed attempt.
+        job_id = self._webhook_job_id(event_id, attempt)
+        lane = self.route_webhook(webhook_code)
+        log = logger.bind(event_id=str(event_id), job_id=job_id, lane=lane.value)
 
         redis = await self._get_redis()
 
@@ -178,8 +460,10 @@ class TaskQueueService:
             webhook_code,
             item_id,
             payload,
+            idempotency_key=idempotency_key,
             _job_id=job_id,
-            _queue_name=self._QUEUE_NAME,
+            _defer_by=timedelta(seconds=defer_seconds),
+            _queue_name=get_queue_name(lane),
         )
 
         enqueued = job is not None
@@ -189,6 +473,8 @@ class TaskQueueService:
                 "task_queue.webhook.enqueued",
                 webhook_type=webhook_type,
                 webhook_code=webhook_code,
+                attempt=attempt,
+                defer_seconds=defer_seconds,
             )
         else:
             log.warning(
@@ -198,9 +484,21 @@ class TaskQueueService:
 
         return WebhookEnqueueResult(job_id=job_id, enqueued=enqueued)
 
-    async def get_webhook_job_status(self, event_id: UUID) -> JobStatus | None:
-        job_id = f"webhook:{event_id}"
-        return await self.get_job_status(job_id)
+    @staticmethod
+    def _webhook_job_id(event_id: UUID, attempt: int = 0) -> str:
+        if attempt == 0:
+            return f"webhook:{event_id}"
+        return f"webhook:{event_id}:retry:{attempt}"
+
+    async def get_webhook_job_status(self, event_id: UUID, attempt: int = 0) -> JobStatus | None:
+        return await self.get_job_status(self._webhook_job_id(event_id, attempt))
+
+    async def has_active_webhook_job(self, event_id: UUID, last_attempt: int) -> bool:
+        for attempt in range(last_attempt + 1):
+            status = await self.get_webhook_job_status(event_id, attempt)
+            if status in _ACTIVE_JOB_STATUSES:
+                return True
+        return False
 
     def is_enabled(self) -> bool:
         return self._settings.task_queue_enabled
@@ -213,7 +511,7 @@ class TaskQueueServiceContainer:
     def get(cls) -> TaskQueueService:
         if cls._instance is None:
             settings = get_settings()
-            cls._instance = TaskQueueService(settings)
+            cls._instance = TaskQueueService(settings, get_redis_pool_manager())
         return cls._instance
 
     @classmethod
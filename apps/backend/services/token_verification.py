@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import Any, ClassVar
+from uuid import UUID
+
+import jwt
+
+from config import Settings, get_settings
+from errors import UnauthorizedError
+from models.auth import AuthenticatedUser
+from observability import get_logger
+
+logger = get_logger("services.token_verification")
+
+
+class SupabaseTokenVerifier:
+    _AUDIENCE: ClassVar[str] = "authenticated"
+    _SECRET_ALGORITHMS: ClassVar[list[str]] = ["HS256"]
+    _JWKS_ALGORITHMS: ClassVar[list[str]] = ["ES256", "RS256"]
+    _REQUIRED_CLAIMS: ClassVar[list[str]] = ["exp", "sub", "aud", "iss"]
+
+    def __init__(self, settings: Settings) -> None:
+        self._secret = settings.supabase_jwt_secret
+        self._issuer = f"{settings.supabase_url.rstrip('/')}/auth/v1"
+        self._jwks_client: jwt.PyJWKClient | None = None
+        if settings.supabase_jwt_verification == "jwks":
+            self._jwks_client = jwt.PyJWKClient(
+                f"{self._issuer}/.well-known/jwks.json",
+                lifespan=settings.supabase_jwks_cache_ttl_seconds,
+                timeout=settings.supabase_jwks_timeout_seconds,
+            )
+
+    def verify(self, token: str) -> AuthenticatedUser | None:
+        try:
+            algorithm = str(jwt.get_unverified_header(token).get("alg", ""))
+        except jwt.InvalidTokenError as e:
+            logger.warning("auth.token_invalid", reason="malformed")
+            raise UnauthorizedError(message="Invalid or expired token") from e
+
+        # None hands the token to Supabase Auth: it was signed with an algorithm
+        # this mode does not verify, or the JWKS is unreachable.
+        key = self._verification_key(token, algorithm)
+        if key is None:
+            return None
+
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                audience=self._AUDIENCE,
+                issuer=self._issuer,
+                options={"require": self._REQUIRED_CLAIMS},
+            )
+            user_id = UUID(claims["sub"])
+        except (jwt.InvalidTokenError, ValueError) as e:
+            logger.warning("auth.token_invalid", reason="invalid_or_expired", source="local")
+            raise UnauthorizedError(message="Invalid or expired token") from e
+
+        return AuthenticatedUser(
+            id=user_id,
+            email=claims.get("email") or None,
+            role=claims.get("role") or "authenticated",
+        )
+
+    def _verification_key(self, token: str, algorithm: str) -> Any:
+        if self._jwks_client is None:
+            if algorithm not in self._SECRET_ALGORITHMS or not self._secret:
+                return None
+            return self._secret
+
+        if algorithm not in self._JWKS_ALGORITHMS:
+            return None
+
+        # The client refetches the JWKS once when the kid is not in its cached
+        # copy, so a kid that is still unknown afterwards was not issued by us.
+        try:
+            return self._jwks_client.get_signing_key_from_jwt(token).key
+        except jwt.PyJWKClientConnectionError as e:
+            logger.warning("auth.jwks_unavailable", error=str(e))
+            return None
+        except jwt.PyJWKClientError as e:
+            logger.warning("auth.token_invalid", reason="unknown_signing_key", source="local")
+            raise UnauthorizedError(message="Invalid or expired token") from e
+
+
+class SupabaseTokenVerifierContainer:
+    _instance: SupabaseTokenVerifier | None = None
+
+    @classmethod
+    def get(cls) -> SupabaseTokenVerifier:
+        if cls._instance is None:
+            cls._instance = SupabaseTokenVerifier(get_settings())
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._instance = None
+
+
+def get_supabase_token_verifier() -> SupabaseTokenVerifier:
+    return SupabaseTokenVerifierContainer.get()
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from plaid.exceptions import ApiException
 
-from models.transaction import PlaidTransactionData, TransactionCreate, TransactionSyncResult
+from models.transaction import PlaidTransactionData, TransactionSyncResult
 from observability import get_logger
+from services.content_hash import content_hash
 
 if TYPE_CHECKING:
     from repositories.account import AccountRepository
@@ -23,11 +27,64 @@ _MUTATION_ERROR_CODE = "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION"
 
 
 class TransactionSyncError(Exception):
-    def __init__(self, message: str = "Transaction sync failed") -> None:
+    def __init__(self, message: str = "Transaction sync failed", *, changed: int = 0) -> None:
         self.message = message
+        self.changed = changed
         super().__init__(self.message)
 
 
+@dataclass
+class _SyncCheckpoint:
+    cursor: str | None
+
+
+@dataclass
+class _PendingWrites:
+    upserts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    removals: set[str] = field(default_factory=set)
+    modified: set[str] = field(default_factory=set)
+    pages: int = 0
+    added_count: int = 0
+    modified_count: int = 0
+    removed_count: int = 0
+
+    # Later pages win, so a transaction added and then removed within one
+    # batch is only deleted, and one removed and then re-added is only upserted.
+    def upsert(self, rows: list[dict[str, Any]], *, modified: bool = False) -> None:
+        for row in rows:
+            transaction_id = row["transaction_id"]
+            self.removals.discard(transaction_id)
+            self.upserts[transaction_id] = row
+            if modified:
+                self.modified.add(transaction_id)
+            else:
+                self.modified.discard(transaction_id)
+
+    def remove(self, transaction_ids: list[str]) -> None:
+        for transaction_id in transaction_ids:
+            self.upserts.pop(transaction_id, None)
+            self.modified.discard(transaction_id)
+            self.removals.add(transaction_id)
+
+    def clear(self) -> None:
+        self.upserts.clear()
+        self.removals.clear()
+        self.modified.clear()
+        self.pages = 0
+        self.added_count = 0
+        self.modified_count = 0
+        self.removed_count = 0
+
+
+@dataclass
+class _SyncTotals:
+    added: int = 0
+    modified: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    changed: int = 0
+
+
 class TransactionSyncService:
     def __init__(
         self,
@@ -36,12 +93,15 @@ class TransactionSyncService:
         plaid_item_repo: PlaidItemRepository,
         account_repo: AccountRepository,
         transaction_repo: TransactionRepository,
+        *,
+        checkpoint_pages: int = 10,
     ) -> None:
         self._plaid_service = plaid_service
         self._encryption_service = encryption_service
         self._plaid_item_repo = plaid_item_repo
         self._account_repo = account_repo
         self._transaction_repo = transaction_repo
+        self._checkpoint_pages = max(1, checkpoint_pages)
 
     def sync_item(self, item_id: str) -> TransactionSyncResult:
         log = logger.bind(plaid_item_id=item_id)
@@ -77,20 +137,42 @@ class TransactionSyncService:
             account_count=len(account_map),
         )
 
+        checkpoint = _SyncCheckpoint(cursor=plaid_item.get("sync_cursor"))
+        # Checkpoints written by a failed attempt stay in the database, so the
+        # totals count committed writes across every attempt.
+        totals = _SyncTotals()
+
         for attempt in range(_MAX_PAGINATION_RETRIES):
             try:
-                return self._execute_sync(plaid_item_id, access_token, account_map, attempt, log)
-            except ApiException as e:
-                if self._is_mutation_error(e) and attempt < _MAX_PAGINATION_RETRIES - 1:
+                return self._execute_sync(
+                    plaid_item_id,
+                    access_token,
+                    account_map,
+                    checkpoint=checkpoint,
+                    totals=totals,
+                    attempt=attempt,
+                    log=log,
+                )
+            except Exception as e:
+                if (
+                    isinstance(e, ApiException)
+                    and self._is_mutation_error(e)
+                    and attempt < _MAX_PAGINATION_RETRIES - 1
+                ):
                     log.warning(
                         "transaction_sync.mutation_during_pagination",
                         attempt=attempt + 1,
                         max_attempts=_MAX_PAGINATION_RETRIES,
                     )
                     continue
+                # The caller still has to react to what earlier checkpoints wrote.
+                if totals.changed:
+                    raise TransactionSyncError(
+                        "Transaction sync failed after a checkpoint", changed=totals.changed
+                    ) from e
                 raise
 
-        raise TransactionSyncError("Max pagination retries exceeded")
+        raise TransactionSyncError("Max pagination retries exceeded", changed=totals.changed)
 
     def _is_mutation_error(self, error: ApiException) -> bool:
         if error.body and isinstance(error.body, str):
@@ -102,11 +184,13 @@ class TransactionSyncService:
         plaid_item_id: UUID,
         access_token: str,
         account_map: dict[str, UUID],
+        *,
+        checkpoint: _SyncCheckpoint,
+        totals: _SyncTotals,
         attempt: int,
         log: Any,
     ) -> TransactionSyncResult:
-        plaid_item = self._plaid_item_repo.get_by_id(plaid_item_id)
-        cursor = plaid_item.get("sync_cursor") if plaid_item else None
+        cursor = checkpoint.cursor
 
         if attempt > 0:
             log.info(
@@ -115,66 +199,126 @@ class TransactionSyncService:
                 has_cursor=cursor is not None,
             )
 
-        total_added = 0
-        total_modified = 0
-        total_removed = 0
         has_more = True
         page_count = 0
-
-        while has_more:
-            page_count += 1
-            added, modified, removed, new_cursor, has_more = self._plaid_service.sync_transactions(
-                access_token, cursor
-            )
-
-            log.debug(
-                "transaction_sync.page_fetched",
-                page=page_count,
-                added=len(added),
-                modified=len(modified),
-                removed=len(removed),
-                has_more=has_more,
+        pending = _PendingWrites()
+
+        # Page N+1 is fetched from Plaid while page N is buffered. Buffered pages
+        # are written every checkpoint_pages pages together with the cursor they
+        # lead to, so a crash or mutation error resumes from the last checkpoint.
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="plaid-sync-prefetch")
+        try:
+            next_page = prefetcher.submit(
+                self._plaid_service.sync_transactions, access_token, cursor
             )
 
-            if added:
-                self._process_added_transactions(added, account_map)
-                total_added += len(added)
+            while has_more:
+                page_count += 1
+                added, modified, removed, new_cursor, has_more = next_page.result()
 
-            if modified:
-                self._process_modified_transactions(modified, account_map)
-                total_modified += len(modified)
-
-            if removed:
-                self._process_removed_transactions(removed)
-                total_removed += len(removed)
-
-            cursor = new_cursor
-            self._plaid_item_repo.update_sync_cursor(plaid_item_id, cursor)
+                if has_more:
+                    next_page = prefetcher.submit(
+                        self._plaid_service.sync_transactions, access_token, new_cursor
+                    )
 
-        self._plaid_item_repo.update_last_sync(plaid_item_id)
+                log.debug(
+                    "transaction_sync.page_fetched",
+                    page=page_count,
+                    added=len(added),
+                    modified=len(modified),
+                    removed=len(removed),
+                    has_more=has_more,
+                )
+
+                pending.upsert(self._to_transaction_rows(added, account_map))
+                pending.upsert(self._to_transaction_rows(modified, account_map), modified=True)
+                pending.remove(removed)
+                pending.pages += 1
+                pending.added_count += len(added)
+                pending.modified_count += len(modified)
+                pending.removed_count += len(removed)
+                cursor = new_cursor
+
+                if has_more and pending.pages >= self._checkpoint_pages:
+                    self._commit(plaid_item_id, pending, cursor, totals=totals, completed=False)
+                    checkpoint.cursor = cursor
+                    log.debug("transaction_sync.checkpoint", page=page_count)
+        finally:
+            prefetcher.shutdown(wait=True, cancel_futures=True)
+
+        self._commit(plaid_item_id, pending, cursor, totals=totals, completed=True)
+        checkpoint.cursor = cursor
 
         log.info(
             "transaction_sync.completed",
-            transactions_added=total_added,
-            transactions_modified=total_modified,
-            transactions_removed=total_removed,
+            transactions_added=totals.added,
+            transactions_modified=totals.modified - totals.unchanged,
+            transactions_unchanged=totals.unchanged,
+            transactions_removed=totals.removed,
+            transactions_changed=totals.changed,
             pages_fetched=page_count,
         )
 
         return TransactionSyncResult(
-            added=total_added,
-            modified=total_modified,
-            removed=total_removed,
+            added=totals.added,
+            modified=totals.modified - totals.unchanged,
+            removed=totals.removed,
+            unchanged=totals.unchanged,
+            changed=totals.changed,
             cursor=cursor or "",
             has_more=False,
         )
 
-    def _process_added_transactions(
+    def _commit(
+        self,
+        plaid_item_id: UUID,
+        pending: _PendingWrites,
+        cursor: str | None,
+        *,
+        totals: _SyncTotals,
+        completed: bool,
+    ) -> None:
+        totals.unchanged += self._drop_unchanged(pending)
+
+        if pending.upserts:
+            self._transaction_repo.upsert_rows(
+                list(pending.upserts.values()), returning_minimal=True
+            )
+
+        if pending.removals:
+            self._transaction_repo.delete_many_by_transaction_ids(list(pending.removals))
+
+        self._plaid_item_repo.update_sync_state(plaid_item_id, cursor, completed=completed)
+        totals.added += pending.added_count
+        totals.modified += pending.modified_count
+        totals.removed += pending.removed_count
+        totals.changed += len(pending.upserts) + len(pending.removals)
+        pending.clear()
+
+    # Plaid reports a transaction as modified whenever any field it tracks
+    # changes, including ones we do not store. Rows whose stored content hash
+    # already matches are left alone so they neither get rewritten nor mark
+    # downstream analytics dirty.
+    def _drop_unchanged(self, pending: _PendingWrites) -> int:
+        candidates = [tid for tid in pending.modified if tid in pending.upserts]
+        if not candidates:
+            return 0
+
+        stored = self._transaction_repo.get_content_hashes(candidates)
+        unchanged = 0
+        for transaction_id in candidates:
+            stored_hash = stored.get(transaction_id)
+            if stored_hash and stored_hash == pending.upserts[transaction_id]["content_hash"]:
+                del pending.upserts[transaction_id]
+                unchanged += 1
+        return unchanged
+
+    def _to_transaction_rows(
         self,
         transactions: list[PlaidTransactionData],
         account_map: dict[str, UUID],
-    ) -> None:
-        creates = []
+    ) -> list[dict[str, Any]]:
+        rows = []
         skipped = 0
         for txn in transactions:
             internal_account_id = account_map.get(txn.account_id)
@@ -182,10 +326,7 @@ class TransactionSyncService:
                 skipped += 1
                 continue
 
-            creates.append(self._to_transaction_create(txn, internal_account_id))
-
-        if creates:
-            self._transaction_repo.upsert_many(creates)
+            rows.append(self._to_transaction_row(txn, internal_account_id))
 
         if skipped > 0:
             logger.debug(
@@ -194,64 +335,63 @@ class TransactionSyncService:
                 reason="account_not_found",
             )
 
-    def _process_modified_transactions(
-        self,
-        transactions: list[PlaidTransactionData],
-        account_map: dict[str, UUID],
-    ) -> None:
-        creates = []
-        for txn in transactions:
-            internal_account_id = account_map.get(txn.account_id)
-            if not internal_account_id:
-                continue
-
-            creates.append(self._to_transaction_create(txn, internal_account_id))
-
-        if creates:
-            self._transaction_repo.upsert_many(creates)
+        return rows
 
-    def _process_removed_transactions(self, transaction_ids: list[str]) -> None:
-        if transaction_ids:
-            self._transaction_repo.delete_many_by_transaction_ids(transaction_ids)
-
-    def _to_transaction_create(
+    # Builds the upsert payload directly from the Plaid data instead of
+    # validating a TransactionCreate and dumping it again. The output is
+    # equivalent to TransactionCreate.model_dump(mode="json", by_alias=True,
+    # exclude_none=True) plus a content hash of those fields.
+    def _to_transaction_row(
         self,
         txn: PlaidTransactionData,
         account_id: UUID,
-    ) -> TransactionCreate:
+    ) -> dict[str, Any]:
         location = txn.location or {}
         pfc = txn.personal_finance_category or {}
 
-        return TransactionCreate(
-            account_id=account_id,
-            transaction_id=txn.transaction_id,
-            amount=txn.amount,
-            iso_currency_code=txn.iso_currency_code or "USD",
-            date=txn.date,
-            datetime=txn.datetime_field,
-            authorized_date=txn.authorized_date,
-            authorized_datetime=txn.authorized_datetime,
-            name=txn.name,
-            merchant_name=txn.merchant_name,
-            payment_channel=txn.payment_channel,
-            pending=txn.pending,
-            pending_transaction_id=txn.pending_transaction_id,
-            category_id=txn.category_id,
-            category=txn.category,
-            personal_finance_category_primary=pfc.get("primary"),
-            personal_finance_category_detailed=pfc.get("detailed"),
-            personal_finance_category_confidence=pfc.get("confidence_level"),
-            location_address=location.get("address"),
-            location_city=location.get("city"),
-            location_region=location.get("region"),
-            location_postal_code=location.get("postal_code"),
-            location_country=location.get("country"),
-            location_lat=Decimal(str(location["lat"])) if location.get("lat") else None,
-            location_lon=Decimal(str(location["lon"])) if location.get("lon") else None,
-            logo_url=txn.logo_url,
-            website=txn.website,
-            check_number=txn.check_number,
-        )
+        row: dict[str, Any] = {
+            "account_id": str(account_id),
+            "transaction_id": txn.transaction_id,
+            "amount": str(txn.amount),
+            "iso_currency_code": txn.iso_currency_code or "USD",
+            "date": txn.date.isoformat(),
+            "datetime": _isoformat(txn.datetime_field),
+            "authorized_date": _isoformat(txn.authorized_date),
+            "authorized_datetime": _isoformat(txn.authorized_datetime),
+            "name": txn.name,
+            "merchant_name": txn.merchant_name,
+            "payment_channel": txn.payment_channel,
+            "pending": txn.pending,
+            "pending_transaction_id": txn.pending_transaction_id,
+            "category_id": txn.category_id,
+            "category": txn.category,
+            "personal_finance_category_primary": pfc.get("primary"),
+            "personal_finance_category_detailed": pfc.get("detailed"),
+            "personal_finance_category_confidence": pfc.get("confidence_level"),
+            "location_address": location.get("address"),
+            "location_city": location.get("city"),
+            "location_region": location.get("region"),
+            "location_postal_code": location.get("postal_code"),
+            "location_country": location.get("country"),
+            "location_lat": str(Decimal(str(location["lat"]))) if location.get("lat") else None,
+            "location_lon": str(Decimal(str(location["lon"]))) if location.get("lon") else None,
+            "logo_url": txn.logo_url,
+            "website": txn.website,
+            "check_number": txn.check_number,
+        }
+        row = {key: value for key, value in row.items() if value is not None}
+        row["content_hash"] = content_hash(row)
+        return row
+
+
+def _isoformat(value: date | datetime | None) -> str | None:
+    if value is None:
+        return None
+    text = value.isoformat()
+    # pydantic's JSON mode writes a zero UTC offset as "Z".
+    if isinstance(value, datetime) and text.endswith("+00:00"):
+        return f"{text[:-6]}Z"
+    return text
 
 
 class TransactionSyncServiceContainer:
@@ -260,6 +400,7 @@ class TransactionSyncServiceContainer:
     @classmethod
     def get(cls) -> TransactionSyncService:
         if cls._instance is None:
+            from config import get_settings
             from repositories.account import get_account_repository
             from repositories.plaid_item import get_plaid_item_repository
             from repositories.transaction import get_transaction_repository
@@ -272,6 +413,7 @@ class TransactionSyncServiceContainer:
                 plaid_item_repo=get_plaid_item_repository(),
                 account_repo=get_account_repository(),
                 transaction_repo=get_transaction_repository(),
+                checkpoint_pages=get_settings().transaction_sync_checkpoint_pages,
             )
         return cls._instance
 
@@ -16,6 +16,7 @@ from models.webhook import (
     WebhookType,
 )
 from observability import get_logger
+from services.transaction_sync import TransactionSyncError
 
 if TYPE_CHECKING:
     from repositories.plaid_item import PlaidItemRepository
@@ -82,10 +83,34 @@ class WebhookService:
             )
         return existing is not None
 
+    async def claim_and_enqueue(
+        self,
+        idempotency_key: str,
+        event_id: UUID,
+        webhook: PlaidWebhookRequest,
+        payload: dict[str, Any],
+    ) -> bool | None:
+        claimed = await self._task_queue_service.claim_and_enqueue_webhook(
+            idempotency_key,
+            event_id,
+            webhook_type=webhook.webhook_type,
+            webhook_code=webhook.webhook_code,
+            item_id=webhook.item_id,
+            payload=payload,
+        )
+        if claimed is False:
+            logger.info(
+                "webhook.duplicate_detected",
+                idempotency_key=idempotency_key,
+            )
+        return claimed
+
     def store_event(
         self,
         webhook: PlaidWebhookRequest,
         payload: dict[str, Any],
+        *,
+        event_id: UUID | None = None,
     ) -> UUID:
         idempotency_key = self.generate_idempotency_key(webhook)
 
@@ -101,8 +126,10 @@ class WebhookService:
             idempotency_key=idempotency_key,
         )
 
-        created = self._webhook_event_repo.create(event_data)
-        event_id = UUID(created["id"])
+        if event_id is None:
+            event_id = UUID(self._webhook_event_repo.create(event_data)["id"])
+        else:
+            self._webhook_event_repo.insert_if_absent(event_id, event_data)
 
         logger.info(
             "webhook.event_stored",
@@ -119,6 +146,8 @@ class WebhookService:
         webhook: PlaidWebhookRequest,
         event_id: UUID,
         payload: dict[str, Any],
+        *,
+        idempotency_key: str | None = None,
     ) -> bool:
         log = logger.bind(
             event_id=str(event_id),
@@ -135,6 +164,7 @@ class WebhookService:
                     webhook_code=webhook.webhook_code,
                     item_id=webhook.item_id,
                     payload=payload,
+                    idempotency_key=idempotency_key,
                 )
                 log.info(
                     "webhook.enqueued",
@@ -149,6 +179,9 @@ class WebhookService:
         log.debug("webhook.queue_disabled")
         return False
 
+    def is_queue_enabled(self) -> bool:
+        return self._task_queue_service.is_enabled()
+
     def create_fallback_background_task(
         self,
         webhook: PlaidWebhookRequest,
@@ -257,6 +290,7 @@ class WebhookService:
                 transactions_added=sync_result.added,
                 transactions_modified=sync_result.modified,
                 transactions_removed=sync_result.removed,
+                transactions_unchanged=sync_result.unchanged,
             )
 
             plaid_item = self._plaid_item_repo.get_by_item_id(item_id)
@@ -265,11 +299,16 @@ class WebhookService:
                 plaid_item_id = UUID(plaid_item["id"])
 
                 self._trigger_recurring_sync_silent(plaid_item_id, log)
-                self._run_analytics_sync(user_id, log)
+                if sync_result.has_changes:
+                    self._run_analytics_sync(user_id, log)
 
             self._webhook_event_repo.update_status(event_id, WebhookEventStatus.COMPLETED)
-        except Exception:
+        except Exception as e:
             log.exception("webhook.transaction_sync.failed")
+            if isinstance(e, TransactionSyncError) and e.changed:
+                plaid_item = self._plaid_item_repo.get_by_item_id(item_id)
+                if plaid_item:
+                    self._run_analytics_sync(UUID(plaid_item["user_id"]), log)
             self._webhook_event_repo.update_status(
                 event_id,
                 WebhookEventStatus.FAILED,
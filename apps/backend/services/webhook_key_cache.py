@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import contextlib
 import json
 import time
 from typing import Any, ClassVar
@@ -11,6 +10,7 @@ from redis.exceptions import RedisError
 from config import Settings, get_settings
 from models.webhook_verification import CachedKey, JWKPublicKey
 from observability import get_logger
+from services.redis_pool import RedisPoolManager, get_redis_pool_manager
 
 logger = get_logger("services.webhook_key_cache")
 
@@ -24,19 +24,15 @@ class WebhookKeyCacheError(Exception):
 class WebhookKeyCache:
     _KEY_PREFIX: ClassVar[str] = "plaid:webhook:key"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, redis_pool: RedisPoolManager) -> None:
         self._settings = settings
+        self._redis_pool = redis_pool
         self._client: Redis | None = None
         self._ttl_seconds = settings.webhook_key_cache_ttl_seconds
 
     def _get_client(self) -> Redis:
         if self._client is None:
-            self._client = Redis.from_url(
-                self._settings.redis_url,
-                decode_responses=False,
-                socket_connect_timeout=5.0,
-                socket_timeout=5.0,
-            )
+            self._client = self._redis_pool.get_client()
         return self._client
 
     def _build_key(self, key_id: str) -> str:
@@ -168,10 +164,7 @@ class WebhookKeyCache:
             return False
 
     def close(self) -> None:
-        if self._client is not None:
-            with contextlib.suppress(RedisError):
-                self._client.close()
-            self._client = None
+        self._client = None
 
     def is_available(self) -> bool:
         try:
@@ -189,7 +182,7 @@ class WebhookKeyCacheContainer:
     def get(cls) -> WebhookKeyCache:
         if cls._instance is None:
             settings = get_settings()
-            cls._instance = WebhookKeyCache(settings)
+            cls._instance = WebhookKeyCache(settings, get_redis_pool_manager())
         return cls._instance
 
     @classmethod
@@ -4,7 +4,9 @@ import base64
 import hashlib
 import hmac
 import json
+import threading
 import time
+from dataclasses import dataclass
 from typing import Any, ClassVar
 
 import jwt
@@ -24,9 +26,16 @@ from services.webhook_key_cache import WebhookKeyCache, get_webhook_key_cache
 logger = get_logger("services.webhook_verification")
 
 
+@dataclass(frozen=True, slots=True)
+class _VerifyingKey:
+    key: EllipticCurvePublicKey
+    expires_at: float
+
+
 class PlaidWebhookVerifier:
     _MAX_TOKEN_AGE_SECONDS: ClassVar[int] = 300
     _REQUIRED_ALGORITHM: ClassVar[str] = "ES256"
+    _MAX_LOCAL_KEYS: ClassVar[int] = 32
 
     def __init__(
         self,
@@ -37,6 +46,10 @@ class PlaidWebhookVerifier:
         self._plaid_service = plaid_service
         self._key_cache = key_cache
         self._settings = settings
+        # Ready-to-verify keys by kid. Redis stays the shared L2, so this only
+        # saves the Redis round-trip and PyJWK construction per webhook.
+        self._local_keys: dict[str, _VerifyingKey] = {}
+        self._local_keys_lock = threading.Lock()
 
     def verify(
         self,
@@ -53,19 +66,23 @@ class PlaidWebhookVerifier:
 
         log = log.bind(key_id=key_id)
 
-        key_result = self._validate_public_key(key_id)
-        if key_result is not None:
-            log.warning("webhook_verification.key_validation_failed", reason=key_result.value)
-            return WebhookVerificationResult.failure(key_result, key_id)
-
-        public_key = self._get_public_key(key_id)
-        if public_key is None:
-            return WebhookVerificationResult.failure(
-                WebhookVerificationFailureReason.KEY_NOT_FOUND, key_id
-            )
+        verifying_key = self._get_local_key(key_id)
+        if verifying_key is None:
+            public_key = self._get_public_key(key_id)
+            key_result = self._validate_public_key(key_id, public_key)
+            if key_result is not None:
+                log.warning("webhook_verification.key_validation_failed", reason=key_result.value)
+                return WebhookVerificationResult.failure(key_result, key_id)
+
+            verifying_key = self._build_verifying_key(public_key) if public_key else None
+            if verifying_key is None:
+                return WebhookVerificationResult.failure(
+                    WebhookVerificationFailureReason.SIGNATURE_INVALID, key_id
+                )
+            self._store_local_key(key_id, verifying_key)
 
         payload_result = self._validate_jwt_payload(
-            plaid_verification_header, public_key, request_body, key_id
+            plaid_verification_header, verifying_key.key, request_body, key_id
         )
         if payload_result is not None:
             return payload_result
@@ -73,8 +90,11 @@ class PlaidWebhookVerifier:
         log.info("webhook_verification.success")
         return WebhookVerificationResult.success(key_id)
 
-    def _validate_public_key(self, key_id: str) -> WebhookVerificationFailureReason | None:
-        public_key = self._get_public_key(key_id)
+    def _validate_public_key(
+        self,
+        key_id: str,
+        public_key: JWKPublicKey | None,
+    ) -> WebhookVerificationFailureReason | None:
         if public_key is None:
             return WebhookVerificationFailureReason.KEY_NOT_FOUND
 
@@ -88,14 +108,66 @@ class PlaidWebhookVerifier:
 
         return None
 
+    def _get_local_key(self, key_id: str) -> _VerifyingKey | None:
+        with self._local_keys_lock:
+            verifying_key = self._local_keys.get(key_id)
+            if verifying_key is None:
+                return None
+            if verifying_key.expires_at <= time.time():
+                del self._local_keys[key_id]
+                return None
+            return verifying_key
+
+    def _store_local_key(self, key_id: str, verifying_key: _VerifyingKey) -> None:
+        with self._local_keys_lock:
+            self._local_keys.pop(key_id, None)
+            while len(self._local_keys) >= self._MAX_LOCAL_KEYS:
+                del self._local_keys[next(iter(self._local_keys))]
+            self._local_keys[key_id] = verifying_key
+
+    def _build_verifying_key(self, public_key: JWKPublicKey) -> _VerifyingKey | None:
+        try:
+            jwk = PyJWK.from_dict(
+                {
+                    "kty": public_key.kty,
+                    "crv": public_key.crv,
+                    "x": public_key.x,
+                    "y": public_key.y,
+                    "alg": public_key.alg,
+                    "use": public_key.use,
+                    "kid": public_key.kid,
+                }
+            )
+        except Exception as e:
+            logger.warning(
+                "webhook_verification.invalid_jwk",
+                key_id=public_key.kid,
+                error=str(e),
+            )
+            return None
+
+        key = jwk.key
+        if not isinstance(key, EllipticCurvePublicKey):
+            logger.warning(
+                "webhook_verification.invalid_key_type",
+                key_type=type(key).__name__,
+            )
+            return None
+
+        expires_at = time.time() + self._settings.webhook_key_cache_ttl_seconds
+        if public_key.expired_at is not None:
+            expires_at = min(expires_at, public_key.expired_at)
+
+        return _VerifyingKey(key=key, expires_at=expires_at)
+
     def _validate_jwt_payload(
         self,
         jwt_token: str,
-        public_key: JWKPublicKey,
+        key: EllipticCurvePublicKey,
         request_body: bytes,
         key_id: str,
     ) -> WebhookVerificationResult | None:
-        payload = self._verify_jwt_signature(jwt_token, public_key)
+        payload = self._verify_jwt_signature(jwt_token, key)
         if payload is None:
             logger.warning("webhook_verification.signature_invalid", key_id=key_id)
             return WebhookVerificationResult.failure(
@@ -213,29 +285,9 @@ class PlaidWebhookVerifier:
     def _verify_jwt_signature(
         self,
         jwt_token: str,
-        public_key: JWKPublicKey,
+        key: EllipticCurvePublicKey,
     ) -> dict[str, Any] | None:
         try:
-            jwk_dict = {
-                "kty": public_key.kty,
-                "crv": public_key.crv,
-                "x": public_key.x,
-                "y": public_key.y,
-                "alg": public_key.alg,
-                "use": public_key.use,
-                "kid": public_key.kid,
-            }
-
-            jwk = PyJWK.from_dict(jwk_dict)
-            key = jwk.key
-
-            if not isinstance(key, EllipticCurvePublicKey):
-                logger.warning(
-                    "webhook_verification.invalid_key_type",
-                    key_type=type(key).__name__,
-                )
-                return None
-
             payload: dict[str, Any] = jwt.decode(
                 jwt_token,
                 key,
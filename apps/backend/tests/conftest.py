@@ -3,7 +3,10 @@ from __future__ import annotations
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
+import fakeredis
 import pytest
+from arq.connections import ArqRedis
+from redis import Redis
 from testing import test_scenario
 from testing.fixtures import (
     baseline_ready_user,
@@ -11,6 +14,9 @@ from testing.fixtures import (
     no_creep_stable_user,
 )
 
+from config import Settings
+from services.redis_pool import RedisPoolManager
+
 if TYPE_CHECKING:
     from testing.fixtures.scenarios.result import ScenarioResult
 
@@ -37,3 +43,32 @@ def creep_user() -> Generator[ScenarioResult, None, None]:
         creep_percentage=0.30,
     ) as result:
         yield result
+
+
+class FakeRedisPoolManager(RedisPoolManager):
+    def __init__(self, settings: Settings) -> None:
+        super().__init__(settings)
+        self._server = fakeredis.FakeServer()
+        self._fake_client: Redis | None = None
+        self._fake_arq_redis: ArqRedis | None = None
+
+    def get_client(self) -> Redis:
+        if self._fake_client is None:
+            self._fake_client = fakeredis.FakeRedis(server=self._server)
+        return self._fake_client
+
+    def get_arq_redis(self) -> ArqRedis:
+        if self._fake_arq_redis is None:
+            fake = fakeredis.FakeAsyncRedis(server=self._server)
+            self._fake_arq_redis = ArqRedis(pool_or_conn=fake.connection_pool)
+        return self._fake_arq_redis
+
+
+@pytest.fixture
+def settings() -> Settings:
+    return Settings.model_construct()
+
+
+@pytest.fixture
+def redis_pool(settings: Settings) -> FakeRedisPoolManager:
+    return FakeRedisPoolManager(settings)
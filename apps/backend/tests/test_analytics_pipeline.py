@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any
+from uuid import UUID
+
+import pytest
+from arq import Retry
+
+from services.redis_pool import RedisPoolManager
+from workers.pipeline import (
+    ANALYTICS_STAGES,
+    ANALYTICS_STAGES_BY_NAME,
+    STAGE_BASELINES,
+    STAGE_CREEP,
+    STAGE_SPENDING,
+    AnalyticsRunState,
+    AnalyticsStage,
+    root_stages,
+)
+from workers.tasks import analytics
+from workers.tasks.analytics import finalize_analytics_run, run_analytics_stage
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class _FakeTaskQueue:
+    def __init__(self) -> None:
+        self.enqueued: list[tuple[str, str, UUID, str]] = []
+        self.finalized: list[tuple[str, UUID]] = []
+
+    @property
+    def stages(self) -> list[str]:
+        return [stage_name for *_, stage_name in self.enqueued]
+
+    async def enqueue_analytics_stage(
+        self, function_name: str, run_id: str, user_id: UUID, stage_name: str
+    ) -> bool:
+        self.enqueued.append((function_name, run_id, user_id, stage_name))
+        return True
+
+    async def enqueue_analytics_finalize(self, run_id: str, user_id: UUID) -> bool:
+        self.finalized.append((run_id, user_id))
+        return True
+
+
+class _FakeCacheHook:
+    def __init__(self) -> None:
+        self.users: list[UUID] = []
+
+    def on_analytics_computation(self, user_id: UUID) -> None:
+        self.users.append(user_id)
+
+
+class _FakeWorkerContext:
+    def __init__(self) -> None:
+        self.task_queue_service = _FakeTaskQueue()
+        self.cache_invalidator = _FakeCacheHook()
+        self.cache_warmer = _FakeCacheHook()
+
+
+def _completed(worker_context: Any, user_id: UUID, log: Any) -> dict[str, Any]:
+    return {"status": "completed"}
+
+
+def _raise(worker_context: Any, user_id: UUID, log: Any) -> dict[str, Any]:
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def ctx(redis_pool: RedisPoolManager) -> dict[str, Any]:
+    return {"redis": redis_pool.get_arq_redis(), "worker_context": _FakeWorkerContext()}
+
+
+@pytest.fixture
+def run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+@pytest.fixture(autouse=True)
+def completing_runners(monkeypatch: pytest.MonkeyPatch) -> None:
+    for stage in ANALYTICS_STAGES:
+        monkeypatch.setitem(analytics._STAGE_RUNNERS, stage.name, _completed)
+
+
+async def _run(ctx: dict[str, Any], run_id: str, stage_name: str, *, job_try: int = 1) -> Any:
+    return await run_analytics_stage({**ctx, "job_try": job_try}, run_id, USER_ID, stage_name)
+
+
+class TestAnalyticsRunState:
+    async def test_record_counts_each_stage_once(self, ctx: dict[str, Any], run_id: str) -> None:
+        state = AnalyticsRunState(ctx["redis"], run_id)
+        await state.start()
+
+        assert await state.record(STAGE_SPENDING, {"status": "completed"}) == 4
+        assert await state.record(STAGE_SPENDING, {"status": "failed"}) == 4
+        assert await state.outcomes() == {STAGE_SPENDING: {"status": "completed"}}
+
+
+class TestAnalyticsStages:
+    async def test_run_finalizes_once_after_every_stage(
+        self, ctx: dict[str, Any], run_id: str
+    ) -> None:
+        queue = ctx["worker_context"].task_queue_service
+        await AnalyticsRunState(ctx["redis"], run_id).start()
+
+        pending = [stage.name for stage in root_stages()]
+        while pending:
+            await _run(ctx, run_id, pending.pop(0))
+            pending.extend(queue.stages)
+            queue.enqueued.clear()
+
+        assert queue.finalized == [(run_id, UUID(USER_ID))]
+
+        await finalize_analytics_run(ctx, run_id, USER_ID)
+
+        worker_context = ctx["worker_context"]
+        assert worker_context.cache_invalidator.users == [UUID(USER_ID)]
+        assert worker_context.cache_warmer.users == [UUID(USER_ID)]
+        assert await AnalyticsRunState(ctx["redis"], run_id).outcomes() == {}
+
+    async def test_dependent_is_enqueued_after_its_dependency(
+        self, ctx: dict[str, Any], run_id: str
+    ) -> None:
+        queue = ctx["worker_context"].task_queue_service
+        await AnalyticsRunState(ctx["redis"], run_id).start()
+
+        await _run(ctx, run_id, STAGE_SPENDING)
+
+        assert queue.stages == [STAGE_BASELINES]
+        assert queue.finalized == []
+
+    async def test_failure_is_retried_before_the_last_try(
+        self, ctx: dict[str, Any], run_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setitem(analytics._STAGE_RUNNERS, STAGE_CREEP, _raise)
+        state = AnalyticsRunState(ctx["redis"], run_id)
+        await state.start()
+
+        with pytest.raises(Retry):
+            await _run(ctx, run_id, STAGE_CREEP, job_try=1)
+        assert await state.outcomes() == {}
+
+        max_tries = ANALYTICS_STAGES_BY_NAME[STAGE_CREEP].max_tries
+        outcome = await _run(ctx, run_id, STAGE_CREEP, job_try=max_tries)
+
+        assert outcome["status"] == "failed"
+        assert (await state.outcomes())[STAGE_CREEP]["status"] == "failed"
+
+    async def test_timeout_records_failure_without_retry(
+        self, ctx: dict[str, Any], run_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def slow(worker_context: Any, user_id: UUID, log: Any) -> dict[str, Any]:
+            time.sleep(0.2)
+            return {"status": "completed"}
+
+        monkeypatch.setitem(analytics._STAGE_RUNNERS, STAGE_CREEP, slow)
+        monkeypatch.setitem(
+            ANALYTICS_STAGES_BY_NAME,
+            STAGE_CREEP,
+            AnalyticsStage(STAGE_CREEP, (STAGE_BASELINES,), timeout_seconds=0, max_tries=2),
+        )
+        state = AnalyticsRunState(ctx["redis"], run_id)
+        await state.start()
+
+        outcome = await _run(ctx, run_id, STAGE_CREEP, job_try=1)
+
+        assert outcome["status"] == "failed"
+        assert (await state.outcomes())[STAGE_CREEP]["status"] == "failed"
+
+    async def test_delivery_past_max_tries_records_failure_without_running(
+        self, ctx: dict[str, Any], run_id: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls: list[UUID] = []
+
+        def tracked(worker_context: Any, user_id: UUID, log: Any) -> dict[str, Any]:
+            calls.append(user_id)
+            return {"status": "completed"}
+
+        monkeypatch.setitem(analytics._STAGE_RUNNERS, STAGE_CREEP, tracked)
+        state = AnalyticsRunState(ctx["redis"], run_id)
+        await state.start()
+
+        max_tries = ANALYTICS_STAGES_BY_NAME[STAGE_CREEP].max_tries
+        outcome = await _run(ctx, run_id, STAGE_CREEP, job_try=max_tries + 1)
+
+        assert outcome["status"] == "failed"
+        assert calls == []
+        assert (await state.outcomes())[STAGE_CREEP]["status"] == "failed"
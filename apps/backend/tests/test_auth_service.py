@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from config import Settings
+from errors import ServiceUnavailableError, UnauthorizedError
+from middleware.exceptions import domain_error_handler
+from services.auth import AuthService
+from services.cache.auth_cache import AuthCache
+from services.cache.base import CacheService
+from services.database import DatabaseService
+from services.redis_pool import RedisPoolManager
+
+
+class _FakeSupabaseAuth:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.entered = threading.Event()
+        self.block = False
+
+    def get_user(self, token: str) -> Any:
+        if self.block:
+            self.entered.set()
+            self.release.wait(timeout=5)
+        if token == "rejected":
+            return None
+        return SimpleNamespace(
+            user=SimpleNamespace(id=str(uuid4()), email="user@example.com", role=None)
+        )
+
+
+class _FakeDatabase(DatabaseService):
+    def __init__(self, settings: Settings) -> None:
+        super().__init__(settings)
+        self.auth = _FakeSupabaseAuth()
+
+    @property
+    def service_client(self) -> Any:
+        return SimpleNamespace(auth=self.auth)
+
+
+@pytest.fixture
+def database(settings: Settings) -> _FakeDatabase:
+    return _FakeDatabase(settings)
+
+
+@pytest.fixture
+def auth_service(
+    settings: Settings, redis_pool: RedisPoolManager, database: _FakeDatabase
+) -> AuthService:
+    auth_cache = AuthCache(CacheService(settings, redis_pool))
+    return AuthService(database, auth_cache, max_concurrency=1, acquire_timeout_seconds=0.05)
+
+
+class TestRemoteValidation:
+    def test_valid_token_is_validated_and_cached(
+        self, auth_service: AuthService, database: _FakeDatabase
+    ) -> None:
+        user = auth_service.validate_token("valid")
+
+        database.auth.block = True
+        assert auth_service.validate_token("valid") == user
+        assert not database.auth.entered.is_set()
+
+    def test_rejected_token_is_unauthorized(self, auth_service: AuthService) -> None:
+        with pytest.raises(UnauthorizedError):
+            auth_service.validate_token("rejected")
+
+    def test_saturation_is_unavailable_not_unauthorized(
+        self, auth_service: AuthService, database: _FakeDatabase
+    ) -> None:
+        database.auth.block = True
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            in_flight = executor.submit(auth_service.validate_token, "first")
+            assert database.auth.entered.wait(timeout=5)
+
+            with pytest.raises(ServiceUnavailableError) as exc_info:
+                auth_service.validate_token("second")
+
+            database.auth.release.set()
+            assert in_flight.result(timeout=5).email == "user@example.com"
+
+        assert exc_info.value.http_status == 503
+        assert exc_info.value.retry_after_seconds == 1
+
+
+class TestServiceUnavailableResponse:
+    def test_response_carries_retry_after(self) -> None:
+        request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+        response = domain_error_handler(request, ServiceUnavailableError(retry_after_seconds=3))
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert "WWW-Authenticate" not in response.headers
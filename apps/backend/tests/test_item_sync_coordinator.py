@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+
+from config import Settings
+from services.item_sync_coordinator import ItemSyncCoordinator
+from services.redis_pool import RedisPoolManager
+
+
+def _coordinator(redis_pool: RedisPoolManager, *, ttl_seconds: int = 300) -> ItemSyncCoordinator:
+    settings = Settings.model_construct(webhook_item_sync_lock_ttl_seconds=ttl_seconds)
+    return ItemSyncCoordinator(settings, redis_pool)
+
+
+class TestItemSyncCoordinator:
+    async def test_second_acquire_is_coalesced(self, redis_pool: RedisPoolManager) -> None:
+        coordinator = _coordinator(redis_pool)
+
+        lease = await coordinator.acquire("item-1")
+
+        assert lease is not None
+        assert lease.locked
+        assert await coordinator.acquire("item-1") is None
+        assert await coordinator.acquire("item-2") is not None
+
+    async def test_release_frees_lock_when_nothing_is_pending(
+        self, redis_pool: RedisPoolManager
+    ) -> None:
+        coordinator = _coordinator(redis_pool)
+        lease = await coordinator.acquire("item-1")
+        assert lease is not None
+
+        await coordinator.begin_run(lease)
+
+        assert await coordinator.release(lease)
+        assert await coordinator.acquire("item-1") is not None
+
+    async def test_release_requests_rerun_when_coalesced_during_run(
+        self, redis_pool: RedisPoolManager
+    ) -> None:
+        coordinator = _coordinator(redis_pool)
+        lease = await coordinator.acquire("item-1")
+        assert lease is not None
+
+        await coordinator.begin_run(lease)
+        assert await coordinator.acquire("item-1") is None
+        assert not await coordinator.release(lease)
+
+        await coordinator.begin_run(lease)
+        assert await coordinator.release(lease)
+        assert await coordinator.acquire("item-1") is not None
+
+    async def test_release_after_lock_was_lost_does_not_rerun(
+        self, redis_pool: RedisPoolManager
+    ) -> None:
+        coordinator = _coordinator(redis_pool)
+        lease = await coordinator.acquire("item-1")
+        assert lease is not None
+        await coordinator.begin_run(lease)
+
+        await redis_pool.get_arq_redis().delete(coordinator._lock_key("item-1"))
+        other = await coordinator.acquire("item-1")
+
+        assert other is not None
+        assert await coordinator.release(lease)
+        assert await coordinator.acquire("item-1") is None
+
+    async def test_abandon_keeps_a_lock_held_by_someone_else(
+        self, redis_pool: RedisPoolManager
+    ) -> None:
+        coordinator = _coordinator(redis_pool)
+        lease = await coordinator.acquire("item-1")
+        assert lease is not None
+
+        await redis_pool.get_arq_redis().set(coordinator._lock_key("item-1"), "other")
+        await coordinator.abandon(lease)
+
+        assert await redis_pool.get_arq_redis().get(coordinator._lock_key("item-1")) == b"other"
+
+    async def test_hold_renews_lock_past_its_ttl(self, redis_pool: RedisPoolManager) -> None:
+        coordinator = _coordinator(redis_pool, ttl_seconds=1)
+        lease = await coordinator.acquire("item-1")
+        assert lease is not None
+        await coordinator.begin_run(lease)
+
+        async with coordinator.hold(lease):
+            await asyncio.sleep(1.5)
+            assert await coordinator.acquire("item-1") is None
+
+        assert await redis_pool.get_arq_redis().pttl(coordinator._lock_key("item-1")) > 0
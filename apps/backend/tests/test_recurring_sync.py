@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from benchmarks.fake_plaid import FakePlaidService
+from benchmarks.memory_database import InMemoryDatabaseService
+from config import Settings
+from repositories.account import AccountRepository
+from repositories.alert import AlertRepository
+from repositories.plaid_item import PlaidItemRepository
+from repositories.recurring_stream import RecurringStreamRepository
+from services.encryption import EncryptionService
+from services.plaid import InstitutionLimiter, PlaidRecurringResponse, PlaidRecurringStream
+from services.recurring.alert_detection import AlertDetectionService
+from services.recurring.sync_service import RecurringSyncService
+
+ACCOUNT_ID = "plaid-account-0"
+ENCRYPTION = EncryptionService("test-encryption-key")
+
+
+def _stream(stream_id: str, merchant_name: str, last_amount: float) -> dict[str, Any]:
+    return {
+        "stream_id": stream_id,
+        "account_id": ACCOUNT_ID,
+        "description": merchant_name.upper(),
+        "merchant_name": merchant_name,
+        "first_date": "2026-01-05",
+        "last_date": "2026-06-05",
+        "predicted_next_date": "2026-07-05",
+        "frequency": "MONTHLY",
+        "average_amount": {"amount": 15.99, "iso_currency_code": "USD"},
+        "last_amount": {"amount": last_amount, "iso_currency_code": "USD"},
+        "is_active": True,
+        "status": "MATURE",
+        "is_user_modified": False,
+        "transaction_ids": [f"{stream_id}-txn-{month}" for month in range(6)],
+        "personal_finance_category": {
+            "primary": "ENTERTAINMENT",
+            "detailed": "ENTERTAINMENT_TV_AND_MOVIES",
+        },
+    }
+
+
+class _RecurringPlaidService(FakePlaidService):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.outflow = [
+            _stream("stream-video", "Video Service", 15.99),
+            _stream("stream-music", "Music Service", 15.99),
+        ]
+
+    def get_recurring_transactions(
+        self,
+        access_token: str,  # noqa: ARG002
+        account_ids: list[str] | None = None,  # noqa: ARG002
+    ) -> PlaidRecurringResponse:
+        return PlaidRecurringResponse(
+            inflow_streams=[],
+            outflow_streams=[PlaidRecurringStream(dict(stream)) for stream in self.outflow],
+            updated_datetime=None,
+        )
+
+
+class _RecordingStreamRepository(RecurringStreamRepository):
+    def __init__(self, database: InMemoryDatabaseService) -> None:
+        super().__init__(database)
+        self.upserted: list[list[str]] = []
+
+    def upsert_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.upserted.append([row["stream_id"] for row in rows])
+        return super().upsert_rows(rows)
+
+
+@pytest.fixture
+def database(settings: Settings) -> InMemoryDatabaseService:
+    return InMemoryDatabaseService(settings)
+
+
+@pytest.fixture
+def plaid() -> _RecurringPlaidService:
+    return _RecurringPlaidService()
+
+
+@pytest.fixture
+def stream_repo(database: InMemoryDatabaseService) -> _RecordingStreamRepository:
+    return _RecordingStreamRepository(database)
+
+
+@pytest.fixture
+def plaid_item_id(database: InMemoryDatabaseService) -> UUID:
+    plaid_item_id = uuid4()
+    database.table("plaid_items").insert(
+        {
+            "id": str(plaid_item_id),
+            "user_id": str(uuid4()),
+            "item_id": "item-1",
+            "encrypted_access_token": ENCRYPTION.encrypt("access-token"),
+            "status": "active",
+        }
+    ).execute()
+    database.table("accounts").insert(
+        {"plaid_item_id": str(plaid_item_id), "account_id": ACCOUNT_ID, "name": "Checking"}
+    ).execute()
+    return plaid_item_id
+
+
+@pytest.fixture
+def sync_service(
+    database: InMemoryDatabaseService,
+    plaid: _RecurringPlaidService,
+    stream_repo: _RecordingStreamRepository,
+) -> RecurringSyncService:
+    alert_repo = AlertRepository(database)
+    return RecurringSyncService(
+        plaid_service=plaid,
+        encryption_service=ENCRYPTION,
+        plaid_item_repo=PlaidItemRepository(database),
+        account_repo=AccountRepository(database),
+        recurring_stream_repo=stream_repo,
+        alert_repo=alert_repo,
+        alert_detection_service=AlertDetectionService(alert_repo),
+        institution_limiter=InstitutionLimiter(1),
+    )
+
+
+class TestRecurringStreamDiff:
+    def test_first_sync_writes_every_stream(
+        self,
+        sync_service: RecurringSyncService,
+        stream_repo: _RecordingStreamRepository,
+        plaid_item_id: UUID,
+    ) -> None:
+        result = sync_service.sync_for_plaid_item(plaid_item_id)
+
+        assert result.streams_created == 2
+        assert result.streams_unchanged == 0
+        assert stream_repo.upserted == [["stream-video", "stream-music"]]
+
+    def test_identical_streams_are_not_rewritten(
+        self,
+        sync_service: RecurringSyncService,
+        stream_repo: _RecordingStreamRepository,
+        database: InMemoryDatabaseService,
+        plaid_item_id: UUID,
+    ) -> None:
+        sync_service.sync_for_plaid_item(plaid_item_id)
+        alerts = len(database.table("alerts").select("*").execute().data)
+
+        result = sync_service.sync_for_plaid_item(plaid_item_id)
+
+        assert result.streams_unchanged == 2
+        assert result.streams_created == 0
+        assert result.streams_updated == 0
+        assert result.alerts_created == 0
+        assert stream_repo.upserted[-1] == []
+        assert len(database.table("alerts").select("*").execute().data) == alerts
+
+    def test_changed_last_amount_rewrites_only_that_stream(
+        self,
+        sync_service: RecurringSyncService,
+        plaid: _RecurringPlaidService,
+        stream_repo: _RecordingStreamRepository,
+        plaid_item_id: UUID,
+    ) -> None:
+        sync_service.sync_for_plaid_item(plaid_item_id)
+        plaid.outflow[1] = _stream("stream-music", "Music Service", 19.99)
+
+        result = sync_service.sync_for_plaid_item(plaid_item_id)
+
+        assert result.streams_updated == 1
+        assert result.streams_unchanged == 1
+        assert stream_repo.upserted[-1] == ["stream-music"]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from arq.jobs import Job, JobStatus
+
+from config import Settings
+from services.redis_pool import RedisPoolManager
+from services.task_queue import QueueLane, TaskQueueService, get_queue_name
+
+WEBHOOK: dict[str, Any] = {
+    "webhook_type": "TRANSACTIONS",
+    "webhook_code": "SYNC_UPDATES_AVAILABLE",
+    "item_id": "item-1",
+    "payload": {"item_id": "item-1"},
+}
+
+
+@pytest.fixture
+def task_queue(settings: Settings, redis_pool: RedisPoolManager) -> TaskQueueService:
+    return TaskQueueService(settings, redis_pool)
+
+
+class TestWebhookClaims:
+    async def test_claim_records_event_until_persisted(self, task_queue: TaskQueueService) -> None:
+        event_id = uuid4()
+
+        assert await task_queue.claim_and_enqueue_webhook("key-1", event_id, **WEBHOOK)
+
+        records = await task_queue.get_unpersisted_webhooks()
+        assert list(records) == [event_id]
+        assert records[event_id]["idempotency_key"] == "key-1"
+        assert records[event_id]["payload"] == WEBHOOK["payload"]
+
+        await task_queue.mark_webhook_persisted(event_id)
+
+        assert await task_queue.get_unpersisted_webhooks() == {}
+
+    async def test_claim_queues_the_webhook_job(
+        self, task_queue: TaskQueueService, redis_pool: RedisPoolManager
+    ) -> None:
+        event_id = uuid4()
+
+        await task_queue.claim_and_enqueue_webhook("key-1", event_id, **WEBHOOK)
+
+        job = Job(
+            f"webhook:{event_id}",
+            redis_pool.get_arq_redis(),
+            _queue_name=get_queue_name(QueueLane.HIGH),
+        )
+        assert await job.status() == JobStatus.queued
+        info = await job.info()
+        assert info is not None
+        assert info.function == "process_plaid_webhook"
+        assert info.args == (
+            str(event_id),
+            WEBHOOK["webhook_type"],
+            WEBHOOK["webhook_code"],
+            WEBHOOK["item_id"],
+            WEBHOOK["payload"],
+        )
+        assert info.kwargs == {"idempotency_key": "key-1"}
+
+    async def test_duplicate_claim_is_rejected_and_not_recorded(
+        self, task_queue: TaskQueueService, redis_pool: RedisPoolManager
+    ) -> None:
+        first, second = uuid4(), uuid4()
+
+        assert await task_queue.claim_and_enqueue_webhook("key-1", first, **WEBHOOK)
+        assert not await task_queue.claim_and_enqueue_webhook("key-1", second, **WEBHOOK)
+
+        assert list(await task_queue.get_unpersisted_webhooks()) == [first]
+        job = Job(f"webhook:{second}", redis_pool.get_arq_redis())
+        assert await job.status() == JobStatus.not_found
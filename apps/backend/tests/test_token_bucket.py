@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from limits import RateLimitItemPerMinute
+from limits.storage import RedisStorage
+from redis import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from middleware.token_bucket import TokenBucketRateLimiter
+from services.redis_pool import RedisPoolManager
+
+CLIENT = "user:1"
+
+
+@pytest.fixture
+def redis_client(redis_pool: RedisPoolManager) -> Redis:
+    return redis_pool.get_client()
+
+
+@pytest.fixture
+def storage(redis_client: Redis) -> RedisStorage:
+    return RedisStorage("redis://localhost:6379", connection_pool=redis_client.connection_pool)
+
+
+def _bucket_key(item: RateLimitItemPerMinute) -> str:
+    return f"{RedisStorage.PREFIX}:{item.key_for(CLIENT)}"
+
+
+def _tokens(redis_client: Redis, item: RateLimitItemPerMinute) -> int:
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hget(_bucket_key(item), "tokens")
+        (raw,) = pipe.execute()
+    return int(float(raw))
+
+
+def _fail(**_: Any) -> Any:
+    raise RedisConnectionError("redis unavailable")
+
+
+class TestHit:
+    def test_requests_beyond_capacity_are_denied(self, storage: RedisStorage) -> None:
+        limiter = TokenBucketRateLimiter(storage)
+        item = RateLimitItemPerMinute(2)
+
+        assert limiter.hit(item, CLIENT)
+        assert limiter.hit(item, CLIENT)
+        assert not limiter.hit(item, CLIENT)
+
+        stats = limiter.get_window_stats(item, CLIENT)
+        assert stats.remaining == 0
+        assert stats.reset_time > time.time()
+
+    def test_bucket_refills_with_elapsed_time(
+        self, storage: RedisStorage, redis_client: Redis
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage)
+        item = RateLimitItemPerMinute(2)
+        limiter.hit(item, CLIENT, cost=2)
+        assert not limiter.hit(item, CLIENT)
+
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.hget(_bucket_key(item), "ts")
+            (ts,) = pipe.execute()
+            pipe.hset(_bucket_key(item), "ts", str(int(ts) - 30_000))
+            pipe.execute()
+
+        assert limiter.hit(item, CLIENT)
+        assert not limiter.hit(item, CLIENT)
+
+    def test_cost_larger_than_remaining_is_denied_without_debit(
+        self, storage: RedisStorage
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage)
+        item = RateLimitItemPerMinute(5)
+        limiter.hit(item, CLIENT, cost=3)
+
+        assert not limiter.hit(item, CLIENT, cost=3)
+        assert limiter.hit(item, CLIENT, cost=2)
+
+
+class TestCharge:
+    def test_charge_debits_redis_directly(self, storage: RedisStorage, redis_client: Redis) -> None:
+        limiter = TokenBucketRateLimiter(storage)
+        item = RateLimitItemPerMinute(5)
+
+        limiter.charge(item, CLIENT, cost=3)
+
+        assert _tokens(redis_client, item) == 2
+        assert limiter.get_window_stats(item, CLIENT).remaining == 2
+
+    def test_charge_is_held_locally_and_debited_on_next_sync(
+        self, storage: RedisStorage, redis_client: Redis
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage, local_fraction=0.5)
+        item = RateLimitItemPerMinute(10)
+        limiter.hit(item, CLIENT)
+
+        limiter.charge(item, CLIENT, cost=3)
+
+        assert _tokens(redis_client, item) == 9
+        assert limiter.get_window_stats(item, CLIENT).remaining == 6
+
+        assert limiter.hit(item, CLIENT, cost=2)
+        assert _tokens(redis_client, item) == 4
+
+
+class TestLocalAdmission:
+    def test_local_hits_are_pending_until_next_sync(
+        self, storage: RedisStorage, redis_client: Redis
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage, local_fraction=0.5)
+        item = RateLimitItemPerMinute(10)
+
+        assert limiter.hit(item, CLIENT)
+        for _ in range(4):
+            assert limiter.hit(item, CLIENT)
+
+        assert _tokens(redis_client, item) == 9
+        assert limiter.get_window_stats(item, CLIENT).remaining == 5
+
+        assert limiter.hit(item, CLIENT)
+        assert _tokens(redis_client, item) == 4
+
+    def test_pending_is_restored_when_redis_fails(
+        self, storage: RedisStorage, redis_client: Redis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage, local_fraction=0.5)
+        item = RateLimitItemPerMinute(10)
+        for _ in range(5):
+            limiter.hit(item, CLIENT)
+        script = limiter._script
+
+        monkeypatch.setattr(limiter, "_script", _fail)
+        with pytest.raises(RedisConnectionError):
+            limiter.hit(item, CLIENT)
+
+        assert limiter.get_window_stats(item, CLIENT).remaining == 5
+
+        monkeypatch.setattr(limiter, "_script", script)
+        assert limiter.hit(item, CLIENT)
+        assert _tokens(redis_client, item) == 4
+
+    def test_local_state_expires_after_sync_interval(
+        self, storage: RedisStorage, redis_client: Redis
+    ) -> None:
+        limiter = TokenBucketRateLimiter(storage, local_fraction=0.5, local_sync_seconds=0)
+        item = RateLimitItemPerMinute(10)
+
+        limiter.hit(item, CLIENT)
+        limiter.hit(item, CLIENT)
+
+        assert _tokens(redis_client, item) == 8
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+from uuid import uuid4
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from config import Settings
+from errors import UnauthorizedError
+from services.token_verification import SupabaseTokenVerifier
+
+SUPABASE_URL = "https://project.supabase.co"
+ISSUER = f"{SUPABASE_URL}/auth/v1"
+SECRET = "test-jwt-secret-that-is-long-enough-for-hs256"
+
+
+def _claims(**overrides: Any) -> dict[str, Any]:
+    claims = {
+        "sub": str(uuid4()),
+        "aud": "authenticated",
+        "iss": ISSUER,
+        "exp": int(time.time()) + 60,
+        "email": "user@example.com",
+        "role": "authenticated",
+    }
+    claims.update(overrides)
+    return claims
+
+
+class TestSecretVerification:
+    @pytest.fixture
+    def verifier(self) -> SupabaseTokenVerifier:
+        settings = Settings.model_construct(
+            supabase_url=SUPABASE_URL,
+            supabase_jwt_verification="secret",
+            supabase_jwt_secret=SECRET,
+        )
+        return SupabaseTokenVerifier(settings)
+
+    def test_valid_token_is_verified_locally(self, verifier: SupabaseTokenVerifier) -> None:
+        claims = _claims()
+
+        user = verifier.verify(jwt.encode(claims, SECRET, algorithm="HS256"))
+
+        assert user is not None
+        assert str(user.id) == claims["sub"]
+        assert user.email == "user@example.com"
+
+    def test_expired_token_is_rejected(self, verifier: SupabaseTokenVerifier) -> None:
+        token = jwt.encode(_claims(exp=int(time.time()) - 10), SECRET, algorithm="HS256")
+
+        with pytest.raises(UnauthorizedError):
+            verifier.verify(token)
+
+    def test_asymmetric_token_is_left_to_supabase(self, verifier: SupabaseTokenVerifier) -> None:
+        token = jwt.encode(_claims(), ec.generate_private_key(ec.SECP256R1()), algorithm="ES256")
+
+        assert verifier.verify(token) is None
+
+
+class TestJwksVerification:
+    @pytest.fixture
+    def signing_key(self) -> ec.EllipticCurvePrivateKey:
+        return ec.generate_private_key(ec.SECP256R1())
+
+    @pytest.fixture
+    def fetches(
+        self, monkeypatch: pytest.MonkeyPatch, signing_key: ec.EllipticCurvePrivateKey
+    ) -> list[str]:
+        jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(signing_key.public_key()))
+        jwks = {"keys": [{**jwk, "kid": "current", "use": "sig", "alg": "ES256"}]}
+        fetched: list[str] = []
+
+        def fetch_data(client: jwt.PyJWKClient) -> Any:
+            fetched.append(client.uri)
+            return jwks
+
+        monkeypatch.setattr(jwt.PyJWKClient, "fetch_data", fetch_data)
+        return fetched
+
+    @pytest.fixture
+    def verifier(self) -> SupabaseTokenVerifier:
+        settings = Settings.model_construct(
+            supabase_url=SUPABASE_URL, supabase_jwt_verification="jwks"
+        )
+        return SupabaseTokenVerifier(settings)
+
+    def test_token_signed_with_published_key_is_verified(
+        self,
+        verifier: SupabaseTokenVerifier,
+        signing_key: ec.EllipticCurvePrivateKey,
+        fetches: list[str],
+    ) -> None:
+        token = jwt.encode(_claims(), signing_key, algorithm="ES256", headers={"kid": "current"})
+
+        assert verifier.verify(token) is not None
+        assert fetches == [f"{ISSUER}/.well-known/jwks.json"]
+
+    def test_unknown_kid_is_rejected_after_one_refresh(
+        self,
+        verifier: SupabaseTokenVerifier,
+        signing_key: ec.EllipticCurvePrivateKey,
+        fetches: list[str],
+    ) -> None:
+        token = jwt.encode(_claims(), signing_key, algorithm="ES256", headers={"kid": "unknown"})
+
+        with pytest.raises(UnauthorizedError):
+            verifier.verify(token)
+        assert len(fetches) == 2
+
+    def test_unreachable_jwks_falls_back_to_supabase(
+        self,
+        verifier: SupabaseTokenVerifier,
+        signing_key: ec.EllipticCurvePrivateKey,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def fetch_data(client: jwt.PyJWKClient) -> Any:
+            raise jwt.PyJWKClientConnectionError("connection refused")
+
+        monkeypatch.setattr(jwt.PyJWKClient, "fetch_data", fetch_data)
+        token = jwt.encode(_claims(), signing_key, algorithm="ES256", headers={"kid": "current"})
+
+        assert verifier.verify(token) is None
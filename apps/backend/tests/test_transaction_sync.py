@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from plaid.exceptions import ApiException
+
+from benchmarks.fake_plaid import FakePlaidService, generate_transactions
+from benchmarks.memory_database import InMemoryDatabaseService
+from config import Settings
+from models.transaction import PlaidTransactionData, TransactionCreate
+from repositories.account import AccountRepository
+from repositories.plaid_item import PlaidItemRepository
+from repositories.transaction import TransactionRepository
+from services.content_hash import content_hash
+from services.encryption import EncryptionService
+from services.transaction_sync import (
+    TransactionSyncError,
+    TransactionSyncService,
+    _PendingWrites,
+)
+
+ACCOUNT_IDS = ["plaid-account-0", "plaid-account-1"]
+PAGE_SIZE = 10
+ENCRYPTION = EncryptionService("test-encryption-key")
+
+
+class _FailingPlaidService(FakePlaidService):
+    def __init__(self, transactions: list[PlaidTransactionData], page_size: int) -> None:
+        super().__init__(transactions, page_size=page_size)
+        self.failures: dict[str, Exception] = {}
+
+    def sync_transactions(
+        self, access_token: str, cursor: str | None = None
+    ) -> tuple[list[PlaidTransactionData], list[PlaidTransactionData], list[str], str, bool]:
+        failure = self.failures.pop(cursor or "", None)
+        if failure is not None:
+            raise failure
+        return super().sync_transactions(access_token, cursor)
+
+
+def _mutation_error() -> ApiException:
+    error = ApiException(status=400, reason="Bad Request")
+    error.body = '{"error_code": "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION"}'
+    return error
+
+
+class _RecordingPlaidItemRepository(PlaidItemRepository):
+    def __init__(self, database: InMemoryDatabaseService) -> None:
+        super().__init__(database)
+        self._database = database
+        self.checkpoints: list[tuple[str | None, int, bool]] = []
+
+    def update_sync_state(
+        self, record_id: UUID, cursor: str | None, *, completed: bool
+    ) -> dict[str, Any] | None:
+        self.checkpoints.append((cursor, _stored_count(self._database), completed))
+        return super().update_sync_state(record_id, cursor, completed=completed)
+
+
+def _sync_service(
+    database: InMemoryDatabaseService,
+    plaid: FakePlaidService,
+    plaid_item_repo: PlaidItemRepository,
+    *,
+    checkpoint_pages: int,
+) -> TransactionSyncService:
+    return TransactionSyncService(
+        plaid_service=plaid,
+        encryption_service=ENCRYPTION,
+        plaid_item_repo=plaid_item_repo,
+        account_repo=AccountRepository(database),
+        transaction_repo=TransactionRepository(database),
+        checkpoint_pages=checkpoint_pages,
+    )
+
+
+@pytest.fixture
+def database(settings: Settings) -> InMemoryDatabaseService:
+    return InMemoryDatabaseService(settings)
+
+
+@pytest.fixture
+def plaid() -> _FailingPlaidService:
+    return _FailingPlaidService(
+        generate_transactions(ACCOUNT_IDS, PAGE_SIZE * 3, seed=7), page_size=PAGE_SIZE
+    )
+
+
+@pytest.fixture
+def plaid_item_id(database: InMemoryDatabaseService) -> UUID:
+    plaid_item_id = uuid4()
+    database.table("plaid_items").insert(
+        {
+            "id": str(plaid_item_id),
+            "user_id": str(uuid4()),
+            "item_id": "item-1",
+            "encrypted_access_token": ENCRYPTION.encrypt("access-token"),
+            "status": "active",
+        }
+    ).execute()
+    database.table("accounts").insert(
+        [
+            {"plaid_item_id": str(plaid_item_id), "account_id": account_id, "name": account_id}
+            for account_id in ACCOUNT_IDS
+        ]
+    ).execute()
+    return plaid_item_id
+
+
+@pytest.fixture
+def plaid_item_repo(database: InMemoryDatabaseService) -> _RecordingPlaidItemRepository:
+    return _RecordingPlaidItemRepository(database)
+
+
+@pytest.fixture
+def sync_service(
+    database: InMemoryDatabaseService,
+    plaid: _FailingPlaidService,
+    plaid_item_repo: _RecordingPlaidItemRepository,
+) -> TransactionSyncService:
+    return _sync_service(database, plaid, plaid_item_repo, checkpoint_pages=1)
+
+
+def _stored_rows(database: InMemoryDatabaseService) -> dict[str, dict[str, Any]]:
+    rows = database.table("transactions").select("*").execute().data
+    return {row["transaction_id"]: row for row in rows}
+
+
+def _stored_count(database: InMemoryDatabaseService) -> int:
+    return len(_stored_rows(database))
+
+
+def _reference_row(txn: PlaidTransactionData, account_id: UUID) -> dict[str, Any]:
+    location = txn.location or {}
+    pfc = txn.personal_finance_category or {}
+    model = TransactionCreate(
+        account_id=account_id,
+        transaction_id=txn.transaction_id,
+        amount=txn.amount,
+        iso_currency_code=txn.iso_currency_code or "USD",
+        date=txn.date,
+        datetime=txn.datetime_field,
+        authorized_date=txn.authorized_date,
+        authorized_datetime=txn.authorized_datetime,
+        name=txn.name,
+        merchant_name=txn.merchant_name,
+        payment_channel=txn.payment_channel,
+        pending=txn.pending,
+        pending_transaction_id=txn.pending_transaction_id,
+        category_id=txn.category_id,
+        category=txn.category,
+        personal_finance_category_primary=pfc.get("primary"),
+        personal_finance_category_detailed=pfc.get("detailed"),
+        personal_finance_category_confidence=pfc.get("confidence_level"),
+        location_address=location.get("address"),
+        location_city=location.get("city"),
+        location_region=location.get("region"),
+        location_postal_code=location.get("postal_code"),
+        location_country=location.get("country"),
+        location_lat=Decimal(str(location["lat"])) if location.get("lat") else None,
+        location_lon=Decimal(str(location["lon"])) if location.get("lon") else None,
+        logo_url=txn.logo_url,
+        website=txn.website,
+        check_number=txn.check_number,
+    )
+    return model.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+FULL_TRANSACTION = PlaidTransactionData(
+    transaction_id="txn-full",
+    account_id="plaid-account",
+    amount=Decimal("42.10"),
+    iso_currency_code="CAD",
+    date=date(2026, 3, 14),
+    datetime=datetime(2026, 3, 14, 18, 30, 5, 250000, tzinfo=UTC),
+    authorized_date=date(2026, 3, 13),
+    authorized_datetime=datetime(2026, 3, 13, 9, 0, tzinfo=timezone(timedelta(hours=-5))),
+    name="COFFEE SHOP 123",
+    merchant_name="Coffee Shop",
+    payment_channel="in store",
+    pending=True,
+    pending_transaction_id="txn-pending",
+    category_id="13005043",
+    category=["Food and Drink", "Coffee Shop"],
+    personal_finance_category={
+        "primary": "FOOD_AND_DRINK",
+        "detailed": "FOOD_AND_DRINK_COFFEE",
+        "confidence_level": "VERY_HIGH",
+    },
+    location={
+        "address": "1 Main St",
+        "city": "Toronto",
+        "region": "ON",
+        "postal_code": "M5V 1A1",
+        "country": "CA",
+        "lat": 43.6532,
+        "lon": -79.3832,
+    },
+    logo_url="https://example.com/logo.png",
+    website="example.com",
+    check_number="1001",
+)
+
+SPARSE_TRANSACTION = PlaidTransactionData(
+    transaction_id="txn-sparse",
+    account_id="plaid-account",
+    amount=Decimal("-1500"),
+    iso_currency_code=None,
+    date=date(2026, 3, 1),
+    datetime=datetime(2026, 3, 1, 0, 0, tzinfo=UTC),
+    name="PAYROLL",
+)
+
+
+class TestTransactionRow:
+    @pytest.mark.parametrize("txn", [FULL_TRANSACTION, SPARSE_TRANSACTION])
+    def test_row_matches_transaction_create_dump(
+        self, sync_service: TransactionSyncService, txn: PlaidTransactionData
+    ) -> None:
+        account_id = uuid4()
+
+        row = sync_service._to_transaction_row(txn, account_id)
+        row_hash = row.pop("content_hash")
+
+        assert row == _reference_row(txn, account_id)
+        assert row_hash == content_hash(_reference_row(txn, account_id))
+
+    def test_utc_datetimes_use_pydantic_z_suffix(
+        self, sync_service: TransactionSyncService
+    ) -> None:
+        row = sync_service._to_transaction_row(FULL_TRANSACTION, uuid4())
+
+        assert row["datetime"] == "2026-03-14T18:30:05.250000Z"
+        assert row["authorized_datetime"] == "2026-03-13T09:00:00-05:00"
+
+
+class TestSyncTotals:
+    def test_restart_counts_pages_committed_before_the_mutation(
+        self,
+        sync_service: TransactionSyncService,
+        plaid: _FailingPlaidService,
+        database: InMemoryDatabaseService,
+        plaid_item_id: UUID,
+    ) -> None:
+        plaid.failures["2"] = _mutation_error()
+
+        result = sync_service.sync_plaid_item(plaid_item_id)
+
+        assert _stored_count(database) == PAGE_SIZE * 3
+        assert result.added == PAGE_SIZE * 3
+        assert result.changed == PAGE_SIZE * 3
+        assert result.has_changes
+
+    def test_failure_after_a_checkpoint_reports_committed_changes(
+        self,
+        sync_service: TransactionSyncService,
+        plaid: _FailingPlaidService,
+        database: InMemoryDatabaseService,
+        plaid_item_id: UUID,
+    ) -> None:
+        plaid.failures["2"] = RuntimeError("plaid unavailable")
+
+        with pytest.raises(TransactionSyncError) as exc_info:
+            sync_service.sync_plaid_item(plaid_item_id)
+
+        assert exc_info.value.changed == PAGE_SIZE * 2
+        assert _stored_count(database) == PAGE_SIZE * 2
+
+    def test_failure_before_any_checkpoint_is_raised_unchanged(
+        self,
+        sync_service: TransactionSyncService,
+        plaid: _FailingPlaidService,
+        plaid_item_id: UUID,
+    ) -> None:
+        plaid.failures[""] = RuntimeError("plaid unavailable")
+
+        with pytest.raises(RuntimeError):
+            sync_service.sync_plaid_item(plaid_item_id)
+
+
+def _row(transaction_id: str, amount: str = "10.00") -> dict[str, Any]:
+    return {"transaction_id": transaction_id, "amount": amount}
+
+
+class TestPendingWrites:
+    def test_added_then_removed_is_only_deleted(self) -> None:
+        pending = _PendingWrites()
+
+        pending.upsert([_row("txn-1")])
+        pending.remove(["txn-1"])
+
+        assert pending.upserts == {}
+        assert pending.removals == {"txn-1"}
+
+    def test_removed_then_readded_is_only_upserted(self) -> None:
+        pending = _PendingWrites()
+
+        pending.remove(["txn-1"])
+        pending.upsert([_row("txn-1")])
+
+        assert pending.upserts == {"txn-1": _row("txn-1")}
+        assert pending.removals == set()
+
+    def test_later_page_wins_and_tracks_modified(self) -> None:
+        pending = _PendingWrites()
+
+        pending.upsert([_row("txn-1", "10.00")])
+        pending.upsert([_row("txn-1", "12.00")], modified=True)
+
+        assert pending.upserts["txn-1"]["amount"] == "12.00"
+        assert pending.modified == {"txn-1"}
+
+        pending.upsert([_row("txn-1", "13.00")])
+
+        assert pending.modified == set()
+
+    def test_removal_clears_modified(self) -> None:
+        pending = _PendingWrites()
+
+        pending.upsert([_row("txn-1")], modified=True)
+        pending.remove(["txn-1"])
+
+        assert pending.modified == set()
+
+
+class TestCheckpoints:
+    def test_rows_are_written_before_each_cursor(
+        self,
+        database: InMemoryDatabaseService,
+        plaid: _FailingPlaidService,
+        plaid_item_repo: _RecordingPlaidItemRepository,
+        plaid_item_id: UUID,
+    ) -> None:
+        sync_service = _sync_service(database, plaid, plaid_item_repo, checkpoint_pages=2)
+
+        sync_service.sync_plaid_item(plaid_item_id)
+
+        assert plaid_item_repo.checkpoints == [
+            ("2", PAGE_SIZE * 2, False),
+            ("3", PAGE_SIZE * 3, True),
+        ]
+
+    def test_cursor_moves_every_page_with_checkpoint_pages_one(
+        self,
+        sync_service: TransactionSyncService,
+        plaid_item_repo: _RecordingPlaidItemRepository,
+        plaid_item_id: UUID,
+    ) -> None:
+        sync_service.sync_plaid_item(plaid_item_id)
+
+        assert plaid_item_repo.checkpoints == [
+            ("1", PAGE_SIZE, False),
+            ("2", PAGE_SIZE * 2, False),
+            ("3", PAGE_SIZE * 3, True),
+        ]
+
+    def test_next_sync_resumes_from_last_checkpoint(
+        self,
+        sync_service: TransactionSyncService,
+        plaid: _FailingPlaidService,
+        database: InMemoryDatabaseService,
+        plaid_item_id: UUID,
+    ) -> None:
+        plaid.failures["2"] = RuntimeError("plaid unavailable")
+        with pytest.raises(TransactionSyncError):
+            sync_service.sync_plaid_item(plaid_item_id)
+        calls_before = plaid.calls
+
+        result = sync_service.sync_plaid_item(plaid_item_id)
+
+        assert plaid.calls - calls_before == 1
+        assert result.added == PAGE_SIZE
+        assert result.cursor == "3"
+        assert _stored_count(database) == PAGE_SIZE * 3
+
+
+class TestDropUnchanged:
+    def test_modified_rows_matching_stored_hash_are_skipped(
+        self,
+        sync_service: TransactionSyncService,
+        plaid: _FailingPlaidService,
+        database: InMemoryDatabaseService,
+        plaid_item_id: UUID,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        transactions = generate_transactions(ACCOUNT_IDS, PAGE_SIZE * 3, seed=7)
+        sync_service.sync_plaid_item(plaid_item_id)
+        changed = transactions[2].model_copy(update={"amount": Decimal("1234.56")})
+        modified = [transactions[0], transactions[1], changed]
+
+        def resend(
+            access_token: str, cursor: str | None = None
+        ) -> tuple[list[PlaidTransactionData], list[PlaidTransactionData], list[str], str, bool]:
+            return [], modified, [], "4", False
+
+        monkeypatch.setattr(plaid, "sync_transactions", resend)
+
+        result = sync_service.sync_plaid_item(plaid_item_id)
+
+        assert result.unchanged == 2
+        assert result.modified == 1
+        assert result.changed == 1
+        assert _stored_rows(database)[changed.transaction_id]["amount"] == "1234.56"
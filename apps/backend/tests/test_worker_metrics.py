@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+from collections.abc import AsyncIterator
+
+import pytest
+
+from services.plaid import PlaidServiceContainer, get_plaid_service
+from workers.metrics import start_metrics_server
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+async def _get(port: int, path: str) -> tuple[str, str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = (await reader.read()).decode()
+    writer.close()
+    head, _, body = response.partition("\r\n\r\n")
+    return head.splitlines()[0], body
+
+
+@pytest.fixture
+async def port() -> AsyncIterator[int]:
+    port = _free_port()
+    server = await start_metrics_server("127.0.0.1", port)
+    assert server is not None
+    yield port
+    server.close()
+    await server.wait_closed()
+    PlaidServiceContainer.reset()
+
+
+class TestWorkerMetrics:
+    async def test_serves_plaid_latency_recorded_in_process(self, port: int) -> None:
+        get_plaid_service()._metrics.observe("transactions_sync", 0.3)
+
+        status, body = await _get(port, "/metrics")
+
+        assert status == "HTTP/1.1 200 OK"
+        assert 'fi_plaid_request_seconds_count{endpoint="transactions_sync"} 1' in body
+
+    async def test_other_paths_are_not_found(self, port: int) -> None:
+        status, _ = await _get(port, "/")
+
+        assert status == "HTTP/1.1 404 Not Found"
+
+    async def test_disabled_port_starts_nothing(self) -> None:
+        assert await start_metrics_server("127.0.0.1", 0) is None
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
     from services.analytics.creep_scorer import CreepScorer
     from services.analytics.merchant_stats_aggregator import MerchantStatsAggregator
     from services.cache.invalidation import CacheInvalidator
+    from services.cache.warming import CacheWarmer
+    from services.item_sync_coordinator import ItemSyncCoordinator
     from services.recurring import RecurringSyncService
     from services.task_queue import TaskQueueService
     from services.transaction_sync import TransactionSyncService
@@ -23,6 +25,8 @@ class WorkerContext:
     baseline_calculator: "BaselineCalculator"
     creep_scorer: "CreepScorer"
     cache_invalidator: "CacheInvalidator"
+    cache_warmer: "CacheWarmer"
+    task_queue_service: "TaskQueueService"
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,6 +34,7 @@ class WebhookWorkerContext:
     webhook_event_repo: "WebhookEventRepository"
     plaid_item_repo: "PlaidItemRepository"
     transaction_sync_service: "TransactionSyncService"
+    sync_coordinator: "ItemSyncCoordinator"
     recurring_sync_service: "RecurringSyncService"
     task_queue_service: "TaskQueueService"
     spending_manager: "SpendingComputationManager"
@@ -38,3 +43,4 @@ class WebhookWorkerContext:
     baseline_calculator: "BaselineCalculator"
     creep_scorer: "CreepScorer"
     cache_invalidator: "CacheInvalidator"
+    cache_warmer: "CacheWarmer"
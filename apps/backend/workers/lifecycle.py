@@ -53,6 +53,7 @@ async def startup(ctx: dict[str, Any]) -> None:
     from services.analytics.transfer_detector import TransferDetectorContainer
     from services.database import DatabaseServiceContainer
     from services.encryption import EncryptionServiceContainer
+    from services.item_sync_coordinator import ItemSyncCoordinatorContainer
     from services.plaid import PlaidServiceContainer
     from services.recurring import RecurringSyncServiceContainer
     from services.task_queue import TaskQueueServiceContainer
@@ -74,9 +75,11 @@ async def startup(ctx: dict[str, Any]) -> None:
 
     from services.cache.base import CacheServiceContainer
     from services.cache.invalidation import CacheInvalidatorContainer
+    from services.cache.warming import CacheWarmerContainer
 
     CacheServiceContainer.get()
     cache_invalidator = CacheInvalidatorContainer.get()
+    cache_warmer = CacheWarmerContainer.get()
 
     spending_manager = SpendingComputationManagerContainer.get()
     merchant_aggregator = MerchantStatsAggregatorContainer.get()
@@ -91,6 +94,8 @@ async def startup(ctx: dict[str, Any]) -> None:
         baseline_calculator=baseline_calculator,
         creep_scorer=creep_scorer,
         cache_invalidator=cache_invalidator,
+        cache_warmer=cache_warmer,
+        task_queue_service=TaskQueueServiceContainer.get(),
     )
 
     ctx["worker_context"] = worker_context
@@ -108,6 +113,7 @@ async def startup(ctx: dict[str, Any]) -> None:
         webhook_event_repo=WebhookEventRepositoryContainer.get(),
         plaid_item_repo=PlaidItemRepositoryContainer.get(),
         transaction_sync_service=TransactionSyncServiceContainer.get(),
+        sync_coordinator=ItemSyncCoordinatorContainer.get(),
         recurring_sync_service=RecurringSyncServiceContainer.get(),
         task_queue_service=TaskQueueServiceContainer.get(),
         spending_manager=spending_manager,
@@ -116,6 +122,7 @@ async def startup(ctx: dict[str, Any]) -> None:
         baseline_calculator=baseline_calculator,
         creep_scorer=creep_scorer,
         cache_invalidator=cache_invalidator,
+        cache_warmer=cache_warmer,
     )
 
     ctx["webhook_context"] = webhook_context
@@ -123,12 +130,14 @@ async def startup(ctx: dict[str, Any]) -> None:
     logger.info("worker.startup.complete")
 
 
-async def shutdown(_ctx: dict[str, Any]) -> None:
+async def shutdown(ctx: dict[str, Any]) -> None:
     logger.info("worker.shutdown.started")
 
     from services.cache.base import CacheServiceContainer
     from services.cache.invalidation import CacheInvalidatorContainer
+    from services.cache.warming import CacheWarmerContainer
 
+    CacheWarmerContainer.reset()
     CacheInvalidatorContainer.reset()
     CacheServiceContainer.reset()
 
@@ -150,16 +159,20 @@ async def shutdown(_ctx: dict[str, Any]) -> None:
     from services.analytics.computation_manager import SpendingComputationManagerContainer
     from services.analytics.creep_scorer import CreepScorerContainer
     from services.analytics.merchant_stats_aggregator import MerchantStatsAggregatorContainer
+    from services.analytics.response_builder import AnalyticsResponseBuilderContainer
     from services.analytics.spending_aggregator import SpendingAggregatorContainer
     from services.analytics.transfer_detector import TransferDetectorContainer
     from services.database import DatabaseServiceContainer
     from services.encryption import EncryptionServiceContainer
+    from services.item_sync_coordinator import ItemSyncCoordinatorContainer
     from services.plaid import PlaidServiceContainer
     from services.recurring import RecurringSyncServiceContainer
+    from services.redis_pool import RedisPoolManagerContainer
     from services.task_queue import TaskQueueServiceContainer
     from services.transaction_sync import TransactionSyncServiceContainer
 
     await TaskQueueServiceContainer.close()
+    ItemSyncCoordinatorContainer.reset()
     TransactionSyncServiceContainer.reset()
     RecurringSyncServiceContainer.reset()
     PlaidServiceContainer.reset()
@@ -168,6 +181,7 @@ async def shutdown(_ctx: dict[str, Any]) -> None:
     PlaidItemRepositoryContainer.reset()
     AccountRepositoryContainer.reset()
 
+    AnalyticsResponseBuilderContainer.reset()
     CreepScorerContainer.reset()
     BaselineCalculatorContainer.reset()
     CashFlowAggregatorContainer.reset()
@@ -186,5 +200,6 @@ async def shutdown(_ctx: dict[str, Any]) -> None:
     SpendingPeriodRepositoryContainer.reset()
     TransactionRepositoryContainer.reset()
     DatabaseServiceContainer.reset()
+    await RedisPoolManagerContainer.close()
 
     logger.info("worker.shutdown.complete")
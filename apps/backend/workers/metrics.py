@@ -0,0 +1,64 @@
+import asyncio
+
+from observability import get_logger
+from services.cache.base import get_cache_service
+from services.plaid import get_plaid_service
+
+logger = get_logger("workers.metrics")
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_READ_TIMEOUT_SECONDS = 5.0
+
+
+def render_worker_metrics() -> str:
+    return get_cache_service().render_metrics() + get_plaid_service().render_metrics()
+
+
+# Plaid calls made by sync jobs are recorded in the worker process, so each
+# worker serves its own /metrics alongside the API's.
+async def start_metrics_server(host: str, port: int) -> asyncio.Server | None:
+    if port <= 0:
+        return None
+
+    try:
+        server = await asyncio.start_server(_handle, host=host, port=port)
+    except OSError as e:
+        logger.warning("worker.metrics.unavailable", host=host, port=port, error=str(e))
+        return None
+
+    logger.info("worker.metrics.listening", host=host, port=port)
+    return server
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS)
+        while await asyncio.wait_for(reader.readline(), _READ_TIMEOUT_SECONDS) not in (
+            b"\r\n",
+            b"\n",
+            b"",
+        ):
+            pass
+
+        method, _, path = request_line.decode("latin-1").partition(" ")
+        if method == "GET" and path.split(" ", 1)[0] == "/metrics":
+            status, body = "200 OK", render_worker_metrics().encode()
+        else:
+            status, body = "404 Not Found", b""
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {_CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await writer.drain()
+    except (TimeoutError, ConnectionError):
+        pass
+    except Exception as e:
+        logger.warning("worker.metrics.request_failed", error=str(e))
+    finally:
+        writer.close()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from arq.connections import ArqRedis
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyticsStage:
+    name: str
+    depends_on: tuple[str, ...]
+    timeout_seconds: int
+    max_tries: int
+
+    @property
+    def function_name(self) -> str:
+        return f"analytics_stage_{self.name}"
+
+
+STAGE_SPENDING = "spending"
+STAGE_MERCHANT_STATS = "merchant_stats"
+STAGE_CASH_FLOW = "cash_flow"
+STAGE_BASELINES = "baselines"
+STAGE_CREEP = "creep"
+
+ANALYTICS_STAGES: tuple[AnalyticsStage, ...] = (
+    AnalyticsStage(STAGE_SPENDING, (), timeout_seconds=120, max_tries=3),
+    AnalyticsStage(STAGE_MERCHANT_STATS, (), timeout_seconds=120, max_tries=3),
+    AnalyticsStage(STAGE_CASH_FLOW, (), timeout_seconds=120, max_tries=3),
+    AnalyticsStage(STAGE_BASELINES, (STAGE_SPENDING,), timeout_seconds=60, max_tries=3),
+    AnalyticsStage(STAGE_CREEP, (STAGE_BASELINES,), timeout_seconds=60, max_tries=2),
+)
+
+ANALYTICS_STAGES_BY_NAME: dict[str, AnalyticsStage] = {
+    stage.name: stage for stage in ANALYTICS_STAGES
+}
+
+
+def root_stages() -> list[AnalyticsStage]:
+    return [stage for stage in ANALYTICS_STAGES if not stage.depends_on]
+
+
+def dependents_of(stage_name: str) -> list[AnalyticsStage]:
+    return [stage for stage in ANALYTICS_STAGES if stage_name in stage.depends_on]
+
+
+# Stores a stage outcome once and returns how many stages are still outstanding.
+# A duplicate record (a re-delivered job) leaves the counter untouched.
+_RECORD_SCRIPT = """
+if redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[2]) == 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[3], -1)
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return tonumber(redis.call('HGET', KEYS[1], ARGV[3]) or '0')
+"""
+
+
+class AnalyticsRunState:
+    _KEY_PREFIX: ClassVar[str] = "finance-interceptor:analytics:run"
+    _PENDING_FIELD: ClassVar[str] = "__pending"
+    _TTL_MS: ClassVar[int] = 3600 * 1000
+
+    def __init__(self, redis: ArqRedis, run_id: str) -> None:
+        self._redis = redis
+        self._key = f"{self._KEY_PREFIX}:{run_id}"
+
+    async def start(self) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key, self._PENDING_FIELD, str(len(ANALYTICS_STAGES)))
+            pipe.pexpire(self._key, self._TTL_MS)
+            await pipe.execute()
+
+    async def record(self, stage_name: str, outcome: dict[str, Any]) -> int:
+        script = self._redis.register_script(_RECORD_SCRIPT)
+        remaining = await script(
+            keys=[self._key],
+            args=[stage_name, json.dumps(outcome), self._PENDING_FIELD, self._TTL_MS],
+        )
+        return int(remaining)
+
+    async def outcomes(self) -> dict[str, dict[str, Any]]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._key)
+            (raw,) = await pipe.execute()
+
+        if not isinstance(raw, dict):
+            return {}
+
+        outcomes: dict[str, dict[str, Any]] = {}
+        for field, value in raw.items():
+            name = field.decode() if isinstance(field, bytes) else str(field)
+            if name == self._PENDING_FIELD:
+                continue
+            outcomes[name] = json.loads(value)
+        return outcomes
+
+    async def clear(self) -> None:
+        await self._redis.delete(self._key)
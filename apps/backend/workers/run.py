@@ -0,0 +1,90 @@
+import asyncio
+import signal
+from typing import Any
+
+from arq.worker import Worker
+
+from config import get_settings
+from observability import get_logger
+from services.task_queue import QueueLane
+from workers.lifecycle import shutdown, startup
+from workers.metrics import start_metrics_server
+from workers.settings import create_lane_worker
+
+logger = get_logger("workers.run")
+
+
+def get_configured_lanes() -> list[QueueLane]:
+    lanes: list[QueueLane] = []
+    for name in get_settings().get_worker_lanes():
+        try:
+            lane = QueueLane(name)
+        except ValueError:
+            logger.warning("worker.lanes.unknown_lane", lane=name)
+            continue
+        if lane not in lanes:
+            lanes.append(lane)
+    return lanes or list(QueueLane)
+
+
+async def run_lanes(lanes: list[QueueLane]) -> None:
+    settings = get_settings()
+    ctx: dict[str, Any] = {}
+    await startup(ctx)
+    metrics_server = await start_metrics_server(
+        settings.worker_metrics_host, settings.worker_metrics_port
+    )
+
+    try:
+        await _run_lane_workers(lanes, ctx)
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+        await shutdown(ctx)
+
+
+async def _run_lane_workers(lanes: list[QueueLane], ctx: dict[str, Any]) -> None:
+    workers: list[Worker] = [create_lane_worker(lane, ctx) for lane in lanes]
+    logger.info("worker.lanes.starting", lanes=[lane.value for lane in lanes])
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    runners = {
+        asyncio.create_task(worker.async_run()): lane
+        for worker, lane in zip(workers, lanes, strict=True)
+    }
+    stopper = asyncio.create_task(stop.wait())
+
+    done, _ = await asyncio.wait([*runners, stopper], return_when=asyncio.FIRST_COMPLETED)
+
+    for runner, lane in runners.items():
+        if runner not in done:
+            continue
+        if not runner.cancelled() and runner.exception() is not None:
+            logger.error("worker.lanes.lane_failed", lane=lane.value, error=str(runner.exception()))
+        else:
+            logger.warning("worker.lanes.lane_exited", lane=lane.value)
+
+    logger.info("worker.lanes.stopping")
+    stopper.cancel()
+    for runner in runners:
+        runner.cancel()
+    await asyncio.gather(*runners, stopper, return_exceptions=True)
+
+    for worker, lane in zip(workers, lanes, strict=True):
+        try:
+            await worker.close()
+        except Exception as e:
+            logger.warning("worker.lanes.close_failed", lane=lane.value, error=str(e))
+
+
+def main() -> None:
+    asyncio.run(run_lanes(get_configured_lanes()))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,23 +3,66 @@ from datetime import timedelta
 from typing import Any, ClassVar
 
 from arq.connections import RedisSettings
+from arq.cron import CronJob, cron
+from arq.worker import Function, Worker, func
 
 from config import get_settings
+from services.redis_pool import get_redis_pool_manager
+from services.task_queue import QueueLane, get_queue_name
 from workers.lifecycle import shutdown, startup
+from workers.pipeline import ANALYTICS_STAGES
 from workers.retry import exponential_backoff
-from workers.tasks import compute_analytics_for_user, process_plaid_webhook
+from workers.tasks import (
+    WEBHOOK_JOB_TIMEOUT,
+    compute_analytics_for_user,
+    finalize_analytics_run,
+    process_plaid_webhook,
+    run_analytics_stage,
+    sweep_webhook_events,
+)
+
+_STAGE_TIMEOUT_MARGIN_SECONDS = 30
 
 
 def get_redis_settings() -> RedisSettings:
-    settings = get_settings()
-    return RedisSettings.from_dsn(settings.redis_url)
+    return get_redis_pool_manager().get_arq_settings()
+
+
+def get_analytics_stage_functions() -> list[Function]:
+    return [
+        func(
+            run_analytics_stage,
+            name=stage.function_name,
+            timeout=stage.timeout_seconds + _STAGE_TIMEOUT_MARGIN_SECONDS,
+            # One delivery past the stage's own limit, so a try killed mid-run
+            # still gets to record a failed outcome.
+            max_tries=stage.max_tries + 1,
+        )
+        for stage in ANALYTICS_STAGES
+    ]
+
+
+def get_cron_jobs() -> list[CronJob]:
+    interval = max(1, get_settings().webhook_sweep_interval_minutes)
+    # Cron job ids are unique per run time, so every lane worker can schedule the
+    # sweep and only one of them runs it.
+    return [
+        cron(
+            sweep_webhook_events,
+            minute=set(range(0, 60, interval)),
+            timeout=timedelta(minutes=2),
+        ),
+    ]
 
 
 class WorkerSettings:
-    functions: ClassVar[list[Callable[..., Any]]] = [
+    functions: ClassVar[list[Callable[..., Any] | Function]] = [
         compute_analytics_for_user,
-        process_plaid_webhook,
+        finalize_analytics_run,
+        func(process_plaid_webhook, timeout=WEBHOOK_JOB_TIMEOUT),
+        *get_analytics_stage_functions(),
     ]
+    cron_jobs: ClassVar[list[CronJob]] = get_cron_jobs()
 
     on_startup = startup
     on_shutdown = shutdown
@@ -34,8 +77,36 @@ class WorkerSettings:
     health_check_interval = timedelta(seconds=30)
     health_check_key = "finance-interceptor:worker:health"
 
-    queue_name = "finance-interceptor:tasks"
+    queue_name = get_queue_name(QueueLane.NORMAL)
 
     @staticmethod
     def retry_delay(attempt: int) -> timedelta:
         return exponential_backoff(attempt)
+
+
+def get_lane_max_jobs(lane: QueueLane) -> int:
+    settings = get_settings()
+    if lane == QueueLane.HIGH:
+        return settings.worker_high_max_jobs
+    if lane == QueueLane.BULK:
+        return settings.worker_bulk_max_jobs
+    return settings.worker_normal_max_jobs
+
+
+def create_lane_worker(lane: QueueLane, ctx: dict[str, Any]) -> Worker:
+    # Services are started and torn down once per process by the lane runner;
+    # each lane only gets its own copy of the shared context.
+    return Worker(
+        WorkerSettings.functions,
+        queue_name=get_queue_name(lane),
+        cron_jobs=get_cron_jobs(),
+        redis_settings=WorkerSettings.redis_settings,
+        ctx=dict(ctx),
+        max_jobs=get_lane_max_jobs(lane),
+        job_timeout=WorkerSettings.job_timeout,
+        max_tries=WorkerSettings.max_tries,
+        retry_jobs=WorkerSettings.retry_jobs,
+        health_check_interval=WorkerSettings.health_check_interval,
+        health_check_key=f"{WorkerSettings.health_check_key}:{lane}",
+        handle_signals=False,
+    )
@@ -1,4 +1,16 @@
-from workers.tasks.analytics import compute_analytics_for_user
-from workers.tasks.webhook import process_plaid_webhook
+from workers.tasks.analytics import (
+    compute_analytics_for_user,
+    finalize_analytics_run,
+    run_analytics_stage,
+)
+from workers.tasks.webhook import WEBHOOK_JOB_TIMEOUT, process_plaid_webhook
+from workers.tasks.webhook_sweep import sweep_webhook_events
 
-__all__ = ["compute_analytics_for_user", "process_plaid_webhook"]
+__all__ = [
+    "WEBHOOK_JOB_TIMEOUT",
+    "compute_analytics_for_user",
+    "finalize_analytics_run",
+    "process_plaid_webhook",
+    "run_analytics_stage",
+    "sweep_webhook_events",
+]
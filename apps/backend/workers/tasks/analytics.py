@@ -1,3 +1,6 @@
+import asyncio
+import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -6,15 +9,30 @@ from arq import Retry
 
 from observability import bind_context, clear_context, get_logger
 from workers.context import WorkerContext
+from workers.pipeline import (
+    ANALYTICS_STAGES_BY_NAME,
+    STAGE_BASELINES,
+    STAGE_CASH_FLOW,
+    STAGE_CREEP,
+    STAGE_MERCHANT_STATS,
+    STAGE_SPENDING,
+    AnalyticsRunState,
+    AnalyticsStage,
+    dependents_of,
+    root_stages,
+)
 
 logger = get_logger("workers.tasks.analytics")
 
+_STAGE_ERROR_MESSAGES: dict[str, str] = {
+    STAGE_SPENDING: "Spending computation failed",
+    STAGE_MERCHANT_STATS: "Merchant stats computation failed",
+    STAGE_CASH_FLOW: "Cash flow computation failed",
+    STAGE_BASELINES: "Baseline computation failed",
+    STAGE_CREEP: "Creep score computation failed",
+}
 
-class AnalyticsTaskError(Exception):
-    def __init__(self, message: str, retryable: bool = True) -> None:
-        self.message = message
-        self.retryable = retryable
-        super().__init__(self.message)
+_INDEPENDENT_STAGES = (STAGE_SPENDING, STAGE_MERCHANT_STATS, STAGE_CASH_FLOW)
 
 
 @dataclass
@@ -44,130 +62,251 @@ async def compute_analytics_for_user(ctx: dict[str, Any], user_id: str) -> dict[
 
     worker_context: WorkerContext = ctx["worker_context"]
 
+    if job_try == 1:
+        rescheduled = await worker_context.task_queue_service.claim_analytics_run(user_uuid)
+        if rescheduled is not None:
+            log.info(
+                "task.analytics.rescheduled",
+                next_job_id=rescheduled.job_id,
+                defer_seconds=rescheduled.defer_seconds,
+            )
+            clear_context()
+            return {
+                "user_id": user_id,
+                "rescheduled": True,
+                "next_job_id": rescheduled.job_id,
+                "defer_seconds": rescheduled.defer_seconds,
+            }
+
+    run_id = uuid.uuid4().hex[:12]
+
     try:
-        result = _execute_analytics(worker_context, user_uuid, log)
-        worker_context.cache_invalidator.on_analytics_computation(user_uuid)
-        clear_context()
-        return _to_dict(result)
-    except AnalyticsTaskError as e:
-        log.error(
-            "task.analytics.failed",
-            error=e.message,
-            retryable=e.retryable,
-        )
-        clear_context()
-        if e.retryable:
-            raise Retry(defer=ctx.get("job_try", 1) * 10) from e
-        raise
+        await AnalyticsRunState(ctx["redis"], run_id).start()
+        stages = root_stages()
+        for stage in stages:
+            await worker_context.task_queue_service.enqueue_analytics_stage(
+                stage.function_name, run_id, user_uuid, stage.name
+            )
     except Exception as e:
         log.exception("task.analytics.unexpected_error")
         clear_context()
         raise Retry(defer=ctx.get("job_try", 1) * 10) from e
 
+    log.info("task.analytics.run_started", run_id=run_id, stages=[s.name for s in stages])
+    clear_context()
+    return {"user_id": user_id, "run_id": run_id, "stages_enqueued": [s.name for s in stages]}
+
+
+async def run_analytics_stage(
+    ctx: dict[str, Any],
+    run_id: str,
+    user_id: str,
+    stage_name: str,
+) -> dict[str, Any]:
+    stage = ANALYTICS_STAGES_BY_NAME[stage_name]
+    user_uuid = UUID(user_id)
+    job_try = ctx.get("job_try", 1)
+
+    bind_context(user_id=user_id, task=stage.function_name, run_id=run_id, job_try=job_try)
+
+    log = logger.bind(user_id=user_id, run_id=run_id, stage=stage_name, job_try=job_try)
+    log.info("task.analytics.stage_started")
+
+    worker_context: WorkerContext = ctx["worker_context"]
+    runner = _STAGE_RUNNERS[stage_name]
+    failed = {"status": "failed", "error": _STAGE_ERROR_MESSAGES[stage_name]}
+
+    if job_try > stage.max_tries:
+        # The last try was interrupted before it recorded anything; record the
+        # failure so the run still reaches finalize.
+        log.warning("task.analytics.stage_abandoned", max_tries=stage.max_tries)
+        outcome = failed
+    else:
+        stage_run = asyncio.ensure_future(asyncio.to_thread(runner, worker_context, user_uuid, log))
+        done, _ = await asyncio.wait({stage_run}, timeout=stage.timeout_seconds)
+
+        if not done:
+            # The thread cannot be stopped, so a retry would run the stage twice.
+            stage_run.cancel()
+            log.warning("task.analytics.stage_timed_out", timeout_seconds=stage.timeout_seconds)
+            outcome = failed
+        else:
+            try:
+                outcome = stage_run.result()
+            except Exception as e:
+                if job_try < stage.max_tries:
+                    log.warning("task.analytics.stage_retrying", error=str(e) or type(e).__name__)
+                    clear_context()
+                    raise Retry(defer=job_try * 10) from e
+                log.warning("task.analytics.stage_failed", error=str(e) or type(e).__name__)
+                outcome = failed
+
+    await _complete_stage(
+        ctx, worker_context, run_id, user_uuid, stage=stage, outcome=outcome, log=log
+    )
+    clear_context()
+    return outcome
+
+
+async def finalize_analytics_run(ctx: dict[str, Any], run_id: str, user_id: str) -> dict[str, Any]:
+    user_uuid = UUID(user_id)
+
+    bind_context(user_id=user_id, task="finalize_analytics", run_id=run_id)
+
+    log = logger.bind(user_id=user_id, run_id=run_id)
+    worker_context: WorkerContext = ctx["worker_context"]
+    state = AnalyticsRunState(ctx["redis"], run_id)
 
-def _execute_analytics(
+    outcomes = await state.outcomes()
+    result = _aggregate(user_id, outcomes, log)
+
+    worker_context.cache_invalidator.on_analytics_computation(user_uuid)
+    worker_context.cache_warmer.on_analytics_computation(user_uuid)
+    await state.clear()
+
+    clear_context()
+    return _to_dict(result)
+
+
+async def _complete_stage(
+    ctx: dict[str, Any],
     worker_context: WorkerContext,
+    run_id: str,
     user_id: UUID,
+    *,
+    stage: AnalyticsStage,
+    outcome: dict[str, Any],
     log: Any,
-) -> TaskResult:
-    errors: list[str] = []
-    spending_periods = 0
-    spending_transactions = 0
-    merchant_count = 0
-    merchant_transactions = 0
-    cash_flow_periods = 0
-    income_sources = 0
-    baselines_computed = 0
-    creep_scores_computed = 0
-    target_auto_established = False
-
-    spending_error: Exception | None = None
-    merchant_error: Exception | None = None
-    cash_flow_error: Exception | None = None
+) -> None:
+    state = AnalyticsRunState(ctx["redis"], run_id)
+    remaining = await state.record(stage.name, outcome)
+    task_queue = worker_context.task_queue_service
 
-    try:
-        spending_result = worker_context.spending_manager.compute_for_user(
-            user_id, force_full_recompute=True
-        )
-        spending_periods = spending_result.periods_computed
-        spending_transactions = spending_result.transactions_processed
-        log.info(
-            "task.analytics.spending_completed",
-            periods_computed=spending_periods,
-            transactions_processed=spending_transactions,
-            categories_computed=spending_result.categories_computed,
-            merchants_computed=spending_result.merchants_computed,
-        )
-    except Exception as e:
-        spending_error = e
-        errors.append("Spending computation failed")
-        log.warning("task.analytics.spending_failed", error=str(e))
+    dependents = dependents_of(stage.name)
+    if dependents:
+        completed = set(await state.outcomes())
+        for dependent in dependents:
+            if all(dep in completed for dep in dependent.depends_on):
+                await task_queue.enqueue_analytics_stage(
+                    dependent.function_name, run_id, user_id, dependent.name
+                )
 
-    try:
-        merchant_result = worker_context.merchant_aggregator.compute_for_user(user_id)
-        merchant_count = merchant_result.merchants_computed
-        merchant_transactions = merchant_result.transactions_processed
-        log.info(
-            "task.analytics.merchant_stats_completed",
-            merchants_computed=merchant_count,
-            transactions_processed=merchant_transactions,
-        )
-    except Exception as e:
-        merchant_error = e
-        errors.append("Merchant stats computation failed")
-        log.warning("task.analytics.merchant_stats_failed", error=str(e))
+    log.info("task.analytics.stage_completed", status=outcome["status"], remaining=remaining)
 
-    try:
-        cash_flow_result = worker_context.cash_flow_aggregator.compute_for_user(
-            user_id, force_full_recompute=True
-        )
-        cash_flow_periods = cash_flow_result.periods_computed
-        income_sources = cash_flow_result.income_sources_detected
+    if remaining == 0:
+        await task_queue.enqueue_analytics_finalize(run_id, user_id)
+
+
+def _run_spending(worker_context: WorkerContext, user_id: UUID, log: Any) -> dict[str, Any]:
+    spending_result = worker_context.spending_manager.compute_for_user(
+        user_id, force_full_recompute=True
+    )
+    log.info(
+        "task.analytics.spending_completed",
+        periods_computed=spending_result.periods_computed,
+        transactions_processed=spending_result.transactions_processed,
+        categories_computed=spending_result.categories_computed,
+        merchants_computed=spending_result.merchants_computed,
+    )
+    return {
+        "status": "completed",
+        "periods_computed": spending_result.periods_computed,
+        "transactions_processed": spending_result.transactions_processed,
+    }
+
+
+def _run_merchant_stats(worker_context: WorkerContext, user_id: UUID, log: Any) -> dict[str, Any]:
+    merchant_result = worker_context.merchant_aggregator.compute_for_user(user_id)
+    log.info(
+        "task.analytics.merchant_stats_completed",
+        merchants_computed=merchant_result.merchants_computed,
+        transactions_processed=merchant_result.transactions_processed,
+    )
+    return {
+        "status": "completed",
+        "merchants_computed": merchant_result.merchants_computed,
+        "transactions_processed": merchant_result.transactions_processed,
+    }
+
+
+def _run_cash_flow(worker_context: WorkerContext, user_id: UUID, log: Any) -> dict[str, Any]:
+    cash_flow_result = worker_context.cash_flow_aggregator.compute_for_user(
+        user_id, force_full_recompute=True
+    )
+    log.info(
+        "task.analytics.cash_flow_completed",
+        periods_computed=cash_flow_result.periods_computed,
+        income_sources_detected=cash_flow_result.income_sources_detected,
+    )
+    return {
+        "status": "completed",
+        "periods_computed": cash_flow_result.periods_computed,
+        "income_sources_detected": cash_flow_result.income_sources_detected,
+    }
+
+
+def _run_baselines(worker_context: WorkerContext, user_id: UUID, log: Any) -> dict[str, Any]:
+    baseline_result = worker_context.baseline_calculator.compute_baselines_for_user(
+        user_id, force_recompute=False
+    )
+    baselines_computed = baseline_result.baselines_computed
+    if baselines_computed > 0:
         log.info(
-            "task.analytics.cash_flow_completed",
-            periods_computed=cash_flow_periods,
-            income_sources_detected=income_sources,
+            "task.analytics.target_auto_established",
+            baselines_computed=baselines_computed,
+            period_start=str(baseline_result.baseline_period_start),
+            period_end=str(baseline_result.baseline_period_end),
         )
-    except Exception as e:
-        cash_flow_error = e
-        errors.append("Cash flow computation failed")
-        log.warning("task.analytics.cash_flow_failed", error=str(e))
+    return {
+        "status": "completed",
+        "baselines_computed": baselines_computed,
+        "target_auto_established": baselines_computed > 0,
+    }
 
-    try:
-        baseline_result = worker_context.baseline_calculator.compute_baselines_for_user(
-            user_id, force_recompute=False
-        )
-        baselines_computed = baseline_result.baselines_computed
-        if baselines_computed > 0:
-            target_auto_established = True
-            log.info(
-                "task.analytics.target_auto_established",
-                baselines_computed=baselines_computed,
-                period_start=str(baseline_result.baseline_period_start),
-                period_end=str(baseline_result.baseline_period_end),
-            )
-    except Exception as e:
-        errors.append("Baseline computation failed")
-        log.warning("task.analytics.baseline_failed", error=str(e))
 
+def _run_creep(worker_context: WorkerContext, user_id: UUID, log: Any) -> dict[str, Any]:
     baseline_status = worker_context.baseline_calculator.get_baseline_status(user_id)
-    if baseline_status.has_baselines:
-        try:
-            creep_result = worker_context.creep_scorer.compute_current_period(user_id)
-            creep_scores_computed = creep_result.creep_scores_computed
-            log.info(
-                "task.analytics.creep_completed",
-                scores_computed=creep_scores_computed,
-            )
-        except Exception as e:
-            errors.append("Creep score computation failed")
-            log.warning("task.analytics.creep_failed", error=str(e))
-
-    if spending_error and merchant_error and cash_flow_error:
-        raise AnalyticsTaskError(
-            "All computations failed",
-            retryable=True,
-        )
+    if not baseline_status.has_baselines:
+        return {"status": "skipped", "creep_scores_computed": 0}
+
+    creep_result = worker_context.creep_scorer.compute_current_period(user_id)
+    log.info(
+        "task.analytics.creep_completed",
+        scores_computed=creep_result.creep_scores_computed,
+    )
+    return {"status": "completed", "creep_scores_computed": creep_result.creep_scores_computed}
+
+
+StageRunner = Callable[[WorkerContext, UUID, Any], dict[str, Any]]
+
+_STAGE_RUNNERS: dict[str, StageRunner] = {
+    STAGE_SPENDING: _run_spending,
+    STAGE_MERCHANT_STATS: _run_merchant_stats,
+    STAGE_CASH_FLOW: _run_cash_flow,
+    STAGE_BASELINES: _run_baselines,
+    STAGE_CREEP: _run_creep,
+}
+
+
+def get_stage_runner(stage_name: str) -> StageRunner:
+    return _STAGE_RUNNERS[stage_name]
+
+
+def _aggregate(user_id: str, outcomes: dict[str, dict[str, Any]], log: Any) -> TaskResult:
+    spending = outcomes.get(STAGE_SPENDING, {})
+    merchant = outcomes.get(STAGE_MERCHANT_STATS, {})
+    cash_flow = outcomes.get(STAGE_CASH_FLOW, {})
+    baselines = outcomes.get(STAGE_BASELINES, {})
+    creep = outcomes.get(STAGE_CREEP, {})
+
+    errors = [
+        outcomes[name].get("error") or _STAGE_ERROR_MESSAGES[name]
+        for name in _STAGE_ERROR_MESSAGES
+        if outcomes.get(name, {}).get("status") == "failed"
+    ]
+
+    if all(outcomes.get(name, {}).get("status") == "failed" for name in _INDEPENDENT_STAGES):
+        log.error("task.analytics.failed", error="All computations failed", retryable=False)
 
     partial_failure = bool(errors)
 
@@ -180,16 +319,16 @@ def _execute_analytics(
         log.info("task.analytics.completed")
 
     return TaskResult(
-        user_id=str(user_id),
-        spending_periods=spending_periods,
-        spending_transactions=spending_transactions,
-        merchant_count=merchant_count,
-        merchant_transactions=merchant_transactions,
-        cash_flow_periods=cash_flow_periods,
-        income_sources=income_sources,
-        baselines_computed=baselines_computed,
-        creep_scores_computed=creep_scores_computed,
-        target_auto_established=target_auto_established,
+        user_id=user_id,
+        spending_periods=spending.get("periods_computed", 0),
+        spending_transactions=spending.get("transactions_processed", 0),
+        merchant_count=merchant.get("merchants_computed", 0),
+        merchant_transactions=merchant.get("transactions_processed", 0),
+        cash_flow_periods=cash_flow.get("periods_computed", 0),
+        income_sources=cash_flow.get("income_sources_detected", 0),
+        baselines_computed=baselines.get("baselines_computed", 0),
+        creep_scores_computed=creep.get("creep_scores_computed", 0),
+        target_auto_established=baselines.get("target_auto_established", False),
         partial_failure=partial_failure,
         errors=errors,
     )
@@ -1,4 +1,6 @@
+import asyncio
 from dataclasses import dataclass, field
+from datetime import timedelta
 from typing import Any
 from uuid import UUID
 
@@ -8,14 +10,18 @@ from models.webhook import (
     ItemWebhookCode,
     PlaidWebhookRequest,
     TransactionsWebhookCode,
+    WebhookEventCreate,
     WebhookEventStatus,
     WebhookType,
 )
 from observability import bind_context, clear_context, get_logger
+from services.transaction_sync import TransactionSyncError
 from workers.context import WebhookWorkerContext
 
 logger = get_logger("workers.tasks.webhook")
 
+WEBHOOK_JOB_TIMEOUT = timedelta(minutes=5)
+
 
 class WebhookTaskError(Exception):
     def __init__(self, message: str, retryable: bool = True) -> None:
@@ -34,7 +40,11 @@ class WebhookTaskResult:
     transactions_added: int = 0
     transactions_modified: int = 0
     transactions_removed: int = 0
+    transactions_unchanged: int = 0
+    transactions_changed: int = 0
     recurring_synced: bool = False
+    sync_coalesced: bool = False
+    sync_runs: int = 0
     analytics_enqueued: bool = False
     analytics_ran_sync: bool = False
     partial_failure: bool = False
@@ -48,6 +58,7 @@ async def process_plaid_webhook(
     webhook_code: str,
     item_id: str,
     payload: dict[str, Any],
+    idempotency_key: str | None = None,
 ) -> dict[str, Any]:
     event_uuid = UUID(event_id)
     job_try = ctx.get("job_try", 1)
@@ -72,6 +83,30 @@ async def process_plaid_webhook(
 
     worker_context: WebhookWorkerContext = ctx["webhook_context"]
 
+    # Events claimed through Redis at ingress have no row yet; the job writes it.
+    if idempotency_key is not None:
+        try:
+            persisted = persist_webhook_event(
+                worker_context,
+                event_uuid,
+                idempotency_key,
+                webhook_type=webhook_type,
+                webhook_code=webhook_code,
+                item_id=item_id,
+                payload=payload,
+            )
+        except Exception as e:
+            log.exception("task.webhook.persist_failed")
+            clear_context()
+            raise Retry(defer=job_try * 10) from e
+
+        await worker_context.task_queue_service.mark_webhook_persisted(event_uuid)
+
+        if not persisted:
+            log.info("task.webhook.duplicate", idempotency_key=idempotency_key)
+            clear_context()
+            return {"event_id": event_id, "status": "duplicate"}
+
     worker_context.webhook_event_repo.update_status(event_uuid, WebhookEventStatus.PROCESSING)
 
     try:
@@ -116,6 +151,35 @@ async def process_plaid_webhook(
         raise Retry(defer=ctx.get("job_try", 1) * 10) from e
 
 
+def persist_webhook_event(
+    worker_context: WebhookWorkerContext,
+    event_id: UUID,
+    idempotency_key: str,
+    *,
+    webhook_type: str,
+    webhook_code: str,
+    item_id: str,
+    payload: dict[str, Any],
+) -> bool:
+    plaid_item = worker_context.plaid_item_repo.get_by_item_id(item_id)
+
+    event_data = WebhookEventCreate(
+        webhook_type=webhook_type,
+        webhook_code=webhook_code,
+        item_id=item_id,
+        plaid_item_id=UUID(plaid_item["id"]) if plaid_item else None,
+        payload=payload,
+        idempotency_key=idempotency_key,
+    )
+
+    if worker_context.webhook_event_repo.insert_if_absent(event_id, event_data):
+        return True
+
+    # The key already has a row: this event's own on a retried job, otherwise an
+    # earlier delivery whose Redis claim has since expired.
+    return worker_context.webhook_event_repo.get_by_id(event_id) is not None
+
+
 async def _execute_webhook_processing(
     worker_context: WebhookWorkerContext,
     webhook: PlaidWebhookRequest,
@@ -206,30 +270,63 @@ async def _trigger_transaction_sync(
         result.errors.append(f"Plaid item not found: {item_id} (may be race condition)")
         return
 
+    coordinator = worker_context.sync_coordinator
+    lease = await coordinator.acquire(item_id)
+    if lease is None:
+        result.sync_coalesced = True
+        log.info("task.webhook.transaction_sync.coalesced")
+        return
+
     try:
-        sync_result = worker_context.transaction_sync_service.sync_item(item_id)
-        result.transactions_added = sync_result.added
-        result.transactions_modified = sync_result.modified
-        result.transactions_removed = sync_result.removed
+        while True:
+            await coordinator.begin_run(lease)
+            async with coordinator.hold(lease):
+                sync_result = await asyncio.to_thread(
+                    worker_context.transaction_sync_service.sync_item, item_id
+                )
+            result.sync_runs += 1
+            result.transactions_added += sync_result.added
+            result.transactions_modified += sync_result.modified
+            result.transactions_removed += sync_result.removed
+            result.transactions_unchanged += sync_result.unchanged
+            result.transactions_changed += sync_result.changed
+            if await coordinator.release(lease):
+                break
+            log.info("task.webhook.transaction_sync.rerun_requested", runs=result.sync_runs)
         log.info(
             "task.webhook.transaction_sync.completed",
-            transactions_added=sync_result.added,
-            transactions_modified=sync_result.modified,
-            transactions_removed=sync_result.removed,
+            transactions_added=result.transactions_added,
+            transactions_modified=result.transactions_modified,
+            transactions_removed=result.transactions_removed,
+            transactions_unchanged=result.transactions_unchanged,
+            runs=result.sync_runs,
         )
     except Exception as e:
+        await coordinator.abandon(lease)
         log.exception("task.webhook.transaction_sync.failed")
         result.partial_failure = True
         result.errors.append(f"Transaction sync failed: {e}")
+        # The retry resumes after the checkpoints this try wrote and will not
+        # count them, so their downstream work happens now.
+        if isinstance(e, TransactionSyncError) and e.changed:
+            result.transactions_changed += e.changed
+            user_id = UUID(plaid_item["user_id"])
+            worker_context.cache_invalidator.on_transaction_sync(user_id)
+            await _trigger_analytics_computation(worker_context, user_id, result, log)
         raise WebhookTaskError("Transaction sync failed", retryable=True) from e
 
     plaid_item_id = UUID(plaid_item["id"])
     user_id = UUID(plaid_item["user_id"])
 
-    worker_context.cache_invalidator.on_transaction_sync(user_id)
+    if result.transactions_changed:
+        worker_context.cache_invalidator.on_transaction_sync(user_id)
 
     _trigger_recurring_sync_silent(worker_context, plaid_item_id, result, log)
 
+    if not result.transactions_changed:
+        log.info("task.webhook.analytics.skipped", reason="no_transaction_changes")
+        return
+
     await _trigger_analytics_computation(worker_context, user_id, result, log)
 
 
@@ -299,6 +396,7 @@ async def _trigger_analytics_computation(
 
     _run_analytics_sync(worker_context, user_id, result, analytics_log)
     worker_context.cache_invalidator.on_analytics_computation(user_id)
+    worker_context.cache_warmer.on_analytics_computation(user_id)
 
 
 def _run_analytics_sync(
@@ -435,7 +533,10 @@ def _to_dict(result: WebhookTaskResult) -> dict[str, Any]:
             "transactions_added": result.transactions_added,
             "transactions_modified": result.transactions_modified,
             "transactions_removed": result.transactions_removed,
+            "transactions_unchanged": result.transactions_unchanged,
             "recurring_synced": result.recurring_synced,
+            "coalesced": result.sync_coalesced,
+            "runs": result.sync_runs,
         },
         "analytics": {
             "enqueued": result.analytics_enqueued,
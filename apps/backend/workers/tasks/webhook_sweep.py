@@ -0,0 +1,165 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from config import get_settings
+from models.webhook import WebhookEventStatus
+from observability import bind_context, clear_context, get_logger
+from workers.context import WebhookWorkerContext
+from workers.retry import exponential_backoff
+from workers.tasks.webhook import WEBHOOK_JOB_TIMEOUT, persist_webhook_event
+
+logger = get_logger("workers.tasks.webhook_sweep")
+
+
+@dataclass
+class SweepResult:
+    scanned: int = 0
+    requeued: int = 0
+    already_queued: int = 0
+    recovered: int = 0
+    failed: int = 0
+
+
+async def sweep_webhook_events(ctx: dict[str, Any]) -> dict[str, Any]:
+    settings = get_settings()
+    bind_context(task="sweep_webhook_events")
+
+    worker_context: WebhookWorkerContext = ctx["webhook_context"]
+    now = datetime.now(UTC)
+    received_before = now - timedelta(seconds=settings.webhook_sweep_min_age_seconds)
+    # A processing event whose job has outlived the job timeout was dropped by a
+    # worker that died mid-run.
+    processing_before = now - WEBHOOK_JOB_TIMEOUT
+    batch_size = settings.webhook_sweep_batch_size
+    result = SweepResult()
+    after: tuple[str, str] | None = None
+
+    await _recover_unpersisted(worker_context, result, received_before)
+
+    for _ in range(settings.webhook_sweep_max_batches):
+        events = await asyncio.to_thread(
+            worker_context.webhook_event_repo.get_pending_events,
+            batch_size,
+            after=after,
+            include_failed=True,
+            include_processing=True,
+            max_retry_count=settings.webhook_sweep_max_retries,
+            received_before=received_before,
+        )
+
+        for event in events:
+            if (
+                event["status"] == WebhookEventStatus.PROCESSING.value
+                and datetime.fromisoformat(event["received_at"]) >= processing_before
+            ):
+                continue
+            await _requeue_event(worker_context, event, result)
+
+        if len(events) < batch_size:
+            break
+        after = (events[-1]["received_at"], events[-1]["id"])
+
+    if result.requeued or result.recovered or result.failed:
+        logger.info(
+            "task.webhook_sweep.completed",
+            scanned=result.scanned,
+            requeued=result.requeued,
+            already_queued=result.already_queued,
+            recovered=result.recovered,
+            failed=result.failed,
+        )
+
+    clear_context()
+    return {
+        "scanned": result.scanned,
+        "requeued": result.requeued,
+        "already_queued": result.already_queued,
+        "recovered": result.recovered,
+        "failed": result.failed,
+    }
+
+
+# Events claimed at ingress exist only in Redis until their job writes the row.
+# Once the job is gone without doing so, the row is written here as pending and
+# picked up by a later sweep like any other stuck event.
+async def _recover_unpersisted(
+    worker_context: WebhookWorkerContext,
+    result: SweepResult,
+    claimed_before: datetime,
+) -> None:
+    task_queue = worker_context.task_queue_service
+
+    try:
+        records = await task_queue.get_unpersisted_webhooks()
+    except Exception as e:
+        logger.warning("task.webhook_sweep.unpersisted_read_failed", error=str(e))
+        return
+
+    for event_id, record in records.items():
+        if record["claimed_at"] >= claimed_before.timestamp():
+            continue
+
+        log = logger.bind(event_id=str(event_id))
+        try:
+            if await task_queue.has_active_webhook_job(event_id, 0):
+                continue
+            await asyncio.to_thread(
+                persist_webhook_event,
+                worker_context,
+                event_id,
+                record["idempotency_key"],
+                webhook_type=record["webhook_type"],
+                webhook_code=record["webhook_code"],
+                item_id=record["item_id"],
+                payload=record["payload"],
+            )
+        except Exception as e:
+            log.warning("task.webhook_sweep.recover_failed", error=str(e) or type(e).__name__)
+            result.failed += 1
+            continue
+
+        await task_queue.mark_webhook_persisted(event_id)
+        log.info("task.webhook_sweep.recovered")
+        result.recovered += 1
+
+
+async def _requeue_event(
+    worker_context: WebhookWorkerContext,
+    event: dict[str, Any],
+    result: SweepResult,
+) -> None:
+    task_queue = worker_context.task_queue_service
+    event_id = UUID(event["id"])
+    retry_count = int(event.get("retry_count") or 0)
+    log = logger.bind(event_id=str(event_id), status=event["status"], retry_count=retry_count)
+
+    result.scanned += 1
+
+    try:
+        if await task_queue.has_active_webhook_job(event_id, retry_count):
+            result.already_queued += 1
+            return
+
+        defer = exponential_backoff(retry_count) if retry_count > 0 else timedelta()
+        enqueued = await task_queue.enqueue_webhook_processing(
+            event_id,
+            event["webhook_type"],
+            event["webhook_code"],
+            event["item_id"],
+            event.get("payload") or {},
+            attempt=retry_count,
+            defer_seconds=int(defer.total_seconds()),
+        )
+    except Exception as e:
+        log.warning("task.webhook_sweep.requeue_failed", error=str(e) or type(e).__name__)
+        result.failed += 1
+        return
+
+    if enqueued.enqueued:
+        log.info("task.webhook_sweep.requeued", job_id=enqueued.job_id)
+        result.requeued += 1
+    else:
+        result.already_queued += 1
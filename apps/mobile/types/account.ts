@@ -34,5 +34,6 @@ export interface SyncResponse {
   transactions_added: number;
   transactions_modified: number;
   transactions_removed: number;
+  transactions_unchanged: number;
   message: string;
 }
@@ -79,6 +79,7 @@ export interface RecurringSyncResult {
   streams_updated: number;
   streams_deactivated: number;
   alerts_created: number;
+  streams_unchanged: number;
 }
 
 export interface Alert {
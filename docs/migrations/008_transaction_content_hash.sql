@@ -0,0 +1,7 @@
+-- Migration: 008_transaction_content_hash
+-- Description: Store a content hash per transaction so sync can skip Plaid
+--              modifications that leave every stored field unchanged
+-- Date: 2026-10-19
+
+ALTER TABLE public.transactions
+  ADD COLUMN IF NOT EXISTS content_hash TEXT;
@@ -0,0 +1,7 @@
+-- Migration: 009_recurring_stream_content_hash
+-- Description: Store a content hash per recurring stream so sync can skip
+--              streams Plaid returned unchanged
+-- Date: 2026-10-19
+
+ALTER TABLE public.recurring_streams
+  ADD COLUMN IF NOT EXISTS content_hash TEXT;
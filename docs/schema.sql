@@ -223,6 +223,7 @@ CREATE TABLE public.transactions (
     website TEXT,
     check_number TEXT,
     is_internal_transfer BOOLEAN DEFAULT FALSE,
+    content_hash TEXT,
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
@@ -267,6 +268,7 @@ CREATE TABLE public.recurring_streams (
     
     transaction_ids TEXT[],
     plaid_raw JSONB,
+    content_hash TEXT,
     
     last_synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),